@@ -2,38 +2,115 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 from typing import TYPE_CHECKING
 
 from flameconnect import FlameConnectClient, TokenAuth
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
 
-from .api import create_token_provider
-from .const import PLATFORMS
+from .api import RateLimiter, SharedSession, async_pop_handoff, create_token_provider
+from .const import (
+    CONF_DEDICATED_SESSION,
+    DOMAIN,
+    OFFLINE_QUEUE_MAX_AGE,
+    PLATFORMS,
+    READ_RATE_BURST,
+    READ_RATE_LIMIT,
+    REDISCOVERY_INTERVAL,
+    WRITE_RATE_BURST,
+    WRITE_RATE_LIMIT,
+)
 from .coordinator import FlameConnectDataUpdateCoordinator
-from .data import FlameConnectData
+from .coordinator.startup_cache import StartupCache
+from .coordinator.write_queue import OfflineWriteQueue
+from .data import FlameConnectData, FlameConnectDomainData
+from .service_actions import SnapshotStore, async_setup_services
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import FlameConnectConfigEntry
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up integration-wide state and register service actions."""
+    snapshots = SnapshotStore(hass)
+    await snapshots.async_load()
+    rate_limiter = RateLimiter(
+        read_rate=READ_RATE_LIMIT,
+        read_burst=READ_RATE_BURST,
+        write_rate=WRITE_RATE_LIMIT,
+        write_burst=WRITE_RATE_BURST,
+    )
+    hass.data[DOMAIN] = FlameConnectDomainData(
+        snapshots=snapshots,
+        rate_limiter=rate_limiter,
+        shared_session=SharedSession(hass),
+    )
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: FlameConnectConfigEntry,
 ) -> bool:
     """Set up FlameConnect from a config entry."""
-    get_token = create_token_provider(hass, entry)
+    handoff = async_pop_handoff(hass, entry.unique_id)
+    if handoff is not None:
+        get_token = create_token_provider(
+            hass, entry, access_token=handoff.access_token, token_expires_at=handoff.token_expires_at
+        )
+    else:
+        get_token = create_token_provider(hass, entry)
+    if entry.options.get(CONF_DEDICATED_SESSION):
+        shared_session = hass.data[DOMAIN].shared_session
+        session = shared_session.async_acquire(entry.entry_id)
+        entry.async_on_unload(partial(shared_session.async_release, entry.entry_id))
+    else:
+        session = async_get_clientsession(hass)
     client = FlameConnectClient(
         auth=TokenAuth(get_token),
-        session=async_get_clientsession(hass),
+        session=session,
     )
-    coordinator = FlameConnectDataUpdateCoordinator(hass, client, entry)
-    await coordinator.async_config_entry_first_refresh()
-
+    coordinator = FlameConnectDataUpdateCoordinator(hass, client, entry, rate_limiter=hass.data[DOMAIN].rate_limiter)
     entry.runtime_data = FlameConnectData(client=client, coordinator=coordinator)
+    entry.async_on_unload(async_track_time_interval(hass, coordinator.async_rediscover, REDISCOVERY_INTERVAL))
+
+    # Entries are not unloaded when Home Assistant stops, so pending
+    # debounced writes are flushed on the stop event as well.
+    async def _async_drain_on_stop(_event: Event) -> None:
+        await coordinator.async_drain_pending_writes()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_drain_on_stop))
+
+    if await coordinator.async_restore_snapshot():
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        entry.async_create_background_task(hass, coordinator.async_revalidate(), "flameconnect revalidate")
+        return True
+
+    # Entities only need the discovered fires and their features, so
+    # register them while the overviews are still being fetched.  Right
+    # after the config flow, the fires it listed are used as they are.
+    if handoff is None or not coordinator.async_use_handoff(handoff):
+        await coordinator.async_discover()
+    forwarded, refreshed = await asyncio.gather(
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        coordinator.async_config_entry_first_refresh(),
+        return_exceptions=True,
+    )
+    if isinstance(forwarded, BaseException):
+        raise forwarded
+    if isinstance(refreshed, BaseException):
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        raise refreshed
     return True
 
 
@@ -42,4 +119,17 @@ async def async_unload_entry(
     entry: FlameConnectConfigEntry,
 ) -> bool:
     """Unload a FlameConnect config entry."""
+    # runtime_data is only set once setup got as far as creating the coordinator.
+    runtime_data: FlameConnectData | None = getattr(entry, "runtime_data", None)
+    if runtime_data is not None:
+        await runtime_data.coordinator.async_drain_pending_writes()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: FlameConnectConfigEntry,
+) -> None:
+    """Delete the removed entry's startup snapshot and queued changes."""
+    await StartupCache(hass, entry.entry_id).async_remove()
+    await OfflineWriteQueue(hass, entry.entry_id, OFFLINE_QUEUE_MAX_AGE).async_remove()
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+from .handoff import SetupHandoff, async_pop_handoff, async_store_handoff
+from .rate_limit import RateLimiter
+from .session import SharedSession, create_session
 from .token import CONF_TOKEN_CACHE, create_token_provider
 
 __all__ = [
     "CONF_TOKEN_CACHE",
+    "RateLimiter",
+    "SetupHandoff",
+    "SharedSession",
+    "async_pop_handoff",
+    "async_store_handoff",
+    "create_session",
     "create_token_provider",
 ]
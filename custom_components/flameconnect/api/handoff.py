@@ -0,0 +1,71 @@
+"""Short-lived handoff of config-flow data to the first setup.
+
+The config flow has just signed in, listed the account's fires and read
+their overviews.  Instead of ``async_setup_entry`` repeating that moments
+later, the flow leaves what it fetched here, keyed by the entry's unique
+ID, and the first setup takes it.  Handoffs older than ``HANDOFF_TTL``
+seconds are ignored and dropped.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from custom_components.flameconnect.const import DOMAIN, HANDOFF_TTL
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+
+if TYPE_CHECKING:
+    from flameconnect import Fire, FireOverview
+    from homeassistant.core import HomeAssistant
+
+DATA_HANDOFFS: HassKey[dict[str, SetupHandoff]] = HassKey(f"{DOMAIN}_handoffs")
+
+
+@dataclass
+class SetupHandoff:
+    """Data fetched by the config flow for the entry it creates.
+
+    Attributes:
+        fires: The account's fires.
+        fetched_at: Monotonic time the reads were started.
+        overviews: Overviews read during validation, by fire ID.
+        no_wifi: IDs of fires found to have no WiFi overview.
+        access_token: An access token still valid for setup, if any.
+        token_expires_at: Monotonic time *access_token* expires.
+
+    """
+
+    fires: list[Fire]
+    fetched_at: float
+    overviews: dict[str, FireOverview] = field(default_factory=dict)
+    no_wifi: set[str] = field(default_factory=set)
+    access_token: str | None = None
+    token_expires_at: float = 0.0
+
+
+@callback
+def async_store_handoff(hass: HomeAssistant, unique_id: str, handoff: SetupHandoff) -> None:
+    """Leave *handoff* for the setup of the entry with *unique_id*."""
+    handoffs = hass.data.setdefault(DATA_HANDOFFS, {})
+    for stale in [key for key, other in handoffs.items() if _expired(other)]:
+        del handoffs[stale]
+    handoffs[unique_id] = handoff
+
+
+@callback
+def async_pop_handoff(hass: HomeAssistant, unique_id: str | None) -> SetupHandoff | None:
+    """Take the handoff left for the entry with *unique_id*, if any."""
+    if unique_id is None:
+        return None
+    handoff = hass.data.get(DATA_HANDOFFS, {}).pop(unique_id, None)
+    if handoff is None or _expired(handoff):
+        return None
+    return handoff
+
+
+def _expired(handoff: SetupHandoff) -> bool:
+    """Return True if *handoff* is too old to be used."""
+    return monotonic() - handoff.fetched_at > HANDOFF_TTL
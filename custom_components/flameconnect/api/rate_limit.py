@@ -0,0 +1,117 @@
+"""Process-wide rate limiting of FlameConnect cloud requests.
+
+Every config entry's coordinator and the config flow draw from one
+``RateLimiter`` kept in ``hass.data[DOMAIN]``, so several accounts on the
+same host cannot burst against the cloud together.  Reads and writes
+have separate token buckets; within a bucket, priority callers (writes
+a user is waiting on) are served before background ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from itertools import count
+from time import monotonic
+from typing import Any, Literal
+
+type RequestKind = Literal["read", "write"]
+
+
+class TokenBucket:
+    """Requests allowed at *rate* per second, with bursts of up to *burst*.
+
+    Attributes:
+        waits: Number of requests that had to wait for a token.
+        wait_time: Total seconds spent waiting.
+        max_wait: Longest single wait in seconds.
+
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialise a full bucket."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        # Waiting callers as (priority rank, arrival order, future).
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = count()
+        self._timer: asyncio.TimerHandle | None = None
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def async_acquire(self, *, priority: bool = False) -> None:
+        """Wait until a request may be sent.
+
+        Callers are served in arrival order, priority callers first.
+        """
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (0 if priority else 1, next(self._order), future))
+        self._schedule_dispatch()
+        started = monotonic()
+        try:
+            await future
+        finally:
+            waited = monotonic() - started
+            self.waits += 1
+            self.wait_time += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def _schedule_dispatch(self) -> None:
+        """Wake the next waiter when a token becomes available."""
+        if self._timer is None:
+            delay = max(0.0, (1 - self._tokens) / self._rate)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _dispatch(self) -> None:
+        """Hand available tokens to waiters in priority order."""
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _rank, _order, future = heapq.heappop(self._waiters)
+            if future.done():
+                # The caller was cancelled while waiting.
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        if self._waiters:
+            self._schedule_dispatch()
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return wait statistics for diagnostics."""
+        return {
+            "waits": self.waits,
+            "wait_time": round(self.wait_time, 3),
+            "max_wait": round(self.max_wait, 3),
+            "waiting": sum(not future.done() for _rank, _order, future in self._waiters),
+        }
+
+
+class RateLimiter:
+    """Separate read and write token buckets shared by all API clients."""
+
+    def __init__(self, *, read_rate: float, read_burst: int, write_rate: float, write_burst: int) -> None:
+        """Initialise both buckets full."""
+        self._buckets: dict[RequestKind, TokenBucket] = {
+            "read": TokenBucket(read_rate, read_burst),
+            "write": TokenBucket(write_rate, write_burst),
+        }
+
+    async def async_acquire(self, kind: RequestKind, *, priority: bool = False) -> None:
+        """Wait until a request of *kind* may be sent."""
+        await self._buckets[kind].async_acquire(priority=priority)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return wait statistics per request kind."""
+        return {kind: bucket.diagnostics() for kind, bucket in self._buckets.items()}
@@ -0,0 +1,84 @@
+"""Integration-owned HTTP session for the FlameConnect cloud.
+
+Home Assistant's shared ``ClientSession`` pools connections with every
+other integration, so fireplace requests can queue behind unrelated
+traffic.  Entries that opt in use this session instead: its own
+connector with a per-host connection limit, a DNS cache and longer
+keep-alive.  One session is shared by all opted-in entries and closed
+once the last of them unloads.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from custom_components.flameconnect.const import (
+    LOGGER,
+    SESSION_DNS_CACHE_TTL,
+    SESSION_KEEPALIVE_TIMEOUT,
+    SESSION_LIMIT_PER_HOST,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import client_context
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import Event, HomeAssistant
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a session with a connector tuned for the FlameConnect cloud."""
+    connector = aiohttp.TCPConnector(
+        limit_per_host=SESSION_LIMIT_PER_HOST,
+        ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+        keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+        ssl=client_context(),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": SERVER_SOFTWARE},
+    )
+
+
+class SharedSession:
+    """Reference-counted ``create_session`` session shared by config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise without a session; one is created on first use."""
+        self._hass = hass
+        self._session: aiohttp.ClientSession | None = None
+        self._users: set[str] = set()
+        self._unsub_close: Callable[[], None] | None = None
+
+    @callback
+    def async_acquire(self, entry_id: str) -> aiohttp.ClientSession:
+        """Return the session for *entry_id*, creating it for the first entry."""
+        if self._session is None or self._session.closed:
+            LOGGER.debug("Creating the dedicated FlameConnect HTTP session")
+            self._session = create_session()
+            self._unsub_close = self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_close)
+        self._users.add(entry_id)
+        return self._session
+
+    async def async_release(self, entry_id: str) -> None:
+        """Stop using the session for *entry_id*; close it after the last entry."""
+        self._users.discard(entry_id)
+        if self._users or self._session is None:
+            return
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self._async_close()
+
+    async def _async_close(self, _event: Event | None = None) -> None:
+        """Close the session."""
+        session, self._session = self._session, None
+        self._unsub_close = None
+        if session is not None:
+            LOGGER.debug("Closing the dedicated FlameConnect HTTP session")
+            await session.close()
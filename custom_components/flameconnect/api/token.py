@@ -3,13 +3,15 @@
 Provides a factory function that creates an async token provider callable
 suitable for use with flameconnect.TokenAuth. The provider handles MSAL
 token cache deserialization, silent token acquisition, cache persistence
-to config entry data, and proper error propagation.
+to config entry data, and proper error propagation.  An access token
+handed over by the config flow is used until shortly before it expires.
 """
 
 from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Coroutine
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 import msal
@@ -24,6 +26,9 @@
 
 CONF_TOKEN_CACHE = "token_cache"
 
+# Seconds before expiry at which a handed-over access token is no longer used.
+TOKEN_EXPIRY_MARGIN = 60.0
+
 
 def build_msal_app(
     cache_data: str,
@@ -47,6 +52,9 @@ def build_msal_app(
 def create_token_provider(
     hass: HomeAssistant,
     entry: ConfigEntry,
+    *,
+    access_token: str | None = None,
+    token_expires_at: float = 0.0,
 ) -> Callable[[], Coroutine[Any, Any, str]]:
     """Create an async token provider for the FlameConnect API.
 
@@ -59,12 +67,17 @@ def create_token_provider(
     Args:
         hass: The Home Assistant instance.
         entry: The config entry containing the serialized token cache.
+        access_token: A token already acquired (by the config flow), returned
+            without MSAL work until shortly before *token_expires_at*.
+        token_expires_at: Monotonic time *access_token* expires.
 
     Returns:
         An async callable that returns a valid access token string.
 
     """
 
+    handed_over = access_token
+
     async def get_token() -> str:
         """Acquire a valid access token, refreshing if necessary.
 
@@ -73,6 +86,12 @@ async def get_token() -> str:
                 silent token acquisition fails.
 
         """
+        nonlocal handed_over
+        if handed_over is not None:
+            if monotonic() < token_expires_at - TOKEN_EXPIRY_MARGIN:
+                return handed_over
+            handed_over = None
+
         cache_data: str = entry.data[CONF_TOKEN_CACHE]
 
         # Build the MSAL app with deserialized cache (blocking I/O).
@@ -6,6 +6,7 @@
 
 from custom_components.flameconnect.entity import FlameConnectEntity
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
     from custom_components.flameconnect.coordinator import FlameConnectDataUpdateCoordinator
@@ -32,13 +33,17 @@ async def async_setup_entry(
     data = entry.runtime_data
     coordinator = data.coordinator
 
-    entities: list[ButtonEntity] = []
-    for fire in coordinator.fires:
-        entities.extend(
-            FlameConnectRefreshButton(coordinator, description, fire) for description in BUTTON_DESCRIPTIONS
-        )
-
-    async_add_entities(entities)
+    @callback
+    def _async_add_fires(fires: list[Fire]) -> None:
+        entities: list[ButtonEntity] = []
+        for fire in fires:
+            entities.extend(
+                FlameConnectRefreshButton(coordinator, description, fire) for description in BUTTON_DESCRIPTIONS
+            )
+        async_add_entities(entities)
+
+    _async_add_fires(coordinator.fires)
+    entry.async_on_unload(coordinator.async_add_fire_listener(_async_add_fires))
 
 
 class FlameConnectRefreshButton(ButtonEntity, FlameConnectEntity):
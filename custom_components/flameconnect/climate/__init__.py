@@ -15,6 +15,7 @@
 from homeassistant.components.climate import ClimateEntity, ClimateEntityDescription
 from homeassistant.components.climate.const import ClimateEntityFeature, HVACMode
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
     from custom_components.flameconnect.coordinator import FlameConnectDataUpdateCoordinator
@@ -37,17 +38,23 @@ async def async_setup_entry(
 ) -> None:
     """Set up FlameConnect climate entities."""
     coordinator = entry.runtime_data.coordinator
-    entities = [
-        FlameConnectClimate(coordinator, CLIMATE_DESCRIPTION, fire)
-        for fire in coordinator.fires
-        if fire.features.simple_heat or fire.features.advanced_heat
-    ]
-    LOGGER.debug(
-        "Climate setup: %d fires discovered, %d with heat capability",
-        len(coordinator.fires),
-        len(entities),
-    )
-    async_add_entities(entities)
+
+    @callback
+    def _async_add_fires(fires: list[Fire]) -> None:
+        entities = [
+            FlameConnectClimate(coordinator, CLIMATE_DESCRIPTION, fire)
+            for fire in fires
+            if fire.features.simple_heat or fire.features.advanced_heat
+        ]
+        LOGGER.debug(
+            "Climate setup: %d fires discovered, %d with heat capability",
+            len(fires),
+            len(entities),
+        )
+        async_add_entities(entities)
+
+    _async_add_fires(coordinator.fires)
+    entry.async_on_unload(coordinator.async_add_fire_listener(_async_add_fires))
 
 
 class FlameConnectClimate(FlameConnectEntity, ClimateEntity):
@@ -144,8 +151,11 @@ async def async_set_temperature(self, **kwargs: Any) -> None:
         Home Assistant provides the value in Celsius (the entity's unit),
         which is exactly what the device stores on the wire, so it is
         written through unchanged regardless of the device's display unit.
+
+        Uses a debounced write so dragging the thermostat produces a single
+        write with the final setpoint.
         """
         temperature: float | None = kwargs.get("temperature")
         if temperature is None:
             return
-        await self.coordinator.async_write_fields(self._fire_id, HeatParam, setpoint_temperature=temperature)
+        await self.coordinator.async_write_fields_debounced(self._fire_id, HeatParam, setpoint_temperature=temperature)
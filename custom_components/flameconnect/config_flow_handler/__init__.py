@@ -2,6 +2,7 @@
 
 This package implements the configuration flows for the integration:
 - config_flow.py: Main configuration flow (user setup, reauth)
+- options_flow.py: Options flow (offline write queue)
 - schemas/: Voluptuous schemas for all forms
 - validators/: Credential validation via Azure AD B2C
 """
@@ -9,7 +10,9 @@
 from __future__ import annotations
 
 from .config_flow import FlameConnectConfigFlowHandler
+from .options_flow import FlameConnectOptionsFlowHandler
 
 __all__ = [
     "FlameConnectConfigFlowHandler",
+    "FlameConnectOptionsFlowHandler",
 ]
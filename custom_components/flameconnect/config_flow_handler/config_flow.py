@@ -4,19 +4,27 @@
 password, authenticates via B2C, and stores only the serialized MSAL token
 cache (credentials are discarded). The reauth flow re-authenticates and
 updates the stored token cache.
+
+The access token, fires and overviews fetched while validating are left
+as a ``SetupHandoff`` for the first setup of the new entry.
 """
 
 from __future__ import annotations
 
 import asyncio
+from time import monotonic
 from typing import Any
 
 from slugify import slugify
 
-from custom_components.flameconnect.api.token import CONF_TOKEN_CACHE, build_msal_app
+from custom_components.flameconnect.api import SetupHandoff, async_store_handoff
+from custom_components.flameconnect.api.token import CONF_TOKEN_CACHE, TOKEN_EXPIRY_MARGIN, build_msal_app
+from custom_components.flameconnect.config_flow_handler.options_flow import FlameConnectOptionsFlowHandler
 from custom_components.flameconnect.config_flow_handler.schemas import STEP_USER_DATA_SCHEMA
 from custom_components.flameconnect.config_flow_handler.validators import (
+    FireplaceValidation,
     NoWifiFireplacesError,
+    ValidatedCredentials,
     validate_credentials,
     validate_fireplaces,
 )
@@ -24,6 +32,7 @@
 from flameconnect import ApiError, AuthenticationError, FlameConnectClient, TokenAuth  # type: ignore[attr-defined]
 from flameconnect.const import SCOPES  # type: ignore[attr-defined]
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
@@ -34,10 +43,25 @@ class FlameConnectConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     Supports:
     - user: Initial setup via email + password (B2C authentication).
     - reauth: Re-authenticate when tokens expire.
+
+    Options are handled by FlameConnectOptionsFlowHandler.
     """
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialise the flow."""
+        # Access token to use while validating, and its expiry.
+        self._access_token: tuple[str, float] | None = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> FlameConnectOptionsFlowHandler:
+        """Return the options flow handler."""
+        return FlameConnectOptionsFlowHandler()
+
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
@@ -51,7 +75,7 @@ async def async_step_user(
 
         if user_input is not None:
             try:
-                token_cache = await validate_credentials(
+                credentials = await validate_credentials(
                     email=user_input["email"],
                     password=user_input["password"],
                 )
@@ -65,8 +89,9 @@ async def async_step_user(
                 LOGGER.exception("Unexpected error during config flow")
                 errors["base"] = "unknown"
             else:
+                fetched_at = monotonic()
                 try:
-                    await self._validate_fireplaces(token_cache)
+                    validation = await self._validate_fireplaces(credentials)
                 except NoWifiFireplacesError:
                     return self.async_abort(reason="no_wifi_fireplaces")
                 except (ApiError, OSError):
@@ -74,12 +99,26 @@ async def async_step_user(
                     errors["base"] = "cannot_connect"
                 else:
                     email = user_input["email"]
-                    await self.async_set_unique_id(slugify(email))
+                    unique_id = slugify(email)
+                    await self.async_set_unique_id(unique_id)
                     self._abort_if_unique_id_configured()
 
+                    access_token, token_expires_at = self._access_token or (None, 0.0)
+                    async_store_handoff(
+                        self.hass,
+                        unique_id,
+                        SetupHandoff(
+                            fires=validation.fires,
+                            overviews=validation.overviews,
+                            no_wifi=validation.no_wifi,
+                            fetched_at=fetched_at,
+                            access_token=access_token,
+                            token_expires_at=token_expires_at,
+                        ),
+                    )
                     return self.async_create_entry(
                         title=email,
-                        data={CONF_TOKEN_CACHE: token_cache},
+                        data={CONF_TOKEN_CACHE: credentials.token_cache},
                     )
 
         return self.async_show_form(
@@ -88,11 +127,18 @@ async def async_step_user(
             errors=errors,
         )
 
-    async def _validate_fireplaces(self, token_cache: str) -> None:
+    async def _validate_fireplaces(self, credentials: ValidatedCredentials) -> FireplaceValidation:
         """Check that the account has WiFi-connected fireplaces.
 
-        Creates a temporary client using the token cache from authentication
+        Creates a temporary client using the tokens from authentication
         and verifies that at least one fireplace returns a valid WiFi overview.
+        The access token just issued is served from memory; the token cache
+        is only consulted once it is about to expire.
+        Requests share the rate limiter of the configured entries, if the
+        integration is already set up.
+
+        Returns:
+            The fires and overviews fetched.
 
         Raises:
             NoWifiFireplacesError: If no WiFi fireplaces are found.
@@ -101,8 +147,12 @@ async def _validate_fireplaces(self, token_cache: str) -> None:
 
         """
 
+        self._access_token = (credentials.access_token, credentials.expires_at)
+
         async def _get_token() -> str:
-            app, _cache = await asyncio.to_thread(build_msal_app, token_cache)
+            if self._access_token is not None and monotonic() < self._access_token[1] - TOKEN_EXPIRY_MARGIN:
+                return self._access_token[0]
+            app, _cache = await asyncio.to_thread(build_msal_app, credentials.token_cache)
             accounts: list[dict[str, Any]] = app.get_accounts()
             result: dict[str, Any] | None = await asyncio.to_thread(
                 app.acquire_token_silent, SCOPES, account=accounts[0]
@@ -110,13 +160,15 @@ async def _get_token() -> str:
             if result is None or "error" in result:
                 raise AuthenticationError("Token acquisition failed")
             access_token: str = result["access_token"]
+            self._access_token = (access_token, monotonic() + float(result.get("expires_in", 0)))
             return access_token
 
         client = FlameConnectClient(
             auth=TokenAuth(_get_token),
             session=async_get_clientsession(self.hass),
         )
-        await validate_fireplaces(client)
+        domain_data = self.hass.data.get(DOMAIN)
+        return await validate_fireplaces(client, domain_data.rate_limiter if domain_data is not None else None)
 
     async def async_step_reauth(
         self,
@@ -139,7 +191,7 @@ async def async_step_reauth_confirm(
 
         if user_input is not None:
             try:
-                token_cache = await validate_credentials(
+                credentials = await validate_credentials(
                     email=user_input["email"],
                     password=user_input["password"],
                 )
@@ -157,7 +209,7 @@ async def async_step_reauth_confirm(
 
                 return self.async_update_reload_and_abort(
                     entry,
-                    data={CONF_TOKEN_CACHE: token_cache},
+                    data={CONF_TOKEN_CACHE: credentials.token_cache},
                 )
 
         return self.async_show_form(
@@ -0,0 +1,34 @@
+"""Options flow for flameconnect.
+
+Lets the user opt in to queuing changes made while the cloud is
+unreachable, set the bounds of the adaptive debounce delay, set the
+timeouts of API reads and writes, and opt in to a dedicated HTTP
+session.  The entry is reloaded when the options change.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from custom_components.flameconnect.config_flow_handler.schemas import OPTIONS_SCHEMA
+from homeassistant import config_entries
+
+
+class FlameConnectOptionsFlowHandler(config_entries.OptionsFlowWithReload):
+    """Handle the options flow for flameconnect."""
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Show and save the integration options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(OPTIONS_SCHEMA, self.config_entry.options),
+        )
+
+
+__all__ = ["FlameConnectOptionsFlowHandler"]
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from custom_components.flameconnect.config_flow_handler.schemas.config import STEP_USER_DATA_SCHEMA
+from custom_components.flameconnect.config_flow_handler.schemas.options import OPTIONS_SCHEMA
 
 __all__ = [
+    "OPTIONS_SCHEMA",
     "STEP_USER_DATA_SCHEMA",
 ]
@@ -0,0 +1,54 @@
+"""Options flow schemas for flameconnect."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from custom_components.flameconnect.const import (
+    CONF_DEBOUNCE_MAX_DELAY,
+    CONF_DEBOUNCE_MIN_DELAY,
+    CONF_DEDICATED_SESSION,
+    CONF_OFFLINE_QUEUE,
+    CONF_READ_TIMEOUT,
+    CONF_WRITE_TIMEOUT,
+    DEFAULT_DEBOUNCE_MAX_DELAY,
+    DEFAULT_DEBOUNCE_MIN_DELAY,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_WRITE_TIMEOUT,
+)
+from homeassistant.helpers import selector
+
+_DELAY_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.0,
+        max=10.0,
+        step=0.1,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+_TIMEOUT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1.0,
+        max=120.0,
+        step=1.0,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_OFFLINE_QUEUE, default=False): bool,
+        vol.Optional(CONF_DEBOUNCE_MIN_DELAY, default=DEFAULT_DEBOUNCE_MIN_DELAY): _DELAY_SELECTOR,
+        vol.Optional(CONF_DEBOUNCE_MAX_DELAY, default=DEFAULT_DEBOUNCE_MAX_DELAY): _DELAY_SELECTOR,
+        vol.Optional(CONF_READ_TIMEOUT, default=DEFAULT_READ_TIMEOUT): _TIMEOUT_SELECTOR,
+        vol.Optional(CONF_WRITE_TIMEOUT, default=DEFAULT_WRITE_TIMEOUT): _TIMEOUT_SELECTOR,
+        vol.Optional(CONF_DEDICATED_SESSION, default=False): bool,
+    }
+)
+
+__all__ = [
+    "OPTIONS_SCHEMA",
+]
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from custom_components.flameconnect.config_flow_handler.validators.credentials import validate_credentials
+from custom_components.flameconnect.config_flow_handler.validators.credentials import (
+    ValidatedCredentials,
+    validate_credentials,
+)
 from custom_components.flameconnect.config_flow_handler.validators.fireplaces import (
+    FireplaceValidation,
     NoWifiFireplacesError,
     validate_fireplaces,
 )
 
 __all__ = [
+    "FireplaceValidation",
     "NoWifiFireplacesError",
+    "ValidatedCredentials",
     "validate_credentials",
     "validate_fireplaces",
 ]
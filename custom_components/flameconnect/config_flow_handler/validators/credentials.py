@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
+from time import monotonic
 from urllib.parse import parse_qs, urlparse
 
 import msal
@@ -12,8 +14,24 @@
 from flameconnect.const import AUTHORITY, CLIENT_ID, SCOPES  # type: ignore[attr-defined]
 
 
-async def validate_credentials(email: str, password: str) -> str:
-    """Authenticate via Azure AD B2C and return a serialized MSAL token cache.
+@dataclass(frozen=True)
+class ValidatedCredentials:
+    """Tokens issued by a successful sign-in.
+
+    Attributes:
+        token_cache: The serialized MSAL token cache to store in the entry.
+        access_token: The access token just issued.
+        expires_at: Monotonic time *access_token* expires.
+
+    """
+
+    token_cache: str
+    access_token: str
+    expires_at: float
+
+
+async def validate_credentials(email: str, password: str) -> ValidatedCredentials:
+    """Authenticate via Azure AD B2C and return the issued tokens.
 
     Creates an MSAL auth code flow, uses flameconnect's b2c_login helper to
     perform the browser-less B2C sign-in, then exchanges the resulting auth
@@ -24,7 +42,8 @@ async def validate_credentials(email: str, password: str) -> str:
         password: User's password.
 
     Returns:
-        The serialized MSAL token cache string.
+        The serialized MSAL token cache, with the access token and its
+        expiry so the caller can use it without going through MSAL again.
 
     Raises:
         AuthenticationError: If authentication fails (invalid credentials).
@@ -55,6 +74,7 @@ async def validate_credentials(email: str, password: str) -> str:
     parsed = urlparse(redirect_url)
     auth_response: dict[str, str] = {k: v[0] for k, v in parse_qs(parsed.query).items()}
 
+    issued_at = monotonic()
     result: dict = await asyncio.to_thread(
         app.acquire_token_by_auth_code_flow,
         flow,
@@ -65,4 +85,8 @@ async def validate_credentials(email: str, password: str) -> str:
         raise AuthenticationError(result.get("error_description", result["error"]))
 
     serialized: str = cache.serialize()
-    return serialized
+    return ValidatedCredentials(
+        token_cache=serialized,
+        access_token=result["access_token"],
+        expires_at=issued_at + float(result.get("expires_in", 0)),
+    )
@@ -1,58 +1,131 @@
 """Fireplace validation for config flow.
 
 Verifies that the user's account has at least one WiFi-connected fireplace
-by fetching the fire list and checking each one for a valid overview.
+by fetching the fire list and probing the fires for a valid overview,
+several at a time.  The fires and overviews fetched, and the fires found
+to have no WiFi overview, are returned so setup can reuse them.
 """
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING
 
-from custom_components.flameconnect.const import LOGGER
+from custom_components.flameconnect.const import DEFAULT_READ_TIMEOUT, FIREPLACE_PROBE_PARALLEL, LOGGER
+from custom_components.flameconnect.coordinator.error_handling import async_call_with_timeout
 
 if TYPE_CHECKING:
-    from flameconnect import FlameConnectClient
+    from custom_components.flameconnect.api import RateLimiter
+    from flameconnect import Fire, FireOverview, FlameConnectClient
 
 
 class NoWifiFireplacesError(Exception):
     """Raised when no WiFi-connected fireplaces are found."""
 
 
-async def validate_fireplaces(client: FlameConnectClient) -> None:
+@dataclass
+class FireplaceValidation:
+    """What ``validate_fireplaces`` fetched from the account.
+
+    Attributes:
+        fires: All fires in the account.
+        overviews: Overviews read successfully, by fire ID.
+        no_wifi: IDs of fires whose probe showed no WiFi overview.
+
+    """
+
+    fires: list[Fire]
+    overviews: dict[str, FireOverview] = field(default_factory=dict)
+    no_wifi: set[str] = field(default_factory=set)
+
+
+async def validate_fireplaces(
+    client: FlameConnectClient,
+    rate_limiter: RateLimiter | None = None,
+) -> FireplaceValidation:
     """Check that the account has at least one WiFi-connected fireplace.
 
-    Fetches the fire list and attempts to get an overview for each one.
-    Fires whose overview fails (e.g. Bluetooth-only devices where
-    WifiFireOverview is null) are skipped.
+    Fetches the fire list and probes up to ``FIREPLACE_PROBE_PARALLEL``
+    fires at a time for an overview, in account order.  Fires whose
+    overview fails (e.g. Bluetooth-only devices where WifiFireOverview is
+    null) are recorded and skipped, as are fires whose probe fails.  As
+    soon as one probe succeeds the remaining probes are cancelled, so a
+    failing fire does not fail the validation if another fire has WiFi.
+    Each request is cancelled after
+    ``DEFAULT_READ_TIMEOUT`` seconds, and first waits for *rate_limiter*,
+    if given.
 
     Args:
         client: An authenticated FlameConnectClient.
+        rate_limiter: The limiter shared with the configured entries.
+
+    Returns:
+        The fire list, the first WiFi fireplace's overview and the fires
+        found to have no WiFi overview by then.
 
     Raises:
         NoWifiFireplacesError: If no fireplaces return a valid WiFi overview.
-        ApiError: If the API request itself fails.
-        FlameConnectError: If a library-level error occurs.
+        ApiError: If an API request itself fails, and no probe succeeded.
+        FlameConnectError: If a library-level error occurs, and no probe
+            succeeded.
+        CallTimeoutError: If a request did not complete in time, and no
+            probe succeeded.
 
     """
-    fires = await client.get_fires()
+    if rate_limiter is not None:
+        await rate_limiter.async_acquire("read")
+    fires = await async_call_with_timeout("get_fires", DEFAULT_READ_TIMEOUT, client.get_fires)
 
     if not fires:
         LOGGER.debug("No fireplaces found in account")
         raise NoWifiFireplacesError
 
-    for fire in fires:
-        try:
-            await client.get_fire_overview(fire.fire_id)
-        except (TypeError, KeyError):
-            LOGGER.debug(
-                "Fire %s (%s) has no WiFi overview, skipping",
-                fire.friendly_name,
-                fire.fire_id,
-            )
-            continue
-        else:
+    validation = FireplaceValidation(fires=fires)
+    semaphore = asyncio.Semaphore(FIREPLACE_PROBE_PARALLEL)
+
+    async def _probe(fire: Fire) -> tuple[Fire, FireOverview | None]:
+        async with semaphore:
+            if rate_limiter is not None:
+                await rate_limiter.async_acquire("read")
+            try:
+                overview = await async_call_with_timeout(
+                    "get_fire_overview", DEFAULT_READ_TIMEOUT, partial(client.get_fire_overview, fire.fire_id)
+                )
+            except (TypeError, KeyError):
+                return fire, None
+        return fire, overview
+
+    probes = [asyncio.create_task(_probe(fire)) for fire in fires]
+    first_error: Exception | None = None
+    try:
+        for probe in asyncio.as_completed(probes):
+            try:
+                fire, overview = await probe
+            except Exception as err:  # noqa: BLE001
+                # Another fire may still have WiFi.
+                LOGGER.debug("Probing a fireplace failed: %s", err)
+                first_error = first_error or err
+                continue
+            if overview is None:
+                LOGGER.debug(
+                    "Fire %s (%s) has no WiFi overview, skipping",
+                    fire.friendly_name,
+                    fire.fire_id,
+                )
+                validation.no_wifi.add(fire.fire_id)
+                continue
             # At least one fire has a valid WiFi overview.
-            return
-
+            validation.overviews[fire.fire_id] = overview
+            return validation
+    finally:
+        for task in probes:
+            task.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+
+    if first_error is not None:
+        # Without a WiFi fireplace to show for it, report why probing failed.
+        raise first_error
     LOGGER.debug("None of the %d fireplaces have a WiFi overview", len(fires))
     raise NoWifiFireplacesError
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from logging import Logger, getLogger
+from typing import TYPE_CHECKING
 
+from flameconnect import FlameEffectParam, HeatParam, SoundParam, TimerParam
 from homeassistant.const import Platform
 
+if TYPE_CHECKING:
+    from flameconnect import Parameter
+
 LOGGER: Logger = getLogger(__package__)
 
 # Integration metadata
@@ -21,3 +27,110 @@
     Platform.SENSOR,
     Platform.SWITCH,
 ]
+
+# Debounced writes: quiet period (seconds) after the last change before a
+# coalesced write is flushed.  DEBOUNCE_DELAY is used until a write
+# round-trip time has been observed; after that the quiet period is
+# DEBOUNCE_RTT_FACTOR times the smoothed round-trip time (an EWMA with
+# weight WRITE_RTT_SMOOTHING for each new sample), kept within the
+# configurable minimum and maximum delay.
+DEBOUNCE_DELAY = 1.0
+DEBOUNCE_RTT_FACTOR = 2.0
+WRITE_RTT_SMOOTHING = 0.25
+CONF_DEBOUNCE_MIN_DELAY = "debounce_min_delay"
+CONF_DEBOUNCE_MAX_DELAY = "debounce_max_delay"
+DEFAULT_DEBOUNCE_MIN_DELAY = 0.3
+DEFAULT_DEBOUNCE_MAX_DELAY = 3.0
+
+# Maximum time (seconds) a pending debounced change may be held back while
+# input keeps arriving (e.g. a slider being dragged).  Once reached, the
+# pending changes are flushed even though the quiet period has not elapsed.
+DEBOUNCE_MAX_WAIT: dict[type[Parameter], float] = {
+    FlameEffectParam: 2.0,
+    SoundParam: 2.0,
+    HeatParam: 5.0,
+    TimerParam: 5.0,
+}
+DEFAULT_DEBOUNCE_MAX_WAIT = 5.0
+
+# Write confirmation: after a write the written fire is re-read once
+# immediately, then again after each of these delays (seconds) until it
+# reports the written values.  After the last retry the mismatch is
+# recorded and the reported state is shown.
+CONFIRM_RETRY_DELAYS: tuple[float, ...] = (1.0, 2.0, 4.0)
+
+# Offline write queue (opt-in via the options flow): changes that fail
+# because the cloud is unreachable are queued and replayed once it
+# responds again.  Queued changes older than the maximum age (seconds)
+# are discarded, and replay is retried at the given interval (seconds).
+CONF_OFFLINE_QUEUE = "offline_queue"
+OFFLINE_QUEUE_MAX_AGE = 1800.0
+OFFLINE_QUEUE_RETRY_INTERVAL = 60.0
+
+# Write retries: transient failures (5xx, timeouts) are retried up to the
+# given number of attempts with exponential backoff and full jitter
+# (seconds).  At most WRITE_RETRY_BUDGET retries are spent per
+# WRITE_RETRY_BUDGET_WINDOW seconds across all writes.
+WRITE_RETRY_ATTEMPTS = 3
+WRITE_RETRY_BASE_DELAY = 0.5
+WRITE_RETRY_MAX_DELAY = 4.0
+WRITE_RETRY_BUDGET = 10
+WRITE_RETRY_BUDGET_WINDOW = 60.0
+
+# API call timeouts (seconds): a client call still running after its
+# budget is cancelled and raises CallTimeoutError, releasing the fire's
+# write lock.  Writes and turn on/off, which a user is waiting on, get a
+# shorter budget than discovery and overview reads.
+CONF_READ_TIMEOUT = "read_timeout"
+CONF_WRITE_TIMEOUT = "write_timeout"
+DEFAULT_READ_TIMEOUT = 30.0
+DEFAULT_WRITE_TIMEOUT = 10.0
+READ_OPERATIONS = ("get_fires", "get_fire_overview")
+WRITE_OPERATIONS = ("write_parameters", "turn_on", "turn_off")
+
+# Shared rate limits (all config entries and the config flow): requests
+# per second and burst size, separately for reads and writes.
+READ_RATE_LIMIT = 2.0
+READ_RATE_BURST = 10
+WRITE_RATE_LIMIT = 1.0
+WRITE_RATE_BURST = 5
+
+# Dedicated HTTP session (opt-in via the options flow): connection limit
+# per host, DNS cache lifetime (seconds) and idle keep-alive (seconds) of
+# the integration-owned connector shared by the entries using it.
+CONF_DEDICATED_SESSION = "dedicated_session"
+SESSION_LIMIT_PER_HOST = 8
+SESSION_DNS_CACHE_TTL = 300
+SESSION_KEEPALIVE_TIMEOUT = 60.0
+
+# Startup snapshot: seconds entities restored from the snapshot stay
+# available while they cannot be revalidated against the cloud.
+SNAPSHOT_STALE_WINDOW = 900.0
+
+# Timer and boost expiry: seconds after the predicted transition is
+# applied before the fire is re-read to confirm it.  Confirmation reads
+# due within the same window (seconds) are fetched together.
+EXPIRY_CONFIRM_DELAY = 60.0
+EXPIRY_COALESCE_WINDOW = 10.0
+
+# Shutdown: seconds allowed for flushing pending debounced writes before
+# the remaining ones are abandoned.
+SHUTDOWN_DRAIN_TIMEOUT = 10.0
+
+# Config flow: maximum number of fires probed for a WiFi overview at once.
+FIREPLACE_PROBE_PARALLEL = 4
+
+# Seconds the config flow's fires, overviews and access token are kept
+# for the first setup of the entry it creates.
+HANDOFF_TTL = 120.0
+
+# Interval between checks of the account for added or removed fires.
+REDISCOVERY_INTERVAL = timedelta(hours=6)
+
+# Bulk service actions: maximum number of fires written concurrently.
+BULK_MAX_PARALLEL = 4
+
+# Desired-state reconciliation: write rounds before giving up, and the
+# pause (seconds) before re-writing fields the fire did not accept.
+RECONCILE_MAX_ROUNDS = 3
+RECONCILE_RETRY_DELAY = 1.0
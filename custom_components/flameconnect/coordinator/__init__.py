@@ -3,5 +3,6 @@
 from __future__ import annotations
 
 from .base import FlameConnectDataUpdateCoordinator
+from .reconcile import ReconcileResult
 
-__all__ = ["FlameConnectDataUpdateCoordinator"]
+__all__ = ["FlameConnectDataUpdateCoordinator", "ReconcileResult"]
@@ -1,25 +1,89 @@
 """DataUpdateCoordinator for the FlameConnect integration.
 
-Fetches fire discovery data once at setup, then polls per-fire overview
-data on a 24-hour interval with random jitter to avoid thundering-herd
-effects across multiple installations.
+Discovers the account's fires at setup and re-checks the list
+periodically, adding and removing fires as they appear and vanish.
+Per-fire overview data is polled on a 24-hour interval with random
+jitter to avoid thundering-herd effects across multiple installations.
 
 All entity writes are routed through this coordinator to prevent races
 (per-fire ``asyncio.Lock``) and to debounce rapid slider changes.
+
+Requested changes are shown to entities immediately through a pending
+overlay layered on top of the last data read from the API.  After a
+write only the written fire is re-read to confirm the value, retrying on
+a short backoff while the cloud catches up.  The overlay is dropped once
+the value is confirmed (or the retry budget is spent), and rolled back
+if the write fails.
+
+Every client call runs within a per-operation timeout (shorter for
+writes than for reads); a call past its deadline is cancelled, releasing
+the fire's write lock, and raises ``CallTimeoutError``.  Calls first
+take a token from the integration-wide ``RateLimiter``, if one is given,
+within the same deadline.  The read before a write is held to the write
+budget, so no write keeps the fire's lock longer than that.
+
+If the offline queue is enabled, changes that fail because the cloud is
+unreachable keep their overlay and are queued for replay instead of
+being rolled back.
+
+The discovered fires and their last overviews are persisted, so a
+restart can come up from that snapshot (entities marked stale) and
+revalidate against the cloud in the background.  The first setup after
+the config flow starts from the fires and overviews the flow fetched.
+
+When a running countdown timer or boost mode ends, the transition the
+fireplace makes is applied locally at the expiry instant and confirmed
+by a read shortly afterwards.  Expiries are timed by an
+``ExpiryScheduler``, which batches the confirmation reads of fires
+expiring together into one refresh.
 """
 
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
-from collections.abc import Callable
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
 import dataclasses
 from datetime import datetime, timedelta
 from functools import partial
 from random import randint
-from typing import TYPE_CHECKING, Any
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Literal
 
-from custom_components.flameconnect.const import DOMAIN, LOGGER
+import aiohttp
+
+from custom_components.flameconnect.const import (
+    CONF_DEBOUNCE_MAX_DELAY,
+    CONF_DEBOUNCE_MIN_DELAY,
+    CONF_OFFLINE_QUEUE,
+    CONF_READ_TIMEOUT,
+    CONF_WRITE_TIMEOUT,
+    CONFIRM_RETRY_DELAYS,
+    DEBOUNCE_DELAY,
+    DEBOUNCE_MAX_WAIT,
+    DEBOUNCE_RTT_FACTOR,
+    DEFAULT_DEBOUNCE_MAX_DELAY,
+    DEFAULT_DEBOUNCE_MAX_WAIT,
+    DEFAULT_DEBOUNCE_MIN_DELAY,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_WRITE_TIMEOUT,
+    DOMAIN,
+    EXPIRY_CONFIRM_DELAY,
+    LOGGER,
+    OFFLINE_QUEUE_MAX_AGE,
+    OFFLINE_QUEUE_RETRY_INTERVAL,
+    READ_OPERATIONS,
+    SHUTDOWN_DRAIN_TIMEOUT,
+    SNAPSHOT_STALE_WINDOW,
+    WRITE_OPERATIONS,
+    WRITE_RETRY_ATTEMPTS,
+    WRITE_RETRY_BASE_DELAY,
+    WRITE_RETRY_BUDGET,
+    WRITE_RETRY_BUDGET_WINDOW,
+    WRITE_RETRY_MAX_DELAY,
+    WRITE_RTT_SMOOTHING,
+)
 from flameconnect import (
     ApiError,
     AuthenticationError,
@@ -27,15 +91,33 @@
     FireOverview,
     FlameConnectClient,
     FlameConnectError,
+    HeatMode,
+    HeatParam,
     ModeParam,
 )
 from homeassistant.core import callback
-from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers import issue_registry as ir
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady, ServiceValidationError
+from homeassistant.helpers import device_registry as dr, issue_registry as ir
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .error_handling import (
+    CallTimeoutError,
+    RetryPolicy,
+    async_call_with_timeout,
+    is_transient_error,
+    is_version_conflict,
+)
+from .expiry import EXPIRY_EVENTS, EXPIRY_PARAMS, countdown_minutes, get_param, predict_expiry
+from .reconcile import ReconcileResult, async_reconcile
+from .scheduler import ExpiryScheduler
+from .single_flight import SingleFlight
+from .startup_cache import StartupCache
+from .write_queue import OfflineWriteQueue
 
 if TYPE_CHECKING:
+    from custom_components.flameconnect.api import RateLimiter, SetupHandoff
     from custom_components.flameconnect.data import FlameConnectConfigEntry
     from flameconnect import Fire, Parameter
     from homeassistant.core import HomeAssistant
@@ -49,21 +131,28 @@ class FlameConnectDataUpdateCoordinator(DataUpdateCoordinator[dict[str, FireOver
     ``asyncio.Lock`` serialises read-modify-write cycles so concurrent
     writes to the same parameter type never race.
 
+    ``coordinator.data`` is the last API-reported data with any pending
+    overlays applied; the un-overlaid values are kept in ``_base_data``.
+
     Attributes:
         config_entry: The config entry for this integration instance.
         fires: List of discovered fires, populated by _async_setup.
     """
 
     config_entry: FlameConnectConfigEntry
-    fires: list[Fire]
 
     def __init__(
         self,
         hass: HomeAssistant,
         client: FlameConnectClient,
         entry: FlameConnectConfigEntry,
+        *,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
-        """Initialise the coordinator with a 24 h + jitter update interval."""
+        """Initialise the coordinator with a 24 h + jitter update interval.
+
+        *rate_limiter* is shared with the other entries' coordinators.
+        """
         jitter = timedelta(minutes=randint(0, 60))
         super().__init__(
             hass,
@@ -73,10 +162,74 @@ def __init__(
             update_interval=timedelta(hours=24) + jitter,
         )
         self.client = client
+        self.fires: list[Fire] = []
 
         self._write_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._pending_writes: dict[tuple[str, type[Parameter]], dict[str, Any]] = {}
         self._debounce_timers: dict[tuple[str, type[Parameter]], Callable[[], None]] = {}
+        # Monotonic time of the first change in each pending debounce burst,
+        # used to enforce the max-wait ceiling.
+        self._debounce_started: dict[tuple[str, type[Parameter]], float] = {}
+        # Smoothed read-modify-write round-trip time (seconds) and the
+        # bounds of the debounce delay derived from it.
+        self.write_rtt: float | None = None
+        self._debounce_min_delay: float = entry.options.get(CONF_DEBOUNCE_MIN_DELAY, DEFAULT_DEBOUNCE_MIN_DELAY)
+        self._debounce_max_delay: float = max(
+            self._debounce_min_delay,
+            entry.options.get(CONF_DEBOUNCE_MAX_DELAY, DEFAULT_DEBOUNCE_MAX_DELAY),
+        )
+
+        # Last data read from the API, without pending overlays applied,
+        # and the monotonic time each fire's read was started.
+        self._base_data: dict[str, FireOverview] = {}
+        self._base_read_at: dict[str, float] = {}
+        # Requested field changes not yet confirmed by the API, shown to
+        # entities on top of ``_base_data``.
+        self._overlays: dict[tuple[str, type[Parameter]], dict[str, Any]] = {}
+        # Monotonic time at which each overlay's write completed.  Only
+        # refreshes started after this instant may confirm the overlay.
+        self._overlay_written_at: dict[tuple[str, type[Parameter]], float] = {}
+        # Number of writes in flight per overlay key.
+        self._overlay_inflight: Counter[tuple[str, type[Parameter]]] = Counter()
+
+        # Pending confirmation re-read retries per written parameter.
+        self._confirm_timers: dict[tuple[str, type[Parameter]], Callable[[], None]] = {}
+
+        # Concurrent reads of the same fire share one request.
+        self._overview_reads: SingleFlight[str, tuple[FireOverview, float]] = SingleFlight()
+
+        # User-initiated writes in flight, and fires a background poll
+        # skipped in their favour (in poll order; values unused).
+        self._active_writes = 0
+        self._preempted_fires: dict[str, None] = {}
+        self.preempted_polls = 0
+
+        # Timeout budget (seconds) per client method.
+        read_timeout = entry.options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT)
+        write_timeout = entry.options.get(CONF_WRITE_TIMEOUT, DEFAULT_WRITE_TIMEOUT)
+        self.call_timeouts: dict[str, float] = {
+            **dict.fromkeys(READ_OPERATIONS, read_timeout),
+            **dict.fromkeys(WRITE_OPERATIONS, write_timeout),
+        }
+        self.call_timeouts_hit = 0
+        self.rate_limiter = rate_limiter
+
+        # Retries of transient write and turn on/off failures.
+        self.retry_policy = RetryPolicy(
+            attempts=WRITE_RETRY_ATTEMPTS,
+            base_delay=WRITE_RETRY_BASE_DELAY,
+            max_delay=WRITE_RETRY_MAX_DELAY,
+            budget=WRITE_RETRY_BUDGET,
+            budget_window=WRITE_RETRY_BUDGET_WINDOW,
+        )
+
+        # Writes skipped because the fireplace already had the requested values.
+        self.skipped_writes = 0
+        # Writes the fireplace still did not report after the retry budget.
+        self.write_mismatches = 0
+        self.last_write_mismatch: dict[str, Any] | None = None
+        # Seconds the last shutdown spent flushing pending writes.
+        self.last_drain_duration: float | None = None
 
         # Desired timer duration per fire, stored locally (not written to
         # the API until the timer switch is actually turned on).
@@ -86,18 +239,247 @@ def __init__(
         # the API until boost mode is actually activated).
         self.boost_durations: dict[str, int] = {}
 
+        # Predicted end of each running countdown, keyed by
+        # ``(fire_id, event)``, and the duration it was computed from.
+        # Boost expiry restores the heat mode last seen before boost
+        # started.
+        self.expiry_scheduler = ExpiryScheduler(hass, self._apply_expiry, self.async_refresh_fires)
+        self._expiry_durations: dict[tuple[str, str], int] = {}
+        self._heat_mode_before_boost: dict[str, HeatMode] = {}
+        # Countdowns whose predicted expiry has been applied, with their
+        # duration.  The prediction is layered over the API data until a
+        # read reports the countdown ended, so a read lagging behind the
+        # fireplace does not start it again.
+        self._expired_countdowns: dict[tuple[str, str], int] = {}
+
+        # Changes held while the cloud is unreachable (opt-in).
+        self.write_queue: OfflineWriteQueue | None = None
+        if entry.options.get(CONF_OFFLINE_QUEUE):
+            self.write_queue = OfflineWriteQueue(hass, entry.entry_id, OFFLINE_QUEUE_MAX_AGE)
+        self._replay_timer: Callable[[], None] | None = None
+
+        # Snapshot used to start without waiting for the cloud.  ``stale``
+        # is True while entities show snapshot data not yet revalidated;
+        # they stay available for ``SNAPSHOT_STALE_WINDOW`` seconds.
+        self.startup_cache = StartupCache(hass, entry.entry_id)
+        self.stale = False
+        self._stale_timer: Callable[[], None] | None = None
+
+        # Overviews fetched by the config flow, with the monotonic time
+        # their reads started, used by the first poll instead of a read.
+        self._handoff_overviews: dict[str, tuple[FireOverview, float]] = {}
+        # Fires the config flow found to have no WiFi overview, which the
+        # first poll does not read.
+        self._handoff_no_wifi: set[str] = set()
+
+        # Platform callbacks adding entities for fires found by re-discovery.
+        self._fire_adders: list[Callable[[list[Fire]], None]] = []
+
     async def _async_setup(self) -> None:
-        """Discover all fires during first refresh."""
-        all_fires = await self.client.get_fires()
-        self.fires = [fire for fire in all_fires if fire is not None and fire.fire_id]
-        skipped = len(all_fires) - len(self.fires)
+        """Discover all fires during first refresh, unless already discovered."""
+        if self.write_queue is not None:
+            await self.write_queue.async_load()
+        if not self.fires:
+            await self._async_discover_fires()
+
+    async def async_discover(self) -> None:
+        """Discover the account's fires before the first overview fetch.
+
+        Lets platforms create entities from ``fires`` and their features
+        while ``async_config_entry_first_refresh`` fetches the overviews.
+        Until then ``data`` is empty and entities are unavailable.
+
+        Raises:
+            ConfigEntryAuthFailed: If the credentials were rejected.
+            ConfigEntryNotReady: If the fires could not be fetched.
+
+        """
+        try:
+            await self._async_discover_fires()
+        except AuthenticationError as err:
+            raise ConfigEntryAuthFailed from err
+        except (FlameConnectError, UpdateFailed, aiohttp.ClientError, TimeoutError) as err:
+            raise ConfigEntryNotReady(str(err)) from err
+        if self.data is None:
+            self.data = {}
+
+    @callback
+    def async_use_handoff(self, handoff: SetupHandoff) -> bool:
+        """Start from the fires and overviews fetched by the config flow.
+
+        Used instead of ``async_discover``; the first refresh then reads
+        only the fires the flow did not, skipping those it found to have
+        no WiFi overview.
+
+        Returns:
+            False if the handoff held no usable fires.
+
+        """
+        fires = [fire for fire in handoff.fires if fire is not None and fire.fire_id]
+        if not fires:
+            return False
+        self.fires = fires
+        self._handoff_overviews = {
+            fire_id: (overview, handoff.fetched_at) for fire_id, overview in handoff.overviews.items()
+        }
+        self._handoff_no_wifi = set(handoff.no_wifi)
+        LOGGER.debug(
+            "Starting from the config flow's %d fire(s) and %d overview(s)", len(fires), len(handoff.overviews)
+        )
+        if self.data is None:
+            self.data = {}
+        return True
+
+    async def async_restore_snapshot(self) -> bool:
+        """Start from the persisted fires and overviews, if there are any.
+
+        Returns:
+            True if the coordinator was populated from the snapshot and
+            should be revalidated with ``async_revalidate``.
+
+        """
+        snapshot = await self.startup_cache.async_load()
+        if snapshot is None:
+            return False
+        if self.write_queue is not None:
+            await self.write_queue.async_load()
+        self.fires, data = snapshot
+        self.stale = True
+        self._stale_timer = async_call_later(self.hass, SNAPSHOT_STALE_WINDOW, self._end_stale_window)
+        LOGGER.debug("Starting from the saved snapshot of %d fire(s)", len(self.fires))
+        self.async_set_updated_data(data)
+        return True
+
+    @property
+    def serving_snapshot(self) -> bool:
+        """Return True while unrevalidated snapshot data is shown as available."""
+        return self.stale and self._stale_timer is not None
+
+    @callback
+    def _end_stale_window(self, _now: datetime) -> None:
+        """Stop showing the snapshot as available if it was never revalidated."""
+        self._stale_timer = None
+        if self.stale:
+            LOGGER.warning(
+                "Could not revalidate the saved snapshot within %d seconds, marking fireplaces unavailable",
+                SNAPSHOT_STALE_WINDOW,
+            )
+            self.async_update_listeners()
+
+    @callback
+    def _cancel_stale_window(self) -> None:
+        if self._stale_timer is not None:
+            self._stale_timer()
+            self._stale_timer = None
+
+    async def async_revalidate(self) -> None:
+        """Re-discover fires and refresh overviews after a snapshot start.
+
+        If discovery fails the snapshot's fire list is kept; the refresh
+        then reports the failure (or starts reauthentication) as a normal
+        poll would.
+        """
+        await self.async_rediscover()
+        await self.async_refresh()
+
+    @callback
+    def async_add_fire_listener(self, add_fires: Callable[[list[Fire]], None]) -> Callable[[], None]:
+        """Register a platform callback creating entities for newly found fires.
+
+        Returns:
+            A function removing the callback again.
+
+        """
+        self._fire_adders.append(add_fires)
+        return partial(self._fire_adders.remove, add_fires)
+
+    async def async_rediscover(self, _now: datetime | None = None) -> None:
+        """Check the account for added and removed fires.
+
+        New fires are read once and handed to the platforms' entity
+        callbacks; the devices of fires no longer in the account are
+        removed.  Fires present in both lists are left untouched.  If
+        discovery fails, or returns no usable fires, the known list is
+        kept.
+        """
+        try:
+            all_fires = await self._async_api_call("get_fires", self.client.get_fires)
+        except (FlameConnectError, aiohttp.ClientError, TimeoutError) as err:
+            LOGGER.debug("Re-discovering fires failed, keeping the known list: %s", err)
+            return
+        fires = [fire for fire in all_fires if fire is not None and fire.fire_id]
+        if not fires:
+            LOGGER.debug("Re-discovery returned no fires, keeping the known list")
+            return
+        known = {fire.fire_id for fire in self.fires}
+        current = {fire.fire_id for fire in fires}
+        added = [fire for fire in fires if fire.fire_id not in known]
+        removed = known - current
+        self.fires = fires
+        for fire_id in removed:
+            LOGGER.info("Fire %s is no longer in the account, removing it", fire_id)
+            self._forget_fire(fire_id)
+        if removed:
+            self._async_push_data()
+        if added:
+            LOGGER.info("Discovered %d new fire(s): %s", len(added), ", ".join(f.friendly_name for f in added))
+            await self.async_refresh_fires({fire.fire_id for fire in added})
+            for add_fires in self._fire_adders:
+                add_fires(added)
+
+    @callback
+    def _forget_fire(self, fire_id: str) -> None:
+        """Drop all state for a vanished fire and remove its device."""
+        for key in [key for key in self._debounce_timers if key[0] == fire_id]:
+            self._debounce_timers.pop(key)()
+        for key in [key for key in self._confirm_timers if key[0] == fire_id]:
+            self._confirm_timers.pop(key)()
+        for param_state in (
+            self._pending_writes,
+            self._debounce_started,
+            self._overlays,
+            self._overlay_written_at,
+            self._overlay_inflight,
+        ):
+            for key in [key for key in param_state if key[0] == fire_id]:
+                del param_state[key]
+        for event in EXPIRY_EVENTS:
+            self.expiry_scheduler.cancel(fire_id, event)
+            self._expiry_durations.pop((fire_id, event), None)
+            self._expired_countdowns.pop((fire_id, event), None)
+        for state in (
+            self._base_data,
+            self._base_read_at,
+            self._heat_mode_before_boost,
+            self.timer_durations,
+            self.boost_durations,
+            self._write_locks,
+            self._preempted_fires,
+            self._handoff_overviews,
+        ):
+            state.pop(fire_id, None)
+        self._handoff_no_wifi.discard(fire_id)
+        self._overview_reads.forget(fire_id)
+        if self.write_queue is not None:
+            self.write_queue.discard_fire(fire_id)
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, fire_id)})
+        if device is not None:
+            device_registry.async_update_device(device.id, remove_config_entry_id=self.config_entry.entry_id)
+
+    async def _async_discover_fires(self) -> None:
+        """Fetch the account's fires into ``self.fires``."""
+        all_fires = await self._async_api_call("get_fires", self.client.get_fires)
+        fires = [fire for fire in all_fires if fire is not None and fire.fire_id]
+        skipped = len(all_fires) - len(fires)
         if skipped:
             LOGGER.warning(
                 "Skipped %d fire(s) with missing or empty fire ID",
                 skipped,
             )
-        if not self.fires:
+        if not fires:
             raise UpdateFailed("No fires with valid fire IDs found in account")
+        self.fires = fires
         for fire in self.fires:
             enabled_features = [f.name for f in dataclasses.fields(fire.features) if getattr(fire.features, f.name)]
             LOGGER.debug(
@@ -111,12 +493,30 @@ async def _async_setup(self) -> None:
             )
 
     async def _async_update_data(self) -> dict[str, FireOverview]:
-        """Fetch overview data for every discovered fire."""
+        """Fetch overview data for every discovered fire.
+
+        User-initiated writes take priority over this background poll:
+        if a write is in flight when the next fire is due, the remaining
+        fires keep their previous data and are re-read once the writes
+        have finished.
+        """
+        read_started: dict[str, float] = {}
         try:
             result: dict[str, FireOverview] = {}
-            for fire in self.fires:
+            for index, fire in enumerate(self.fires):
+                if self._active_writes:
+                    self._preempt_poll([f.fire_id for f in self.fires[index:]], result)
+                    break
+                if fire.fire_id in self._handoff_no_wifi:
+                    self._handoff_no_wifi.discard(fire.fire_id)
+                    LOGGER.debug("Fire %s (%s) has no WiFi overview, skipping", fire.friendly_name, fire.fire_id)
+                    continue
                 try:
-                    overview = await self.client.get_fire_overview(fire.fire_id)
+                    handed_off = self._handoff_overviews.pop(fire.fire_id, None)
+                    if handed_off is not None:
+                        overview, read_started[fire.fire_id] = handed_off
+                    else:
+                        overview, read_started[fire.fire_id] = await self._async_read_overview(fire.fire_id)
                 except (TypeError, KeyError):
                     LOGGER.debug(
                         "Fire %s (%s) has no WiFi overview, skipping",
@@ -147,7 +547,178 @@ async def _async_update_data(self) -> dict[str, FireOverview]:
         else:
             if not result:
                 raise UpdateFailed("All fire overviews returned empty data")
-            return result
+            for fire_id, started in read_started.items():
+                if fire_id not in result:
+                    continue
+                if self._base_read_at.get(fire_id, started) > started:
+                    # A write or confirmation read fetched this fire while
+                    # the poll was running; keep the newer data.
+                    result[fire_id] = self._base_data[fire_id]
+                else:
+                    self._base_read_at[fire_id] = started
+            self._base_data = result
+            self.stale = False
+            self._cancel_stale_window()
+            self.startup_cache.save(self.fires, result)
+            self._expire_confirmed_overlays(read_started)
+            if self.write_queue is not None and len(self.write_queue):
+                # The cloud is answering again: replay straight away.
+                self._schedule_replay(0)
+            return self._compose_data(result)
+
+    def _preempt_poll(self, fire_ids: list[str], result: dict[str, FireOverview]) -> None:
+        """Cut a background poll short in favour of in-flight writes.
+
+        *fire_ids* keep their previous data in *result* and are re-read
+        once the last write finishes.
+        """
+        LOGGER.debug("Writes in flight, deferring poll of %d fire(s)", len(fire_ids))
+        self.preempted_polls += 1
+        for fire_id in fire_ids:
+            if fire_id in self._base_data:
+                result[fire_id] = self._base_data[fire_id]
+            self._preempted_fires[fire_id] = None
+
+    async def async_refresh_fires(self, fire_ids: Iterable[str], *, yield_to_writes: bool = False) -> None:
+        """Re-read *fire_ids* and push their overviews to entities.
+
+        Overlays of completed writes to these fires are settled by the
+        fresh data, so a single call can confirm several unconfirmed
+        writes at once.  With *yield_to_writes*, the re-read stops like a
+        background poll when a write is in flight, and the remaining fires
+        are re-read once the writes have finished.
+        """
+        pending = list(fire_ids)
+        for index, fire_id in enumerate(pending):
+            if yield_to_writes and self._active_writes:
+                LOGGER.debug("Writes in flight, deferring re-read of %d fire(s)", len(pending) - index)
+                for deferred in pending[index:]:
+                    self._preempted_fires[deferred] = None
+                break
+            try:
+                overview, read_started = await self._async_read_overview(fire_id)
+            except (FlameConnectError, aiohttp.ClientError, TimeoutError, TypeError, KeyError) as err:
+                LOGGER.debug("Re-reading fire %s failed: %s", fire_id, err)
+                continue
+            if overview is not None:
+                self._store_overview(fire_id, overview, read_started)
+                self._expire_confirmed_overlays({fire_id: read_started})
+        self._async_push_data()
+
+    async def async_read_fire(self, fire_id: str) -> FireOverview:
+        """Re-read *fire_id*, push it to entities and return the API-reported overview.
+
+        Like ``async_refresh_fires`` for one fire, but a failed read is
+        raised and the returned overview has no pending overlays applied.
+        """
+        overview, read_started = await self._async_read_overview(fire_id)
+        self._store_overview(fire_id, overview, read_started)
+        self._expire_confirmed_overlays({fire_id: read_started})
+        self._async_push_data()
+        return self._base_data[fire_id]
+
+    async def _async_read_overview(self, fire_id: str) -> tuple[FireOverview, float]:
+        """Read *fire_id*, sharing a read of the same fire already in flight.
+
+        Writes make later callers start a fresh read, so a read-modify-write
+        never builds on a read that began before an earlier write landed.
+
+        Returns:
+            The overview and the monotonic time the shared read started.
+
+        """
+        return await self._overview_reads.async_call(fire_id, partial(self._async_timed_read, fire_id))
+
+    async def _async_timed_read(self, fire_id: str) -> tuple[FireOverview, float]:
+        """Read *fire_id* and note when the request was sent."""
+        read_started = 0.0
+
+        async def _read() -> FireOverview:
+            nonlocal read_started
+            read_started = monotonic()
+            return await self.client.get_fire_overview(fire_id)
+
+        overview = await self._async_api_call("get_fire_overview", _read)
+        return overview, read_started
+
+    async def _async_api_call[T](
+        self,
+        operation: str,
+        call: Callable[[], Awaitable[T]],
+        *,
+        interactive: bool = True,
+    ) -> T:
+        """Await the client *call* within the timeout budget of *operation*.
+
+        The call first waits for the shared rate limiter.  Writes are
+        given priority unless *interactive* is False; reads only while a
+        user-initiated write is in flight (e.g. the read before it).
+
+        A call still running at the deadline, including time spent waiting
+        for the limiter, is cancelled, so locks held around it are
+        released, and ``CallTimeoutError`` is raised.
+        """
+
+        async def _limited_call() -> T:
+            if self.rate_limiter is not None:
+                if operation in WRITE_OPERATIONS:
+                    await self.rate_limiter.async_acquire("write", priority=interactive)
+                else:
+                    await self.rate_limiter.async_acquire("read", priority=interactive and bool(self._active_writes))
+            return await call()
+
+        return await self._async_within(operation, self.call_timeouts[operation], _limited_call)
+
+    async def _async_within[T](self, operation: str, timeout: float, call: Callable[[], Awaitable[T]]) -> T:
+        """Await *call* within *timeout* seconds, counting calls that time out."""
+        try:
+            return await async_call_with_timeout(operation, timeout, call)
+        except CallTimeoutError:
+            self.call_timeouts_hit += 1
+            raise
+
+    async def _async_read_for_write(self, fire_id: str) -> tuple[FireOverview, float]:
+        """Read *fire_id* under its write lock, within the write budget.
+
+        A read shared with a slower caller (e.g. a poll) is only waited on
+        for the write budget; the shared read itself carries on.
+        """
+        return await self._async_within(
+            "get_fire_overview",
+            self.call_timeouts["write_parameters"],
+            partial(self._async_read_overview, fire_id),
+        )
+
+    def _store_overview(self, fire_id: str, overview: FireOverview, read_started: float) -> None:
+        """Record *overview* as the latest API data for *fire_id*."""
+        if self._base_read_at.get(fire_id, read_started) > read_started:
+            return
+        self._base_data[fire_id] = overview
+        self._base_read_at[fire_id] = read_started
+
+    @asynccontextmanager
+    async def _async_priority_write(self) -> AsyncIterator[None]:
+        """Mark a user-initiated write as in flight.
+
+        Background polls yield to writes between fires.  When the last
+        write finishes, any fires a poll skipped are re-read, and that
+        re-read yields to later writes in the same way.
+        """
+        self._active_writes += 1
+        try:
+            yield
+        finally:
+            self._active_writes -= 1
+            if not self._active_writes and self._preempted_fires:
+                fire_ids = list(self._preempted_fires)
+                self._preempted_fires.clear()
+                self.hass.async_create_task(self.async_refresh_fires(fire_ids, yield_to_writes=True))
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, FireOverview]) -> None:
+        """Treat externally supplied data as API data and re-apply overlays."""
+        self._base_data = dict(data)
+        super().async_set_updated_data(self._compose_data(self._base_data))
 
     # ------------------------------------------------------------------
     # Centralised write helpers
@@ -161,63 +732,248 @@ async def async_write_fields(
     ) -> None:
         """Read-modify-write a parameter under the per-fire lock.
 
-        Acquires the lock for *fire_id*, fetches a fresh overview from
-        the API, applies *changes* via ``dataclasses.replace``, writes
-        back, then immediately pushes the written values into
-        ``coordinator.data`` so entities reflect the new state without
-        waiting for the confirmation refresh.  A follow-up
-        ``async_request_refresh`` re-reads the API to confirm (or
-        correct) the optimistic state.
+        The requested *changes* are overlaid onto ``coordinator.data``
+        straight away so entities reflect the new state before the
+        network round-trip.  The lock for *fire_id* is then acquired, a
+        fresh overview fetched from the API, *changes* applied via
+        ``dataclasses.replace`` and written back.  A follow-up targeted
+        re-read of *fire_id* confirms (or corrects) the overlay.  If the
+        write fails the overlay is rolled back and the error re-raised.
+
+        When the freshly read parameter already holds the requested
+        values (e.g. an automation re-asserting state) the write and the
+        confirmation read are skipped and counted in ``skipped_writes``.
 
         Any pending debounced writes for the same ``(fire_id, param_type)``
         are absorbed into this write so they are not lost.
         """
+        await self.async_write_batch(fire_id, {param_type: changes})
+
+    async def async_write_batch(
+        self,
+        fire_id: str,
+        changes: dict[type[Parameter], dict[str, Any]],
+        *,
+        confirm: bool = True,
+    ) -> None:
+        """Write changes to several parameters of a fire in one request.
+
+        Behaves like ``async_write_fields`` for each parameter type in
+        *changes*, but shares a single read, a single
+        ``write_parameters`` call and a single confirmation read.
+        Parameters that already hold the requested values are left out
+        of the write.
+
+        With *confirm* False the confirmation read is skipped; the caller
+        is expected to settle the overlays with ``async_refresh_fires``.
+        """
+        changes = {
+            param_type: self._absorb_pending(fire_id, param_type, fields) for param_type, fields in changes.items()
+        }
+        async with self._async_priority_write():
+            await self._async_write_batch_now(fire_id, changes, confirm=confirm)
+
+    def _absorb_pending(
+        self,
+        fire_id: str,
+        param_type: type[Parameter],
+        changes: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Merge and cancel any pending debounced write for the same parameter."""
         key = (fire_id, param_type)
         pending = self._pending_writes.pop(key, None)
-        if pending is not None:
-            cancel = self._debounce_timers.pop(key, None)
-            if cancel is not None:
-                cancel()
-            # Explicit changes are the base; pending user input wins on conflict.
-            merged = dict(changes)
-            merged.update(pending)
-            changes = merged
-
-        async with self._write_locks[fire_id]:
-            overview = await self.client.get_fire_overview(fire_id)
-            param = next(p for p in overview.parameters if isinstance(p, param_type))
-            new_param = dataclasses.replace(param, **changes)
-            await self.client.write_parameters(fire_id, [new_param])
-        self._apply_optimistic_param_update(fire_id, param_type, new_param, overview)
-        await self.async_request_refresh()
+        self._debounce_started.pop(key, None)
+        if pending is None:
+            return changes
+        cancel = self._debounce_timers.pop(key, None)
+        if cancel is not None:
+            cancel()
+        # Last value wins: the explicit changes were requested after
+        # the pending ones, so they take precedence on conflict.
+        return {**pending, **changes}
+
+    async def _async_write_batch_now(
+        self,
+        fire_id: str,
+        changes: dict[type[Parameter], dict[str, Any]],
+        *,
+        confirm: bool,
+    ) -> None:
+        """Perform the overlay, read-modify-write and confirmation steps."""
+        for param_type, fields in changes.items():
+            key = (fire_id, param_type)
+            self._cancel_confirm(key)
+            self._set_overlay(fire_id, param_type, fields)
+            self._overlay_inflight[key] += 1
+        try:
+            async with self._write_locks[fire_id]:
+                try:
+                    written = await self._async_write_from_fresh_read(fire_id, changes)
+                except ApiError as err:
+                    if not is_version_conflict(err):
+                        raise
+                    LOGGER.debug("Fire %s reported a version conflict, re-reading before retrying", fire_id)
+                    written = await self._async_write_from_fresh_read(fire_id, changes)
+        except Exception as err:
+            if self._queue_offline_write(fire_id, changes, err):
+                return
+            for param_type, fields in changes.items():
+                self._rollback_overlay(fire_id, param_type, fields, err)
+            raise
+        finally:
+            for param_type in changes:
+                self._overlay_inflight[(fire_id, param_type)] -= 1
+        for param_type, fields in changes.items():
+            if self.write_queue is not None:
+                self.write_queue.discard(fire_id, param_type, fields)
+            if param_type in written:
+                self._mark_overlay_written(fire_id, param_type)
+                continue
+            self.skipped_writes += 1
+            LOGGER.debug(
+                "Fire %s already has the requested %s values, skipping write",
+                fire_id,
+                param_type.__name__,
+            )
+            self._clear_overlay(fire_id, param_type)
+        if written and confirm:
+            await self._async_confirm_writes(
+                fire_id, {param_type: fields for param_type, fields in changes.items() if param_type in written}
+            )
+
+    async def _async_write_from_fresh_read(
+        self,
+        fire_id: str,
+        changes: dict[type[Parameter], dict[str, Any]],
+    ) -> list[type[Parameter]]:
+        """Read *fire_id*, apply *changes* and write the parameters back.
+
+        Transient write failures are re-sent from the same read by the
+        retry policy; a full parameter write is idempotent.  The time the
+        read and the successful write attempt spent on the wire (not
+        rate-limiter waits or retry backoff) feeds ``write_rtt``.
+
+        Returns:
+            The parameter types written.  Parameters that already held
+            the requested values are left out; if none remain no write
+            is made.
+
+        Raises:
+            ServiceValidationError: If the fire does not report one of the
+                parameters in *changes*; nothing is written then.
+
+        """
+        overview, read_started = await self._async_read_for_write(fire_id)
+        read_rtt = monotonic() - read_started
+        self._store_overview(fire_id, overview, read_started)
+        new_params = []
+        for param_type, fields in changes.items():
+            param = next((p for p in overview.parameters if isinstance(p, param_type)), None)
+            if param is None:
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key="parameter_unsupported",
+                    translation_placeholders={"fire_id": fire_id, "parameter": param_type.__name__},
+                )
+            new_param = dataclasses.replace(param, **fields)
+            if new_param != param:
+                new_params.append(new_param)
+        if new_params:
+            sent_at = 0.0
+
+            async def _write() -> None:
+                nonlocal sent_at
+                sent_at = monotonic()
+                await self.client.write_parameters(fire_id, new_params)
+
+            try:
+                await self.retry_policy.async_call(partial(self._async_api_call, "write_parameters", _write))
+            finally:
+                self._overview_reads.forget(fire_id)
+            self._record_write_rtt(read_rtt + monotonic() - sent_at)
+        return [type(param) for param in new_params]
+
+    def _record_write_rtt(self, rtt: float) -> None:
+        """Fold a read-modify-write round-trip time into the smoothed estimate."""
+        if self.write_rtt is None:
+            self.write_rtt = rtt
+        else:
+            self.write_rtt += WRITE_RTT_SMOOTHING * (rtt - self.write_rtt)
+
+    @property
+    def debounce_delay(self) -> float:
+        """Return the quiet period for debounced writes.
+
+        ``DEBOUNCE_RTT_FACTOR`` times the smoothed write round-trip time,
+        so a burst arriving slower than a write completes is still
+        coalesced, clamped to the configured bounds.  ``DEBOUNCE_DELAY``
+        is used until a write has been timed.
+        """
+        if self.write_rtt is None:
+            return DEBOUNCE_DELAY
+        return min(self._debounce_max_delay, max(self._debounce_min_delay, DEBOUNCE_RTT_FACTOR * self.write_rtt))
+
+    async def async_reconcile(
+        self,
+        fire_id: str,
+        changes: dict[type[Parameter], dict[str, Any]],
+        *,
+        power: bool | None = None,
+    ) -> ReconcileResult:
+        """Converge *fire_id* on a desired state with the fewest writes.
+
+        Only fields differing from ``coordinator.data`` are written, in
+        one batch per round, and the fire is re-read after each round.
+        See ``reconcile.async_reconcile``.
+        """
+        return await async_reconcile(self, fire_id, changes, power)
 
     async def async_write_fields_debounced(
         self,
         fire_id: str,
         param_type: type[Parameter],
-        delay: float = 1.0,
+        delay: float | None = None,
+        max_wait: float | None = None,
         **changes: Any,
     ) -> None:
         """Accumulate field changes and flush after *delay* seconds.
 
         Repeated calls within the delay window merge their changes so
         only a single API write is performed with the final values
-        (e.g. rapid slider increments).
+        (e.g. rapid slider increments).  *delay* defaults to the adaptive
+        ``debounce_delay``.
+
+        The quiet period restarts on every call, but pending changes are
+        never held back longer than *max_wait* seconds after the first
+        change of the burst, so continuous input (a slider being dragged,
+        an automation ramping a value) still reaches the fireplace
+        periodically.  *max_wait* defaults to the per-parameter-type
+        ceiling in ``DEBOUNCE_MAX_WAIT``.
         """
+        if delay is None:
+            delay = self.debounce_delay
+        if max_wait is None:
+            max_wait = DEBOUNCE_MAX_WAIT.get(param_type, DEFAULT_DEBOUNCE_MAX_WAIT)
+
         key = (fire_id, param_type)
         pending = self._pending_writes.get(key)
         if pending is not None:
             pending.update(changes)
         else:
             self._pending_writes[key] = dict(changes)
+        self._set_overlay(fire_id, param_type, changes)
 
         cancel = self._debounce_timers.get(key)
         if cancel is not None:
             cancel()
 
+        now = monotonic()
+        started = self._debounce_started.setdefault(key, now)
+        remaining = max(0.0, started + max_wait - now)
+
         self._debounce_timers[key] = async_call_later(
             self.hass,
-            delay,
+            min(delay, remaining),
             partial(self._flush_debounced_write, fire_id, param_type),
         )
 
@@ -232,6 +988,7 @@ def _flush_debounced_write(
         key = (fire_id, param_type)
         changes = self._pending_writes.pop(key, None)
         self._debounce_timers.pop(key, None)
+        self._debounce_started.pop(key, None)
         if changes:
             self.hass.async_create_task(self.async_write_fields(fire_id, param_type, **changes))
 
@@ -242,62 +999,511 @@ async def async_flush_pending_writes(self, fire_id: str) -> None:
             cancel = self._debounce_timers.pop(key, None)
             if cancel is not None:
                 cancel()
+            self._debounce_started.pop(key, None)
             changes = self._pending_writes.pop(key, None)
             if changes:
                 await self.async_write_fields(key[0], key[1], **changes)
 
-    async def async_turn_on_fire(self, fire_id: str) -> None:
+    async def async_drain_pending_writes(self) -> None:
+        """Flush every pending debounced write before shutting down.
+
+        Pending changes are sent as one batched write per fire, all fires
+        in parallel, without confirmation reads.  Writes still running
+        after ``SHUTDOWN_DRAIN_TIMEOUT`` are cancelled and logged.
+        """
+        for cancel in self._debounce_timers.values():
+            cancel()
+        self._debounce_timers.clear()
+        self._debounce_started.clear()
+        batches: defaultdict[str, dict[type[Parameter], dict[str, Any]]] = defaultdict(dict)
+        for (fire_id, param_type), changes in self._pending_writes.items():
+            if changes:
+                batches[fire_id][param_type] = changes
+        self._pending_writes.clear()
+        if not batches:
+            return
+
+        outstanding = set(batches)
+
+        async def _drain_fire(fire_id: str) -> None:
+            try:
+                await self.async_write_batch(fire_id, batches[fire_id], confirm=False)
+            except (FlameConnectError, aiohttp.ClientError, TimeoutError) as err:
+                LOGGER.warning("Writing pending changes to fire %s on shutdown failed: %s", fire_id, err)
+            outstanding.discard(fire_id)
+
+        started = monotonic()
+        try:
+            async with asyncio.timeout(SHUTDOWN_DRAIN_TIMEOUT):
+                await asyncio.gather(*(_drain_fire(fire_id) for fire_id in batches))
+        except TimeoutError:
+            for fire_id in sorted(outstanding):
+                LOGGER.warning(
+                    "Abandoned pending %s changes to fire %s after %d seconds on shutdown",
+                    ", ".join(param_type.__name__ for param_type in batches[fire_id]),
+                    fire_id,
+                    SHUTDOWN_DRAIN_TIMEOUT,
+                )
+        self.last_drain_duration = round(monotonic() - started, 3)
+        LOGGER.debug("Drained pending writes for %d fire(s) in %.3f s", len(batches), self.last_drain_duration)
+
+    async def async_turn_on_fire(self, fire_id: str, *, confirm: bool = True) -> None:
         """Flush pending writes, then turn the fire on under lock."""
         await self.async_flush_pending_writes(fire_id)
-        async with self._write_locks[fire_id]:
-            await self.client.turn_on(fire_id)
-        self._apply_optimistic_mode_update(fire_id, FireMode.MANUAL)
-        await self.async_request_refresh()
+        await self._async_set_mode(fire_id, FireMode.MANUAL, "turn_on", confirm=confirm)
 
-    async def async_turn_off_fire(self, fire_id: str) -> None:
+    async def async_turn_off_fire(self, fire_id: str, *, confirm: bool = True) -> None:
         """Flush pending writes, then turn the fire off under lock."""
         await self.async_flush_pending_writes(fire_id)
-        async with self._write_locks[fire_id]:
-            await self.client.turn_off(fire_id)
-        self._apply_optimistic_mode_update(fire_id, FireMode.STANDBY)
-        await self.async_request_refresh()
+        await self._async_set_mode(fire_id, FireMode.STANDBY, "turn_off", confirm=confirm)
+
+    async def _async_set_mode(
+        self,
+        fire_id: str,
+        mode: FireMode,
+        operation: Literal["turn_on", "turn_off"],
+        *,
+        confirm: bool,
+    ) -> None:
+        """Overlay the expected fire mode, then send the on/off *operation*.
+
+        Transient failures are retried by the retry policy.  The
+        library's turn_on/turn_off read the overview themselves, so each
+        retry includes that read.
+        """
+        key = (fire_id, ModeParam)
+        async with self._async_priority_write():
+            self._cancel_confirm(key)
+            self._set_overlay(fire_id, ModeParam, {"mode": mode})
+            self._overlay_inflight[key] += 1
+            try:
+                async with self._write_locks[fire_id]:
+                    try:
+                        send = partial(getattr(self.client, operation), fire_id)
+                        await self.retry_policy.async_call(partial(self._async_api_call, operation, send))
+                    finally:
+                        self._overview_reads.forget(fire_id)
+            except Exception as err:
+                if self._queue_offline_write(fire_id, {ModeParam: {"mode": mode}}, err):
+                    return
+                self._rollback_overlay(fire_id, ModeParam, {"mode": mode}, err)
+                raise
+            finally:
+                self._overlay_inflight[key] -= 1
+            if self.write_queue is not None:
+                self.write_queue.discard(fire_id, ModeParam, {"mode": mode})
+            self._mark_overlay_written(fire_id, ModeParam)
+            if confirm:
+                await self._async_confirm_writes(fire_id, {ModeParam: {"mode": mode}})
+
+    # ------------------------------------------------------------------
+    # Write confirmation
+    # ------------------------------------------------------------------
+
+    async def _async_confirm_writes(
+        self,
+        fire_id: str,
+        expected: dict[type[Parameter], dict[str, Any]],
+        attempt: int = 0,
+    ) -> None:
+        """Re-read *fire_id* and check that it reports the *expected* values.
+
+        Only the written fire is fetched, once for all written parameter
+        types.  While the cloud has not caught up the read is retried
+        after each delay in ``CONFIRM_RETRY_DELAYS``; once the budget is
+        spent the mismatch is recorded and the reported state shown.
+        """
+        overview: FireOverview | None = None
+        try:
+            overview, read_started = await self._async_read_overview(fire_id)
+        except (FlameConnectError, aiohttp.ClientError, TimeoutError, TypeError, KeyError) as err:
+            LOGGER.debug("Confirmation read for fire %s failed: %s", fire_id, err)
+        else:
+            self._store_overview(fire_id, overview, read_started)
+        for param_type, fields in expected.items():
+            self._check_write_confirmed(fire_id, param_type, fields, overview, attempt)
+
+    def _check_write_confirmed(
+        self,
+        fire_id: str,
+        param_type: type[Parameter],
+        expected: dict[str, Any],
+        overview: FireOverview | None,
+        attempt: int,
+    ) -> None:
+        """Clear a confirmed overlay, or schedule the next confirmation read."""
+        reported: Parameter | None = None
+        if overview is not None:
+            reported = next((p for p in overview.parameters if isinstance(p, param_type)), None)
+            if reported is not None and all(getattr(reported, name) == value for name, value in expected.items()):
+                self._clear_overlay(fire_id, param_type)
+                return
+
+        key = (fire_id, param_type)
+        if attempt < len(CONFIRM_RETRY_DELAYS):
+            self._confirm_timers[key] = async_call_later(
+                self.hass,
+                CONFIRM_RETRY_DELAYS[attempt],
+                partial(self._retry_confirm_write, fire_id, param_type, expected, attempt + 1),
+            )
+            self._async_push_data()
+            return
+
+        self.write_mismatches += 1
+        self.last_write_mismatch = {
+            "parameter": param_type.__name__,
+            "expected": {name: str(value) for name, value in expected.items()},
+            "reported": ({name: str(getattr(reported, name)) for name in expected} if reported is not None else None),
+        }
+        LOGGER.warning(
+            "Fire %s did not confirm %s change %s after %d reads; showing reported state",
+            fire_id,
+            param_type.__name__,
+            expected,
+            attempt + 1,
+        )
+        self._clear_overlay(fire_id, param_type)
+
+    @callback
+    def _retry_confirm_write(
+        self,
+        fire_id: str,
+        param_type: type[Parameter],
+        expected: dict[str, Any],
+        attempt: int,
+        _now: datetime,
+    ) -> None:
+        """Run the next confirmation read attempt."""
+        self._confirm_timers.pop((fire_id, param_type), None)
+        self.hass.async_create_task(self._async_confirm_writes(fire_id, {param_type: expected}, attempt))
+
+    @callback
+    def _cancel_confirm(self, key: tuple[str, type[Parameter]]) -> None:
+        """Cancel a scheduled confirmation retry superseded by a new write."""
+        cancel = self._confirm_timers.pop(key, None)
+        if cancel is not None:
+            cancel()
+
+    # ------------------------------------------------------------------
+    # Pending overlay
+    # ------------------------------------------------------------------
+
+    def _compose_data(self, base: dict[str, FireOverview]) -> dict[str, FireOverview]:
+        """Return a copy of *base* with applied expiries and pending overlays."""
+        data = dict(base)
+        for (fire_id, event), duration in self._expired_countdowns.items():
+            overview = data.get(fire_id)
+            if overview is not None and countdown_minutes(overview, event) == duration:
+                data[fire_id] = predict_expiry(
+                    overview, event, self._heat_mode_before_boost.get(fire_id, HeatMode.NORMAL)
+                )
+        for (fire_id, param_type), fields in self._overlays.items():
+            overview = data.get(fire_id)
+            if overview is None:
+                continue
+            params: list[Parameter] = [
+                dataclasses.replace(p, **fields) if isinstance(p, param_type) else p for p in overview.parameters
+            ]
+            data[fire_id] = dataclasses.replace(overview, parameters=params)
+        return data
+
+    @callback
+    def _async_push_data(self) -> None:
+        """Recompose ``coordinator.data`` and notify entities.
+
+        Unlike ``async_set_updated_data`` this does not reschedule the
+        next poll; only the overlay layer changed.
+        """
+        if self.data is None:
+            return
+        self.data = self._compose_data(self._base_data)
+        self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Track countdown expiries in the new data, then notify entities."""
+        self._track_expiries()
+        super().async_update_listeners()
+
+    @callback
+    def _track_expiries(self) -> None:
+        """Schedule or cancel expiry transitions to match ``coordinator.data``.
+
+        An end time is computed when a countdown starts or its duration
+        changes, and dropped once it is no longer running.  Applied
+        expiries are forgotten once the API data no longer reports the
+        countdown that expired.
+        """
+        for key, duration in list(self._expired_countdowns.items()):
+            base = self._base_data.get(key[0])
+            if base is None or countdown_minutes(base, key[1]) != duration:
+                del self._expired_countdowns[key]
+        now = dt_util.utcnow()
+        for fire_id, overview in (self.data or {}).items():
+            heat = get_param(overview, HeatParam)
+            if heat is not None and heat.heat_mode != HeatMode.BOOST:
+                self._heat_mode_before_boost[fire_id] = heat.heat_mode
+            for event in EXPIRY_EVENTS:
+                key = (fire_id, event)
+                duration = countdown_minutes(overview, event)
+                if duration is None:
+                    self._cancel_expiry(key)
+                elif duration != self._expiry_durations.get(key):
+                    self._expiry_durations[key] = duration
+                    self.expiry_scheduler.schedule(fire_id, event, now + timedelta(minutes=duration))
+
+    @property
+    def expiries(self) -> dict[tuple[str, str], datetime]:
+        """Return the predicted end time of each running countdown."""
+        return self.expiry_scheduler.events
+
+    @callback
+    def _cancel_expiry(self, key: tuple[str, str]) -> None:
+        """Forget the predicted expiry for *key*."""
+        self.expiry_scheduler.cancel(*key)
+        self._expiry_durations.pop(key, None)
+
+    @callback
+    def _apply_expiry(self, fire_id: str, event: str) -> None:
+        """Apply the predicted transition and request a confirmation read."""
+        base = self._base_data.get(fire_id)
+        duration = countdown_minutes(base, event) if base is not None else None
+        if duration is None:
+            return
+        LOGGER.debug("Fire %s %s expired, applying predicted state", fire_id, event)
+        self._expired_countdowns[(fire_id, event)] = duration
+        self._async_push_data()
+        self.expiry_scheduler.request_refresh(fire_id, EXPIRY_CONFIRM_DELAY)
+
+    @callback
+    def _set_overlay(self, fire_id: str, param_type: type[Parameter], changes: dict[str, Any]) -> None:
+        """Show *changes* to entities immediately, pending confirmation."""
+        key = (fire_id, param_type)
+        self._overlays.setdefault(key, {}).update(changes)
+        # A new change supersedes any earlier write awaiting confirmation,
+        # and any expiry of a countdown it affects.
+        self._overlay_written_at.pop(key, None)
+        for event, param_types in EXPIRY_PARAMS.items():
+            if param_type in param_types:
+                self._expired_countdowns.pop((fire_id, event), None)
+        self._async_push_data()
+
+    @callback
+    def _mark_overlay_written(self, fire_id: str, param_type: type[Parameter]) -> None:
+        """Record that the overlay for *param_type* has reached the API."""
+        key = (fire_id, param_type)
+        if key in self._overlays and key not in self._pending_writes and not self._overlay_inflight[key]:
+            self._overlay_written_at[key] = monotonic()
+        self._async_push_data()
 
     @callback
-    def _apply_optimistic_param_update(
+    def _clear_overlay(self, fire_id: str, param_type: type[Parameter]) -> None:
+        """Drop the overlay for *param_type* once the API already matches it."""
+        key = (fire_id, param_type)
+        if key not in self._pending_writes and not self._overlay_inflight[key]:
+            self._overlays.pop(key, None)
+            self._overlay_written_at.pop(key, None)
+        self._async_push_data()
+
+    @callback
+    def _rollback_overlay(
         self,
         fire_id: str,
         param_type: type[Parameter],
-        new_param: Parameter,
-        base_overview: FireOverview,
+        changes: dict[str, Any],
+        err: Exception,
     ) -> None:
-        """Push the just-written parameter into coordinator data immediately.
+        """Remove the overlay for a failed write and restore API values.
+
+        Fields changed again since the failed write started keep their
+        newer overlay value.
+        """
+        LOGGER.warning(
+            "Writing %s to fire %s failed, reverting to last known state: %s",
+            param_type.__name__,
+            fire_id,
+            err,
+        )
+        key = (fire_id, param_type)
+        fields = self._overlays.get(key)
+        if fields is not None:
+            for name, value in changes.items():
+                if name in fields and fields[name] == value:
+                    del fields[name]
+            if not fields:
+                del self._overlays[key]
+                self._overlay_written_at.pop(key, None)
+        self._async_push_data()
+
+    def _expire_confirmed_overlays(self, read_started: dict[str, float]) -> None:
+        """Drop overlays whose write completed before their fire was re-read.
+
+        The freshly read values are authoritative from then on: they
+        either confirm the overlay or show that the fireplace did not
+        accept the change.
+        """
+        for key, written_at in list(self._overlay_written_at.items()):
+            started = read_started.get(key[0])
+            if started is None or written_at > started or key in self._pending_writes:
+                continue
+            fire_id, param_type = key
+            fields = self._overlays.pop(key, {})
+            del self._overlay_written_at[key]
+            overview = self._base_data.get(fire_id)
+            reported = (
+                next((p for p in overview.parameters if isinstance(p, param_type)), None)
+                if overview is not None
+                else None
+            )
+            if reported is not None and any(getattr(reported, f) != v for f, v in fields.items()):
+                LOGGER.debug(
+                    "Fire %s did not confirm %s change %s; using reported state",
+                    fire_id,
+                    param_type.__name__,
+                    fields,
+                )
+
+    # ------------------------------------------------------------------
+    # Offline write queue
+    # ------------------------------------------------------------------
+
+    def _queue_offline_write(
+        self,
+        fire_id: str,
+        changes: dict[type[Parameter], dict[str, Any]],
+        err: Exception,
+    ) -> bool:
+        """Queue a failed write for replay if the cloud looks unreachable.
+
+        Returns:
+            True if the changes were queued; their overlays are kept so
+            entities keep showing the requested values.
 
-        After a successful API write, this replaces the old parameter in
-        the coordinator data with the value we just wrote so entities
-        reflect the new state right away, before the follow-up
-        ``async_request_refresh`` confirms the value from the API.
         """
-        new_params: list[Parameter] = [new_param if isinstance(p, param_type) else p for p in base_overview.parameters]
-        new_overview = dataclasses.replace(base_overview, parameters=new_params)
-        new_data = dict(self.data) if self.data else {}
-        new_data[fire_id] = new_overview
-        self.async_set_updated_data(new_data)
+        if self.write_queue is None or not is_transient_error(err):
+            return False
+        for param_type, fields in changes.items():
+            self.write_queue.enqueue(fire_id, param_type, fields)
+        LOGGER.warning(
+            "Fire %s is unreachable, queued %s change(s) for replay: %s",
+            fire_id,
+            ", ".join(param_type.__name__ for param_type in changes),
+            err,
+        )
+        self._schedule_replay(OFFLINE_QUEUE_RETRY_INTERVAL)
+        self._async_push_data()
+        return True
+
+    def _schedule_replay(self, delay: float) -> None:
+        """Replay the offline queue after *delay* seconds."""
+        if self._replay_timer is not None:
+            if delay:
+                return
+            self._replay_timer()
+        self._replay_timer = async_call_later(self.hass, delay, self._replay_queue_later)
 
     @callback
-    def _apply_optimistic_mode_update(self, fire_id: str, mode: FireMode) -> None:
-        """Update coordinator data with expected fire mode after turn on/off."""
-        if self.data is None or fire_id not in self.data:
+    def _replay_queue_later(self, _now: datetime) -> None:
+        self._replay_timer = None
+        self.hass.async_create_task(self.async_replay_queue())
+
+    async def async_replay_queue(self) -> None:
+        """Replay queued changes, one batched write per fire."""
+        if self.write_queue is None:
             return
-        overview = self.data[fire_id]
-        current_mode = next((p for p in overview.parameters if isinstance(p, ModeParam)), None)
-        if current_mode is None:
+        for fire_id in self.write_queue.fire_ids():
+            await self._async_replay_fire(fire_id)
+        if len(self.write_queue):
+            self._schedule_replay(OFFLINE_QUEUE_RETRY_INTERVAL)
+
+    async def _async_replay_fire(self, fire_id: str) -> None:
+        """Write all of a fire's queued changes in a single request."""
+        if self.write_queue is None:
             return
-        self._apply_optimistic_param_update(fire_id, ModeParam, dataclasses.replace(current_mode, mode=mode), overview)
+        intents, expired = self.write_queue.pop(fire_id)
+        written: list[type[Parameter]] = []
+        if intents:
+            async with self._async_priority_write(), self._write_locks[fire_id]:
+                try:
+                    overview, read_started = await self._async_read_for_write(fire_id)
+                    self._store_overview(fire_id, overview, read_started)
+                    params = []
+                    for param in overview.parameters:
+                        intent = intents.get(type(param).__name__)
+                        if intent is None:
+                            continue
+                        new_param = OfflineWriteQueue.apply(param, intent["fields"])
+                        if new_param != param:
+                            params.append(new_param)
+                    if params:
+                        try:
+                            await self._async_api_call(
+                                "write_parameters",
+                                partial(self.client.write_parameters, fire_id, params),
+                                interactive=False,
+                            )
+                        finally:
+                            self._overview_reads.forget(fire_id)
+                        written = [type(param) for param in params]
+                except (FlameConnectError, aiohttp.ClientError, TimeoutError) as err:
+                    if is_transient_error(err):
+                        LOGGER.debug("Fire %s still unreachable, keeping queued changes: %s", fire_id, err)
+                        self.write_queue.requeue(fire_id, intents)
+                        return
+                    LOGGER.warning("Replaying queued changes to fire %s failed, discarding them: %s", fire_id, err)
+        LOGGER.debug("Replayed %d queued change(s) to fire %s", len(written), fire_id)
+        for key in list(self._overlays):
+            if key[0] != fire_id or key[1].__name__ not in (*intents, *expired):
+                continue
+            if key[1] in written:
+                self._mark_overlay_written(*key)
+            else:
+                self._clear_overlay(*key)
+        if written:
+            await self.async_refresh_fires({fire_id})
+        else:
+            self._async_push_data()
+
+    @callback
+    def async_get_diagnostics(self) -> dict[str, Any]:
+        """Return coordinator statistics for config entry diagnostics."""
+        return {
+            "skipped_writes": self.skipped_writes,
+            "preempted_polls": self.preempted_polls,
+            "write_mismatches": self.write_mismatches,
+            "last_write_mismatch": self.last_write_mismatch,
+            "queued_writes": len(self.write_queue) if self.write_queue is not None else 0,
+            "write_retries": self.retry_policy.retries,
+            "retry_budget_exhausted": self.retry_policy.budget_exhausted,
+            "last_drain_duration": self.last_drain_duration,
+            "write_rtt": round(self.write_rtt, 3) if self.write_rtt is not None else None,
+            "debounce_delay": round(self.debounce_delay, 3),
+            "scheduled_events": self.expiry_scheduler.pending(),
+            "overview_reads": self._overview_reads.calls,
+            "overview_read_dedup_hits": self._overview_reads.hits,
+            "call_timeouts": self.call_timeouts_hit,
+        }
 
     async def async_shutdown(self) -> None:
-        """Cancel all debounce timers and shut down."""
-        for cancel in self._debounce_timers.values():
+        """Flush pending writes, cancel confirmation, expiry and replay timers and shut down."""
+        await self.async_drain_pending_writes()
+        self._cancel_stale_window()
+        # Cancelled after draining: a drained write queued for replay
+        # re-arms the timer.
+        if self._replay_timer is not None:
+            self._replay_timer()
+            self._replay_timer = None
+        for cancel in self._confirm_timers.values():
             cancel()
-        self._debounce_timers.clear()
-        self._pending_writes.clear()
+        self._confirm_timers.clear()
+        self.expiry_scheduler.async_shutdown()
+        self._expiry_durations.clear()
+        self._expired_countdowns.clear()
+        self._overlays.clear()
+        self._overlay_written_at.clear()
+        # Saved now rather than after the save delay, so a removed entry's
+        # stores are not written again once deleted.
+        await self.startup_cache.async_flush()
+        if self.write_queue is not None:
+            await self.write_queue.async_flush()
         await super().async_shutdown()
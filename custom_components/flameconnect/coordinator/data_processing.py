@@ -0,0 +1,105 @@
+"""Conversion of FlameConnect data to and from stored JSON."""
+
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+from enum import Enum, IntEnum
+import types
+from typing import TYPE_CHECKING, Any, TypeVar, Union, get_args, get_origin, get_type_hints
+
+import flameconnect
+from flameconnect import FireOverview
+
+if TYPE_CHECKING:
+    from flameconnect import Parameter
+
+_T = TypeVar("_T")
+
+
+def encode_value(value: Any) -> Any:
+    """Convert a field value to a JSON-serialisable value."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: encode_value(getattr(value, field.name)) for field in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    return value
+
+
+def encode_param(param: Parameter) -> dict[str, Any]:
+    """Return every field of *param* as JSON-serialisable values."""
+    return {field.name: encode_value(getattr(param, field.name)) for field in fields(param)}
+
+
+def decode_fields(param: Parameter, stored: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild *stored* field values using the types of *param*'s fields."""
+    decoded = {}
+    for name, value in stored.items():
+        current = getattr(param, name)
+        if is_dataclass(current) and isinstance(value, dict):
+            decoded[name] = type(current)(**value)
+        elif isinstance(current, IntEnum):
+            decoded[name] = type(current)(value)
+        else:
+            decoded[name] = value
+    return decoded
+
+
+def decode_dataclass(cls: type[_T], stored: dict[str, Any]) -> _T:
+    """Rebuild an instance of dataclass *cls* from ``encode_value`` output.
+
+    Raises:
+        TypeError: If *stored* does not match the fields of *cls*.
+        ValueError: If a stored enum value is no longer valid.
+
+    """
+    hints = get_type_hints(cls)
+    return cls(**{name: _decode_value(hints[name], value) for name, value in stored.items()})
+
+
+def _decode_value(hint: Any, value: Any) -> Any:
+    """Rebuild *value* as the type described by *hint*."""
+    if value is None:
+        return None
+    origin = get_origin(hint)
+    if origin in (Union, types.UnionType):
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+        origin = get_origin(hint)
+    if origin is list:
+        (item_hint,) = get_args(hint)
+        return [_decode_value(item_hint, item) for item in value]
+    if isinstance(hint, type):
+        if is_dataclass(hint):
+            return decode_dataclass(hint, value)
+        if issubclass(hint, Enum):
+            return hint(value)
+    return value
+
+
+def encode_overview(overview: FireOverview) -> dict[str, Any]:
+    """Return *overview* as JSON-serialisable values, tagging each parameter type."""
+    stored = {field.name: encode_value(getattr(overview, field.name)) for field in fields(overview)}
+    stored["parameters"] = [
+        {"type": type(param).__name__, "fields": encode_param(param)} for param in overview.parameters
+    ]
+    return stored
+
+
+def decode_overview(stored: dict[str, Any]) -> FireOverview:
+    """Rebuild a ``FireOverview`` stored by ``encode_overview``.
+
+    Raises:
+        TypeError: If the stored data does not match the library's types.
+        ValueError: If a stored enum value is no longer valid.
+
+    """
+    hints = get_type_hints(FireOverview)
+    decoded = {name: _decode_value(hints[name], value) for name, value in stored.items() if name != "parameters"}
+    parameters = []
+    for item in stored["parameters"]:
+        param_type = getattr(flameconnect, item["type"], None)
+        if not isinstance(param_type, type) or not is_dataclass(param_type):
+            raise TypeError(f"Unknown parameter type {item['type']}")
+        parameters.append(decode_dataclass(param_type, item["fields"]))
+    return FireOverview(**decoded, parameters=parameters)
@@ -0,0 +1,132 @@
+"""Classification and retrying of FlameConnect API failures."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from random import uniform
+from time import monotonic
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from custom_components.flameconnect.const import LOGGER
+from flameconnect import ApiError, AuthenticationError, FlameConnectError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class CallTimeoutError(FlameConnectError, TimeoutError):
+    """A FlameConnect API call did not finish within its timeout budget.
+
+    Both a ``FlameConnectError`` and a ``TimeoutError``, so it is handled
+    wherever library errors are and counts as a transient failure.
+
+    Attributes:
+        operation: Name of the client method that timed out.
+        timeout: The budget (seconds) the call was given.
+
+    """
+
+    def __init__(self, operation: str, timeout: float) -> None:
+        """Initialise the error for *operation* cancelled after *timeout* seconds."""
+        super().__init__(f"{operation} did not complete within {timeout:g} s")
+        self.operation = operation
+        self.timeout = timeout
+
+
+async def async_call_with_timeout[T](operation: str, timeout: float, call: Callable[[], Awaitable[T]]) -> T:
+    """Await *call*, cancelling it once *timeout* seconds have passed.
+
+    Raises:
+        CallTimeoutError: If *call* was cancelled at the deadline.
+
+    """
+    deadline = asyncio.timeout(timeout)
+    try:
+        async with deadline:
+            return await call()
+    except TimeoutError as err:
+        if not deadline.expired():
+            raise
+        raise CallTimeoutError(operation, timeout) from err
+
+
+def is_transient_error(err: BaseException) -> bool:
+    """Return True if *err* suggests the cloud is briefly unreachable.
+
+    Server errors (5xx), timeouts and connection failures are transient;
+    authentication failures and client errors (4xx) are not.
+    """
+    if isinstance(err, AuthenticationError):
+        return False
+    if isinstance(err, ApiError):
+        return err.status >= 500
+    return isinstance(err, (aiohttp.ClientError, TimeoutError))
+
+
+def is_version_conflict(err: BaseException) -> bool:
+    """Return True if *err* reports the write was based on stale data."""
+    return isinstance(err, ApiError) and err.status in {409, 412}
+
+
+class RetryPolicy:
+    """Bounded retries with exponential backoff, full jitter and a budget.
+
+    Each call gets at most *attempts* tries; transient failures are
+    retried after a random delay of up to ``base_delay * 2**n`` seconds
+    (capped at *max_delay*).  Retries across all calls are limited to
+    *budget* per *budget_window* seconds so a cloud outage does not turn
+    every write into a burst of requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        attempts: int,
+        base_delay: float,
+        max_delay: float,
+        budget: int,
+        budget_window: float,
+    ) -> None:
+        """Initialise the policy with an unused retry budget."""
+        self._attempts = attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._budget = budget
+        self._budget_window = budget_window
+        self._spent: deque[float] = deque()
+        self.retries = 0
+        self.budget_exhausted = 0
+
+    def _take_budget(self) -> bool:
+        now = monotonic()
+        while self._spent and now - self._spent[0] >= self._budget_window:
+            self._spent.popleft()
+        if len(self._spent) >= self._budget:
+            self.budget_exhausted += 1
+            return False
+        self._spent.append(now)
+        return True
+
+    async def async_call[T](self, call: Callable[[], Awaitable[T]]) -> T:
+        """Await *call*, retrying transient failures.
+
+        Raises:
+            Exception: The last error once attempts or the retry budget
+                run out, or immediately for non-transient errors.
+
+        """
+        attempt = 0
+        while True:
+            try:
+                return await call()
+            except Exception as err:
+                attempt += 1
+                if attempt >= self._attempts or not is_transient_error(err) or not self._take_budget():
+                    raise
+                delay = uniform(0, min(self._max_delay, self._base_delay * 2 ** (attempt - 1)))
+                LOGGER.debug("Retrying in %.2f s after transient error: %s", delay, err)
+                self.retries += 1
+                await asyncio.sleep(delay)
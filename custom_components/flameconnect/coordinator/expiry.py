@@ -0,0 +1,78 @@
+"""Predicted state transitions when a countdown timer or boost ends.
+
+The fireplace changes state on its own when a running countdown timer
+ends (it goes to standby) or when boost mode runs out (heating returns
+to the mode used before boost).  The coordinator applies these known
+transitions locally at the expiry instant, so entities do not show the
+old state until the next read.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, TypeVar
+
+from flameconnect import FireMode, HeatMode, HeatParam, ModeParam, TimerParam, TimerStatus
+
+if TYPE_CHECKING:
+    from flameconnect import FireOverview, Parameter
+
+_T = TypeVar("_T")
+
+EXPIRY_TIMER = "timer"
+EXPIRY_BOOST = "boost"
+EXPIRY_EVENTS = (EXPIRY_TIMER, EXPIRY_BOOST)
+
+# Parameters each expiry changes.  Writing one of them supersedes a
+# predicted expiry still awaiting confirmation.
+EXPIRY_PARAMS: dict[str, tuple[type[Parameter], ...]] = {
+    EXPIRY_TIMER: (TimerParam, ModeParam),
+    EXPIRY_BOOST: (HeatParam,),
+}
+
+
+def get_param(overview: FireOverview, param_type: type[_T]) -> _T | None:
+    """Return the parameter of *param_type* in *overview*, if present."""
+    for param in overview.parameters:
+        if isinstance(param, param_type):
+            return param
+    return None
+
+
+def countdown_minutes(overview: FireOverview, event: str) -> int | None:
+    """Return the duration of the running countdown for *event*.
+
+    Returns:
+        The timer or boost duration in minutes, or None when the timer is
+        disabled or boost is not active.
+
+    """
+    if event == EXPIRY_TIMER:
+        timer = get_param(overview, TimerParam)
+        if timer is not None and timer.timer_status == TimerStatus.ENABLED:
+            return timer.duration
+        return None
+    heat = get_param(overview, HeatParam)
+    if heat is not None and heat.heat_mode == HeatMode.BOOST:
+        return heat.boost_duration
+    return None
+
+
+def predict_expiry(overview: FireOverview, event: str, heat_mode_before_boost: HeatMode) -> FireOverview:
+    """Return *overview* as the fireplace reports it once *event* has expired.
+
+    Timer expiry disables the timer and puts the fire in standby; boost
+    expiry restores *heat_mode_before_boost*.
+    """
+
+    def _expire(param: Parameter) -> Parameter:
+        if event == EXPIRY_TIMER:
+            if isinstance(param, TimerParam):
+                return dataclasses.replace(param, timer_status=TimerStatus.DISABLED)
+            if isinstance(param, ModeParam):
+                return dataclasses.replace(param, mode=FireMode.STANDBY)
+        elif isinstance(param, HeatParam) and param.heat_mode == HeatMode.BOOST:
+            return dataclasses.replace(param, heat_mode=heat_mode_before_boost)
+        return param
+
+    return dataclasses.replace(overview, parameters=[_expire(param) for param in overview.parameters])
@@ -0,0 +1,119 @@
+"""Desired-state reconciliation for a single fire.
+
+Given the state a fire should be in, only the fields that differ from
+``coordinator.data`` are written: power through turn_on/turn_off and
+everything else as one batched ``write_parameters`` call.  The fire is
+then re-read and, if the device did not accept something, the remaining
+difference is written again, up to ``RECONCILE_MAX_ROUNDS`` times.
+Rounds after the first compare against the fresh read, never against
+pending overlays, so a failed re-read is reported as unresolved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from custom_components.flameconnect.const import DOMAIN, LOGGER, RECONCILE_MAX_ROUNDS, RECONCILE_RETRY_DELAY
+from flameconnect import FireMode, FlameConnectError, ModeParam
+from homeassistant.exceptions import ServiceValidationError
+
+if TYPE_CHECKING:
+    from flameconnect import FireOverview, Parameter
+
+    from .base import FlameConnectDataUpdateCoordinator
+
+
+@dataclass
+class ReconcileResult:
+    """Outcome of reconciling a fire towards a desired state.
+
+    Attributes:
+        converged: True if the fire reports the desired state.
+        rounds: Number of write rounds made (0 if already converged).
+        unresolved: Fields still differing, keyed by parameter name.
+
+    """
+
+    converged: bool
+    rounds: int
+    unresolved: dict[str, list[str]] = field(default_factory=dict)
+
+
+def diff_state(
+    overview: FireOverview,
+    changes: dict[type[Parameter], dict[str, Any]],
+) -> dict[type[Parameter], dict[str, Any]]:
+    """Return the fields of *changes* that *overview* does not yet report."""
+    diff: dict[type[Parameter], dict[str, Any]] = {}
+    for param_type, fields in changes.items():
+        current = next((p for p in overview.parameters if isinstance(p, param_type)), None)
+        if current is None:
+            LOGGER.debug("Fire %s has no %s, ignoring it", overview.fire.fire_id, param_type.__name__)
+            continue
+        differing = {name: value for name, value in fields.items() if getattr(current, name) != value}
+        if differing:
+            diff[param_type] = differing
+    return diff
+
+
+def _power_differs(overview: FireOverview, power: bool | None) -> bool:
+    if power is None:
+        return False
+    mode = next((p for p in overview.parameters if isinstance(p, ModeParam)), None)
+    return mode is None or (mode.mode == FireMode.MANUAL) != power
+
+
+def _unresolved(diff: dict[type[Parameter], dict[str, Any]], switch_power: bool) -> dict[str, list[str]]:
+    unresolved = {param_type.__name__: list(fields) for param_type, fields in diff.items()}
+    if switch_power:
+        unresolved[ModeParam.__name__] = ["mode"]
+    return unresolved
+
+
+async def async_reconcile(
+    coordinator: FlameConnectDataUpdateCoordinator,
+    fire_id: str,
+    changes: dict[type[Parameter], dict[str, Any]],
+    power: bool | None = None,
+) -> ReconcileResult:
+    """Converge *fire_id* on *changes* (and *power*) with as few writes as possible.
+
+    Raises:
+        ServiceValidationError: If *fire_id* has not reported an overview yet.
+
+    """
+    overview = (coordinator.data or {}).get(fire_id)
+    if overview is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="fire_unavailable",
+            translation_placeholders={"fire_id": fire_id},
+        )
+    rounds = 0
+    while True:
+        diff = diff_state(overview, changes)
+        switch_power = _power_differs(overview, power)
+        if not diff and not switch_power:
+            return ReconcileResult(converged=True, rounds=rounds)
+        if rounds >= RECONCILE_MAX_ROUNDS:
+            LOGGER.warning("Fire %s did not reach the desired state after %d rounds: %s", fire_id, rounds, diff)
+            return ReconcileResult(converged=False, rounds=rounds, unresolved=_unresolved(diff, switch_power))
+        if rounds:
+            await asyncio.sleep(RECONCILE_RETRY_DELAY)
+        rounds += 1
+        if switch_power:
+            if power:
+                await coordinator.async_turn_on_fire(fire_id, confirm=False)
+            else:
+                await coordinator.async_turn_off_fire(fire_id, confirm=False)
+        if diff:
+            await coordinator.async_write_batch(fire_id, diff, confirm=False)
+        try:
+            overview = await coordinator.async_read_fire(fire_id)
+        except (FlameConnectError, aiohttp.ClientError, TimeoutError, TypeError, KeyError) as err:
+            LOGGER.warning("Re-reading fire %s after reconciling failed: %s", fire_id, err)
+            return ReconcileResult(converged=False, rounds=rounds, unresolved=_unresolved(diff, switch_power))
@@ -0,0 +1,125 @@
+"""Coordinator-owned scheduler for expiry events and confirmation reads.
+
+Events are keyed by ``(fire_id, event)``; scheduling the same key again
+replaces the earlier event, so each countdown has at most one timer.
+Confirmation reads requested once an event has fired are grouped into
+buckets of ``EXPIRY_COALESCE_WINDOW`` seconds, and every bucket is
+fetched with a single batched refresh.  Several fires expiring together
+therefore cause one refresh instead of one each.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timedelta
+from functools import partial
+import math
+from typing import TYPE_CHECKING, Any
+
+from custom_components.flameconnect.const import EXPIRY_COALESCE_WINDOW
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Event name used for pending confirmation reads in diagnostics.
+CONFIRM_REFRESH = "confirm_refresh"
+
+
+class ExpiryScheduler:
+    """Timers for ``(fire_id, event)`` expiries and batched confirmation reads."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_expire: Callable[[str, str], None],
+        refresh: Callable[[set[str]], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Initialise the scheduler.
+
+        Args:
+            hass: The Home Assistant instance.
+            on_expire: Called with ``(fire_id, event)`` at each event's time.
+            refresh: Coroutine function re-reading a set of fires.
+
+        """
+        self._hass = hass
+        self._on_expire = on_expire
+        self._refresh = refresh
+        self.events: dict[tuple[str, str], datetime] = {}
+        self._event_timers: dict[tuple[str, str], Callable[[], None]] = {}
+        # Fires to re-read per due time, and the timer running each batch.
+        self._refreshes: dict[datetime, set[str]] = {}
+        self._refresh_timers: dict[datetime, Callable[[], None]] = {}
+
+    @callback
+    def schedule(self, fire_id: str, event: str, when: datetime) -> None:
+        """Fire *event* for *fire_id* at *when*, replacing any earlier schedule."""
+        key = (fire_id, event)
+        self.cancel(fire_id, event)
+        self.events[key] = when
+        self._event_timers[key] = async_track_point_in_utc_time(self._hass, partial(self._fire_event, key), when)
+
+    @callback
+    def cancel(self, fire_id: str, event: str) -> None:
+        """Drop the scheduled *event* for *fire_id*, if any."""
+        key = (fire_id, event)
+        cancel = self._event_timers.pop(key, None)
+        if cancel is not None:
+            cancel()
+        self.events.pop(key, None)
+
+    @callback
+    def request_refresh(self, fire_id: str, delay: float) -> None:
+        """Re-read *fire_id* in about *delay* seconds, batched with other fires.
+
+        The due time is rounded up to the next ``EXPIRY_COALESCE_WINDOW``
+        boundary so requests made close together share one refresh.
+        """
+        when = (dt_util.utcnow() + timedelta(seconds=delay)).timestamp()
+        due = dt_util.utc_from_timestamp(math.ceil(when / EXPIRY_COALESCE_WINDOW) * EXPIRY_COALESCE_WINDOW)
+        fire_ids = self._refreshes.get(due)
+        if fire_ids is None:
+            fire_ids = self._refreshes[due] = set()
+            self._refresh_timers[due] = async_track_point_in_utc_time(self._hass, partial(self._run_refresh, due), due)
+        fire_ids.add(fire_id)
+
+    @callback
+    def _fire_event(self, key: tuple[str, str], _now: datetime) -> None:
+        """Run the expiry callback for *key*."""
+        self._event_timers.pop(key, None)
+        self.events.pop(key, None)
+        self._on_expire(*key)
+
+    @callback
+    def _run_refresh(self, due: datetime, _now: datetime) -> None:
+        """Re-read every fire batched for *due* in one refresh."""
+        self._refresh_timers.pop(due, None)
+        fire_ids = self._refreshes.pop(due, set())
+        if fire_ids:
+            self._hass.async_create_task(self._refresh(fire_ids))
+
+    def pending(self) -> list[dict[str, str]]:
+        """Return the scheduled events and confirmation reads, soonest first."""
+        pending = [
+            {"fire_id": fire_id, "event": event, "due": when.isoformat()}
+            for (fire_id, event), when in self.events.items()
+        ]
+        pending.extend(
+            {"fire_id": fire_id, "event": CONFIRM_REFRESH, "due": due.isoformat()}
+            for due, fire_ids in self._refreshes.items()
+            for fire_id in sorted(fire_ids)
+        )
+        return sorted(pending, key=lambda item: item["due"])
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all scheduled events and confirmation reads."""
+        for cancel in (*self._event_timers.values(), *self._refresh_timers.values()):
+            cancel()
+        self._event_timers.clear()
+        self._refresh_timers.clear()
+        self.events.clear()
+        self._refreshes.clear()
@@ -0,0 +1,62 @@
+"""Request coalescing for concurrent reads of the same key.
+
+A manual refresh, a confirmation read, an expiry refresh and the read
+before a write can all ask for the same fire within milliseconds.
+``SingleFlight`` lets them share one in-flight request and its result
+(or exception) instead of each sending its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from functools import partial
+from typing import Any
+
+
+class SingleFlight[K, T]:
+    """Share one in-flight call per key among concurrent callers.
+
+    Attributes:
+        calls: Number of calls actually made.
+        hits: Number of callers served by a call already in flight.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialise with no calls in flight."""
+        self._inflight: dict[K, asyncio.Task[T]] = {}
+        self.calls = 0
+        self.hits = 0
+
+    async def async_call(self, key: K, call: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Return the result of *call*, or of the call already in flight for *key*.
+
+        A caller being cancelled does not cancel the shared call for the
+        other callers.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.calls += 1
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._discard, key))
+        return await asyncio.shield(task)
+
+    def forget(self, key: K) -> None:
+        """Make later callers for *key* start a new call.
+
+        Callers already waiting keep the in-flight result.  Used when the
+        data being read has just changed, e.g. after a write.
+        """
+        self._inflight.pop(key, None)
+
+    def _discard(self, key: K, task: asyncio.Task[T]) -> None:
+        """Stop sharing *task* once it has finished."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved; every caller re-raises it.
+            task.exception()
@@ -0,0 +1,75 @@
+"""Persisted snapshot of discovered fires and their last overviews.
+
+After every successful poll the fire list and each fire's overview are
+saved to an HA ``Store``.  On the next start the coordinator comes up
+from this snapshot straight away, with entities marked stale, and then
+revalidates against the cloud in the background.  A snapshot written by
+an incompatible library version is discarded.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from custom_components.flameconnect.const import DOMAIN, LOGGER
+from flameconnect import Fire
+from homeassistant.helpers.storage import Store
+
+from .data_processing import decode_dataclass, decode_overview, encode_overview, encode_value
+
+if TYPE_CHECKING:
+    from flameconnect import FireOverview
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+
+# Seconds to wait before persisting, so a poll followed by confirmation
+# reads is written to disk once.
+SAVE_DELAY = 10.0
+
+
+class StartupCache:
+    """Store of the fire list and overviews used to start without the cloud."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialise the cache backed by a per-entry store."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.startup")
+        self._snapshot: dict[str, Any] = {}
+        self._unsaved = False
+
+    async def async_load(self) -> tuple[list[Fire], dict[str, FireOverview]] | None:
+        """Return the persisted fires and overviews, or None if there are none."""
+        stored = await self._store.async_load()
+        if not stored:
+            return None
+        try:
+            fires = [decode_dataclass(Fire, fire) for fire in stored["fires"]]
+            overviews = {fire_id: decode_overview(overview) for fire_id, overview in stored["overviews"].items()}
+        except (KeyError, TypeError, ValueError) as err:
+            LOGGER.debug("Discarding unreadable startup snapshot: %s", err)
+            return None
+        if not fires:
+            return None
+        return fires, overviews
+
+    def save(self, fires: list[Fire], overviews: dict[str, FireOverview]) -> None:
+        """Persist *fires* and *overviews* after a short delay."""
+        self._snapshot = {
+            "fires": [encode_value(fire) for fire in fires],
+            "overviews": {fire_id: encode_overview(overview) for fire_id, overview in overviews.items()},
+        }
+        self._unsaved = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a snapshot still waiting for its save delay now."""
+        if self._unsaved:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        self._unsaved = False
+        return self._snapshot
+
+    async def async_remove(self) -> None:
+        """Delete the persisted snapshot."""
+        await self._store.async_remove()
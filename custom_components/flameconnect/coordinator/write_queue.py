@@ -0,0 +1,167 @@
+"""Durable queue of parameter changes that could not reach the cloud.
+
+When the cloud is briefly unreachable, requested changes are held here
+per fire, coalesced last-write-wins per field, and persisted to an HA
+``Store`` so they survive a restart.  Once a poll succeeds again the
+coordinator replays them as a single batched write.  Changes older than
+``max_age`` are discarded instead of being replayed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import time
+from typing import TYPE_CHECKING, Any
+
+from custom_components.flameconnect.const import DOMAIN, LOGGER
+from homeassistant.helpers.storage import Store
+
+from .data_processing import decode_fields, encode_value
+
+if TYPE_CHECKING:
+    from flameconnect import Parameter
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+
+# Seconds to wait before persisting, so a burst of queued changes is
+# written to disk once.
+SAVE_DELAY = 1.0
+
+
+class OfflineWriteQueue:
+    """Per-fire queue of intended parameter changes awaiting replay.
+
+    Intents are stored as ``{fire_id: {param_name: {"fields": {...},
+    "queued_at": ts}}}`` where ``param_name`` is the parameter class name
+    and ``queued_at`` is the wall-clock time of the latest change.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, max_age: float) -> None:
+        """Initialise an empty queue backed by a per-entry store."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.write_queue")
+        self._max_age = max_age
+        self._intents: dict[str, dict[str, dict[str, Any]]] = {}
+        self._unsaved = False
+        # Saves wait for the load: a pending save would be returned by
+        # ``Store.async_load`` in place of the file, losing stored intents.
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load queued intents persisted by a previous run, once.
+
+        Changes queued before the load (entities accept input before setup
+        finishes) are newer than the stored ones and take precedence; they
+        are persisted together with the stored ones once loaded.
+        """
+        if self._loaded:
+            return
+        stored = await self._store.async_load()
+        self._loaded = True
+        for fire_id, intents in (stored or {}).items():
+            self._merge(fire_id, intents)
+        if self._unsaved:
+            self._async_schedule_save()
+        if stored:
+            LOGGER.debug("Loaded queued changes for %d fire(s)", len(stored))
+
+    def enqueue(self, fire_id: str, param_type: type[Parameter], changes: dict[str, Any]) -> None:
+        """Queue *changes*, overriding any earlier value for the same field."""
+        intent = self._intents.setdefault(fire_id, {}).setdefault(param_type.__name__, {"fields": {}})
+        intent["fields"].update({name: encode_value(value) for name, value in changes.items()})
+        intent["queued_at"] = time.time()
+        self._async_schedule_save()
+
+    def discard(self, fire_id: str, param_type: type[Parameter], changes: dict[str, Any]) -> None:
+        """Drop queued fields superseded by a change that reached the cloud."""
+        fire_intents = self._intents.get(fire_id)
+        intent = fire_intents.get(param_type.__name__) if fire_intents else None
+        if fire_intents is None or intent is None:
+            return
+        for name in changes:
+            intent["fields"].pop(name, None)
+        if not intent["fields"]:
+            del fire_intents[param_type.__name__]
+            if not fire_intents:
+                del self._intents[fire_id]
+        self._async_schedule_save()
+
+    def discard_fire(self, fire_id: str) -> None:
+        """Drop every queued change for *fire_id*, e.g. once it left the account."""
+        if self._intents.pop(fire_id, None) is not None:
+            self._async_schedule_save()
+
+    def has_pending(self, fire_id: str) -> bool:
+        """Return True if *fire_id* has changes waiting to be replayed."""
+        return fire_id in self._intents
+
+    def __len__(self) -> int:
+        """Return the number of queued parameter changes across all fires."""
+        return sum(len(intents) for intents in self._intents.values())
+
+    def fire_ids(self) -> list[str]:
+        """Return the fires with queued changes."""
+        return list(self._intents)
+
+    def pop(self, fire_id: str) -> tuple[dict[str, dict[str, Any]], list[str]]:
+        """Remove and return the queued intents for *fire_id*.
+
+        Returns:
+            A tuple of the still-valid intents keyed by parameter name and
+            the names of parameters whose changes had expired.
+
+        """
+        intents = self._intents.pop(fire_id, {})
+        if intents:
+            self._async_schedule_save()
+        cutoff = time.time() - self._max_age
+        valid = {name: intent for name, intent in intents.items() if intent["queued_at"] >= cutoff}
+        expired = [name for name in intents if name not in valid]
+        for name in expired:
+            LOGGER.warning(
+                "Discarding queued %s change for fire %s, older than %d seconds",
+                name,
+                fire_id,
+                self._max_age,
+            )
+        return valid, expired
+
+    def requeue(self, fire_id: str, intents: dict[str, dict[str, Any]]) -> None:
+        """Put back intents from a failed replay without overriding newer ones."""
+        self._merge(fire_id, intents)
+        self._async_schedule_save()
+
+    def _merge(self, fire_id: str, intents: dict[str, dict[str, Any]]) -> None:
+        """Add older *intents* for *fire_id*; fields queued since take precedence."""
+        fire_intents = self._intents.setdefault(fire_id, {})
+        for name, intent in intents.items():
+            newer = fire_intents.get(name)
+            if newer is None:
+                fire_intents[name] = intent
+            else:
+                newer["fields"] = {**intent["fields"], **newer["fields"]}
+
+    async def async_flush(self) -> None:
+        """Write changes still waiting for the save delay now."""
+        await self.async_load()
+        if self._unsaved:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the persisted queue."""
+        self._intents.clear()
+        await self._store.async_remove()
+
+    @staticmethod
+    def apply(param: Parameter, fields: dict[str, Any]) -> Parameter:
+        """Return *param* with the queued *fields* applied."""
+        return replace(param, **decode_fields(param, fields))
+
+    def _async_schedule_save(self) -> None:
+        self._unsaved = True
+        if self._loaded:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, dict[str, dict[str, Any]]]:
+        self._unsaved = False
+        return self._intents
@@ -1,7 +1,9 @@
 """Custom types for FlameConnect.
 
-Defines the runtime data structure attached to each config entry.
-Access pattern: entry.runtime_data.client / entry.runtime_data.coordinator
+Defines the runtime data structure attached to each config entry, and
+the integration-wide state shared by all entries.
+Access pattern: entry.runtime_data.client / entry.runtime_data.coordinator,
+hass.data[DOMAIN].snapshots / .rate_limiter / .shared_session
 """
 
 from __future__ import annotations
@@ -14,7 +16,9 @@
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
 
+    from .api import RateLimiter, SharedSession
     from .coordinator import FlameConnectDataUpdateCoordinator
+    from .service_actions import SnapshotStore
 
 type FlameConnectConfigEntry = ConfigEntry[FlameConnectData]
 
@@ -29,3 +33,16 @@ class FlameConnectData:
 
     client: FlameConnectClient
     coordinator: FlameConnectDataUpdateCoordinator
+
+
+@dataclass
+class FlameConnectDomainData:
+    """Integration-wide state for FlameConnect.
+
+    Stored as hass.data[DOMAIN] by async_setup and shared by all config
+    entries.
+    """
+
+    snapshots: SnapshotStore
+    rate_limiter: RateLimiter
+    shared_session: SharedSession
@@ -7,6 +7,7 @@
 from homeassistant.helpers.redact import async_redact_data
 
 from .api import CONF_TOKEN_CACHE
+from .const import DOMAIN
 
 TO_REDACT = {CONF_TOKEN_CACHE}
 
@@ -21,4 +22,8 @@ async def async_get_config_entry_diagnostics(
     entry: FlameConnectConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    return async_redact_data(dict(entry.data), TO_REDACT)
+    return {
+        "entry_data": async_redact_data(dict(entry.data), TO_REDACT),
+        "coordinator": entry.runtime_data.coordinator.async_get_diagnostics(),
+        "rate_limiter": hass.data[DOMAIN].rate_limiter.diagnostics(),
+    }
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from custom_components.flameconnect.const import DOMAIN
 from flameconnect import SoftwareVersionParam
@@ -44,8 +44,24 @@ def __init__(
 
     @property
     def available(self) -> bool:
-        """Return True if the fireplace is present in coordinator data."""
-        return super().available and self._fire_id in self.coordinator.data
+        """Return True if the fireplace is present in coordinator data.
+
+        Snapshot data restored at startup stays available, marked stale,
+        while the cloud cannot be reached, but only for the revalidation
+        window.
+        """
+        return (super().available or self.coordinator.serving_snapshot) and self._fire_id in self.coordinator.data
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag stale snapshot data and changes queued for replay."""
+        attributes: dict[str, Any] = {}
+        if self.coordinator.stale:
+            attributes["stale"] = True
+        queue = self.coordinator.write_queue
+        if queue is not None:
+            attributes["pending_sync"] = queue.has_pending(self._fire_id)
+        return attributes or None
 
     @property
     def device_info(self) -> DeviceInfo:
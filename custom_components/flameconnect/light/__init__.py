@@ -4,6 +4,10 @@
 - Media light: RGBW light with effect support (media themes).
 - Overhead light: RGBW overhead light.
 - Log effect light: RGBW log effect light.
+
+Colour changes are coalesced through the coordinator's debounced write so
+dragging a colour wheel produces a single write with the final colour;
+plain on/off commands are written immediately.
 """
 
 from __future__ import annotations
@@ -14,9 +18,11 @@
 from flameconnect import FlameEffectParam, LightStatus, LogEffect, LogEffectParam, MediaTheme, RGBWColor
 from homeassistant.components.light import ATTR_EFFECT, ATTR_RGBW_COLOR, LightEntity, LightEntityDescription
 from homeassistant.components.light.const import ColorMode, LightEntityFeature
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
     from custom_components.flameconnect.data import FlameConnectConfigEntry
+    from flameconnect import Fire
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -59,18 +65,45 @@ async def async_setup_entry(
 ) -> None:
     """Set up FlameConnect light entities from a config entry."""
     coordinator = entry.runtime_data.coordinator
-    entities: list[LightEntity] = []
-    for fire in coordinator.fires:
-        if fire.features.rgb_fuel_bed:
-            entities.append(FlameConnectMediaLight(coordinator, _MEDIA_LIGHT_DESCRIPTION, fire))
-        if fire.features.rgb_back_light:
-            entities.append(FlameConnectOverheadLight(coordinator, _OVERHEAD_LIGHT_DESCRIPTION, fire))
-        if fire.features.rgb_log_effect:
-            entities.append(FlameConnectLogEffectLight(coordinator, _LOG_EFFECT_DESCRIPTION, fire))
-    async_add_entities(entities)
-
-
-class FlameConnectMediaLight(LightEntity, FlameConnectEntity):
+
+    @callback
+    def _async_add_fires(fires: list[Fire]) -> None:
+        entities: list[LightEntity] = []
+        for fire in fires:
+            if fire.features.rgb_fuel_bed:
+                entities.append(FlameConnectMediaLight(coordinator, _MEDIA_LIGHT_DESCRIPTION, fire))
+            if fire.features.rgb_back_light:
+                entities.append(FlameConnectOverheadLight(coordinator, _OVERHEAD_LIGHT_DESCRIPTION, fire))
+            if fire.features.rgb_log_effect:
+                entities.append(FlameConnectLogEffectLight(coordinator, _LOG_EFFECT_DESCRIPTION, fire))
+        async_add_entities(entities)
+
+    _async_add_fires(coordinator.fires)
+    entry.async_on_unload(coordinator.async_add_fire_listener(_async_add_fires))
+
+
+class FlameConnectLightBase(LightEntity, FlameConnectEntity):
+    """Base class for FlameConnect RGBW lights."""
+
+    async def _async_write(
+        self,
+        param_type: type[FlameEffectParam | LogEffectParam],
+        changes: dict[str, Any],
+        *,
+        coalesce: bool,
+    ) -> None:
+        """Write *changes*, coalescing rapid colour updates.
+
+        Colour changes go through the debounced write (last value wins);
+        the coordinator's pending overlay shows the new colour at once.
+        """
+        if coalesce:
+            await self.coordinator.async_write_fields_debounced(self._fire_id, param_type, **changes)
+        else:
+            await self.coordinator.async_write_fields(self._fire_id, param_type, **changes)
+
+
+class FlameConnectMediaLight(FlameConnectLightBase):
     """Media light entity with RGBW colour and effect (media theme) support."""
 
     _attr_color_mode = ColorMode.RGBW
@@ -115,14 +148,14 @@ async def async_turn_on(self, **kwargs: Any) -> None:
         effect: str | None = kwargs.get(ATTR_EFFECT)
         if effect is not None:
             changes["media_theme"] = _MEDIA_THEME_MAP[effect]
-        await self.coordinator.async_write_fields(self._fire_id, FlameEffectParam, **changes)
+        await self._async_write(FlameEffectParam, changes, coalesce=rgbw is not None)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the media light."""
         await self.coordinator.async_write_fields(self._fire_id, FlameEffectParam, media_light=LightStatus.OFF)
 
 
-class FlameConnectOverheadLight(LightEntity, FlameConnectEntity):
+class FlameConnectOverheadLight(FlameConnectLightBase):
     """Overhead light entity with RGBW colour support.
 
     Uses the ``light_status`` field (not ``overhead_light``) for on/off state.
@@ -153,14 +186,14 @@ async def async_turn_on(self, **kwargs: Any) -> None:
         rgbw: tuple[int, int, int, int] | None = kwargs.get(ATTR_RGBW_COLOR)
         if rgbw is not None:
             changes["overhead_color"] = _tuple_to_rgbw(rgbw)
-        await self.coordinator.async_write_fields(self._fire_id, FlameEffectParam, **changes)
+        await self._async_write(FlameEffectParam, changes, coalesce=rgbw is not None)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the overhead light."""
         await self.coordinator.async_write_fields(self._fire_id, FlameEffectParam, light_status=LightStatus.OFF)
 
 
-class FlameConnectLogEffectLight(LightEntity, FlameConnectEntity):
+class FlameConnectLogEffectLight(FlameConnectLightBase):
     """Log effect light entity with RGBW colour support."""
 
     _attr_color_mode = ColorMode.RGBW
@@ -188,7 +221,7 @@ async def async_turn_on(self, **kwargs: Any) -> None:
         rgbw: tuple[int, int, int, int] | None = kwargs.get(ATTR_RGBW_COLOR)
         if rgbw is not None:
             changes["color"] = _tuple_to_rgbw(rgbw)
-        await self.coordinator.async_write_fields(self._fire_id, LogEffectParam, **changes)
+        await self._async_write(LogEffectParam, changes, coalesce=rgbw is not None)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the log effect."""
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from custom_components.flameconnect.entity import FlameConnectEntity
 from flameconnect import FlameEffectParam, HeatMode, HeatParam, SoundParam, TimerParam, TimerStatus
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
     from custom_components.flameconnect.data import FlameConnectConfigEntry
+    from flameconnect import Fire
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -23,8 +26,18 @@
     "sound_file": "sound",
 }
 
-NUMBER_DESCRIPTIONS: tuple[NumberEntityDescription, ...] = (
-    NumberEntityDescription(
+
+@dataclass(frozen=True, kw_only=True)
+class FlameConnectNumberEntityDescription(NumberEntityDescription):
+    """Describes a FlameConnect number entity."""
+
+    # Quiet period (seconds) for debounced writes; None uses the
+    # coordinator's adaptive delay.
+    debounce_delay: float | None = None
+
+
+NUMBER_DESCRIPTIONS: tuple[FlameConnectNumberEntityDescription, ...] = (
+    FlameConnectNumberEntityDescription(
         key="flame_speed",
         translation_key="flame_speed",
         native_min_value=1,
@@ -32,7 +45,7 @@
         native_step=1,
         icon="mdi:fire-circle",
     ),
-    NumberEntityDescription(
+    FlameConnectNumberEntityDescription(
         key="timer_duration",
         translation_key="timer_duration",
         native_min_value=1,
@@ -41,7 +54,7 @@
         native_unit_of_measurement=UnitOfTime.MINUTES,
         icon="mdi:timer-sand",
     ),
-    NumberEntityDescription(
+    FlameConnectNumberEntityDescription(
         key="boost_duration",
         translation_key="boost_duration",
         native_min_value=1,
@@ -50,7 +63,7 @@
         native_unit_of_measurement=UnitOfTime.MINUTES,
         icon="mdi:rocket-launch",
     ),
-    NumberEntityDescription(
+    FlameConnectNumberEntityDescription(
         key="sound_volume",
         translation_key="sound_volume",
         native_min_value=0,
@@ -60,7 +73,7 @@
         entity_category=EntityCategory.CONFIG,
         icon="mdi:volume-high",
     ),
-    NumberEntityDescription(
+    FlameConnectNumberEntityDescription(
         key="sound_file",
         translation_key="sound_file",
         native_min_value=0,
@@ -80,18 +93,24 @@ async def async_setup_entry(
 ) -> None:
     """Set up FlameConnect number entities."""
     coordinator = entry.runtime_data.coordinator
-    async_add_entities(
-        FlameConnectNumberEntity(coordinator, description, fire)
-        for description in NUMBER_DESCRIPTIONS
-        for fire in coordinator.fires
-        if getattr(fire.features, _FEATURE_REQUIREMENTS[description.key], False)
-    )
+
+    @callback
+    def _async_add_fires(fires: list[Fire]) -> None:
+        async_add_entities(
+            FlameConnectNumberEntity(coordinator, description, fire)
+            for description in NUMBER_DESCRIPTIONS
+            for fire in fires
+            if getattr(fire.features, _FEATURE_REQUIREMENTS[description.key], False)
+        )
+
+    _async_add_fires(coordinator.fires)
+    entry.async_on_unload(coordinator.async_add_fire_listener(_async_add_fires))
 
 
 class FlameConnectNumberEntity(NumberEntity, FlameConnectEntity):
     """Number entity for FlameConnect fireplace settings."""
 
-    entity_description: NumberEntityDescription
+    entity_description: FlameConnectNumberEntityDescription
 
     @property
     def native_value(self) -> float | None:
@@ -144,6 +163,7 @@ async def async_set_native_value(self, value: float) -> None:
         writes to coalesce rapid slider changes.
         """
         key = self.entity_description.key
+        delay = self.entity_description.debounce_delay
 
         if key == "timer_duration":
             duration = int(value)
@@ -152,7 +172,7 @@ async def async_set_native_value(self, value: float) -> None:
             current = self._get_param(TimerParam)
             if current and current.timer_status == TimerStatus.ENABLED:
                 await self.coordinator.async_write_fields_debounced(
-                    self._fire_id, TimerParam, timer_status=TimerStatus.ENABLED, duration=duration
+                    self._fire_id, TimerParam, delay, timer_status=TimerStatus.ENABLED, duration=duration
                 )
             return
 
@@ -163,13 +183,15 @@ async def async_set_native_value(self, value: float) -> None:
             heat = self._get_param(HeatParam)
             if heat and heat.heat_mode == HeatMode.BOOST:
                 await self.coordinator.async_write_fields_debounced(
-                    self._fire_id, HeatParam, heat_mode=HeatMode.BOOST, boost_duration=duration
+                    self._fire_id, HeatParam, delay, heat_mode=HeatMode.BOOST, boost_duration=duration
                 )
             return
 
         if key == "flame_speed":
-            await self.coordinator.async_write_fields_debounced(self._fire_id, FlameEffectParam, flame_speed=int(value))
+            await self.coordinator.async_write_fields_debounced(
+                self._fire_id, FlameEffectParam, delay, flame_speed=int(value)
+            )
         elif key == "sound_volume":
-            await self.coordinator.async_write_fields_debounced(self._fire_id, SoundParam, volume=int(value))
+            await self.coordinator.async_write_fields_debounced(self._fire_id, SoundParam, delay, volume=int(value))
         elif key == "sound_file":
-            await self.coordinator.async_write_fields_debounced(self._fire_id, SoundParam, sound_file=int(value))
+            await self.coordinator.async_write_fields_debounced(self._fire_id, SoundParam, delay, sound_file=int(value))
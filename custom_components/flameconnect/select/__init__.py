@@ -7,9 +7,11 @@
 from custom_components.flameconnect.entity import FlameConnectEntity
 from flameconnect import Brightness, FlameColor, FlameEffectParam, MediaTheme
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
     from custom_components.flameconnect.data import FlameConnectConfigEntry
+    from flameconnect import Fire
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -59,12 +61,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up FlameConnect select entities."""
     coordinator = entry.runtime_data.coordinator
-    async_add_entities(
-        FlameConnectSelectEntity(coordinator, description, fire)
-        for description in SELECT_DESCRIPTIONS
-        for fire in coordinator.fires
-        if getattr(fire.features, _FEATURE_REQUIREMENTS[description.key], False)
-    )
+
+    @callback
+    def _async_add_fires(fires: list[Fire]) -> None:
+        async_add_entities(
+            FlameConnectSelectEntity(coordinator, description, fire)
+            for description in SELECT_DESCRIPTIONS
+            for fire in fires
+            if getattr(fire.features, _FEATURE_REQUIREMENTS[description.key], False)
+        )
+
+    _async_add_fires(coordinator.fires)
+    entry.async_on_unload(coordinator.async_add_fire_listener(_async_add_fires))
 
 
 class FlameConnectSelectEntity(SelectEntity, FlameConnectEntity):
@@ -0,0 +1,62 @@
+"""Service actions for FlameConnect.
+
+Service actions are registered once from ``async_setup`` and act on
+fireplaces of any loaded config entry.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from custom_components.flameconnect.const import DOMAIN
+from homeassistant.core import SupportsResponse, callback
+
+from .bulk import BULK_SET_SCHEMA, SERVICE_BULK_SET, async_handle_bulk_set
+from .reconcile import RECONCILE_SCHEMA, SERVICE_RECONCILE_FIRE, async_handle_reconcile_fire
+from .snapshots import (
+    SERVICE_RESTORE_FIRE,
+    SERVICE_SNAPSHOT_FIRE,
+    SNAPSHOT_SCHEMA,
+    SnapshotStore,
+    async_handle_restore_fire,
+    async_handle_snapshot_fire,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the FlameConnect service actions."""
+    snapshots = hass.data[DOMAIN].snapshots
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT_FIRE,
+        partial(async_handle_snapshot_fire, hass, snapshots),
+        schema=SNAPSHOT_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_FIRE,
+        partial(async_handle_restore_fire, hass, snapshots),
+        schema=SNAPSHOT_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_SET,
+        partial(async_handle_bulk_set, hass),
+        schema=BULK_SET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECONCILE_FIRE,
+        partial(async_handle_reconcile_fire, hass),
+        schema=RECONCILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+__all__ = ["SnapshotStore", "async_setup_services"]
@@ -0,0 +1,94 @@
+"""Bulk set service action.
+
+``flameconnect.bulk_set`` applies the same change to several fireplaces
+at once, e.g. switching every fire off at midnight.  Fires are written
+in parallel (at most ``BULK_MAX_PARALLEL`` at a time), each with a
+single batched write, and every targeted fire is then re-read in one
+refresh instead of one confirmation read per fire.  A failure on one
+fire is reported for that fire and does not stop the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import aiohttp
+import voluptuous as vol
+
+from custom_components.flameconnect.const import BULK_MAX_PARALLEL, DOMAIN, LOGGER
+from flameconnect import FlameConnectError
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .state import ATTR_POWER, STATE_FIELDS, async_apply_state, parameter_changes
+from .targets import async_get_fires
+
+if TYPE_CHECKING:
+    from custom_components.flameconnect.coordinator import FlameConnectDataUpdateCoordinator
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+SERVICE_BULK_SET = "bulk_set"
+
+ATTR_FIRE_ID = "fire_id"
+
+BULK_SET_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_FIRE_ID): vol.All(cv.ensure_list, [cv.string]),
+            **STATE_FIELDS,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_FIRE_ID),
+)
+
+
+async def async_handle_bulk_set(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Apply the requested changes to every targeted fireplace."""
+    targets = async_get_fires(hass, call.data.get(ATTR_DEVICE_ID, []), call.data.get(ATTR_FIRE_ID, []))
+    if not targets:
+        raise ServiceValidationError(translation_domain=DOMAIN, translation_key="no_targets")
+    power = call.data.get(ATTR_POWER)
+    changes = parameter_changes(call.data)
+    if power is None and not changes:
+        raise ServiceValidationError(translation_domain=DOMAIN, translation_key="no_changes")
+
+    semaphore = asyncio.Semaphore(BULK_MAX_PARALLEL)
+
+    async def _apply(coordinator: FlameConnectDataUpdateCoordinator, fire_id: str) -> str | None:
+        async with semaphore:
+            try:
+                await async_apply_state(coordinator, fire_id, power, changes, confirm=False)
+            except (FlameConnectError, HomeAssistantError, aiohttp.ClientError, TimeoutError) as err:
+                LOGGER.warning("Bulk set failed for fire %s: %s", fire_id, err)
+                return str(err)
+            except Exception as err:  # noqa: BLE001
+                # An unexpected error on one fire must not lose the others' results.
+                LOGGER.exception("Unexpected error in bulk set for fire %s", fire_id)
+                return str(err) or type(err).__name__
+        return None
+
+    errors = await asyncio.gather(*(_apply(coordinator, fire_id) for coordinator, fire_id in targets))
+
+    # Fires that failed part-way may still hold unconfirmed overlays, so
+    # every attempted fire is re-read, not only the ones that succeeded.
+    attempted: defaultdict[FlameConnectDataUpdateCoordinator, set[str]] = defaultdict(set)
+    for coordinator, fire_id in targets:
+        attempted[coordinator].add(fire_id)
+    await asyncio.gather(*(coordinator.async_refresh_fires(fire_ids) for coordinator, fire_ids in attempted.items()))
+
+    if all(error is not None for error in errors):
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="bulk_set_failed",
+            translation_placeholders={"error": next(error for error in errors if error is not None)},
+        )
+    return {
+        "fires": {
+            fire_id: {"success": True} if error is None else {"success": False, "error": error}
+            for (_, fire_id), error in zip(targets, errors, strict=True)
+        }
+    }
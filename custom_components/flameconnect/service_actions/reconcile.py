@@ -0,0 +1,56 @@
+"""Reconcile service action.
+
+``flameconnect.reconcile_fire`` takes the full state a fireplace should
+be in and writes only what differs, re-checking after each write until
+the fireplace reports that state.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import voluptuous as vol
+
+from custom_components.flameconnect.const import DOMAIN
+from flameconnect import FlameConnectError
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+
+from .state import ATTR_POWER, STATE_FIELDS, parameter_changes
+from .targets import async_get_fire
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+SERVICE_RECONCILE_FIRE = "reconcile_fire"
+
+RECONCILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        **STATE_FIELDS,
+    }
+)
+
+
+async def async_handle_reconcile_fire(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Bring a fireplace to the requested state."""
+    coordinator, fire_id = async_get_fire(hass, call.data[ATTR_DEVICE_ID])
+    try:
+        result = await coordinator.async_reconcile(
+            fire_id, parameter_changes(call.data), power=call.data.get(ATTR_POWER)
+        )
+    except FlameConnectError as err:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="write_failed",
+            translation_placeholders={"error": str(err)},
+        ) from err
+    return cast(
+        "ServiceResponse",
+        {
+            "converged": result.converged,
+            "rounds": result.rounds,
+            "unresolved": result.unresolved,
+        },
+    )
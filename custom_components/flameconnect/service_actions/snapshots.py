@@ -0,0 +1,128 @@
+"""Snapshot and restore service actions.
+
+``flameconnect.snapshot_fire`` saves a fireplace's current look (flame
+effect and lighting, log effect, heat and sound) to a named slot.
+``flameconnect.restore_fire`` writes a saved slot back with a single
+``write_parameters`` call, followed by one confirmation read.
+
+Slots are kept per fire in a ``Store`` shared by all config entries.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from custom_components.flameconnect.const import DOMAIN, LOGGER
+from custom_components.flameconnect.coordinator.data_processing import decode_fields, encode_param
+from flameconnect import FlameConnectError, FlameEffectParam, HeatParam, LogEffectParam, SoundParam
+from homeassistant.const import ATTR_DEVICE_ID, ATTR_NAME
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+
+from .targets import async_get_fire
+
+if TYPE_CHECKING:
+    from flameconnect import FireOverview, Parameter
+    from homeassistant.core import HomeAssistant, ServiceCall
+
+SERVICE_SNAPSHOT_FIRE = "snapshot_fire"
+SERVICE_RESTORE_FIRE = "restore_fire"
+
+STORAGE_KEY = f"{DOMAIN}.snapshots"
+STORAGE_VERSION = 1
+
+# Parameters captured by a snapshot.
+SNAPSHOT_PARAMS: tuple[type[Parameter], ...] = (FlameEffectParam, LogEffectParam, HeatParam, SoundParam)
+
+SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_NAME): cv.string,
+    }
+)
+
+
+class SnapshotStore:
+    """Named parameter snapshots per fire, persisted across restarts.
+
+    Stored as ``{fire_id: {name: {param_name: {field: value}}}}`` with
+    field values in their JSON form.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise an empty store."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._snapshots: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+
+    async def async_load(self) -> None:
+        """Load snapshots saved by a previous run."""
+        self._snapshots = await self._store.async_load() or {}
+
+    def save(self, fire_id: str, name: str, overview: FireOverview) -> None:
+        """Save the snapshot parameters of *overview* as slot *name*."""
+        self._snapshots.setdefault(fire_id, {})[name] = {
+            type(param).__name__: encode_param(param)
+            for param in overview.parameters
+            if isinstance(param, SNAPSHOT_PARAMS)
+        }
+        self._store.async_delay_save(lambda: self._snapshots, 1.0)
+
+    def changes_for(
+        self,
+        fire_id: str,
+        name: str,
+        overview: FireOverview,
+    ) -> dict[type[Parameter], dict[str, Any]] | None:
+        """Return the field changes that restore slot *name* on *overview*.
+
+        Returns:
+            The saved fields per parameter type, or None if *fire_id* has
+            no slot called *name*.
+
+        """
+        snapshot = self._snapshots.get(fire_id, {}).get(name)
+        if snapshot is None:
+            return None
+        return {
+            type(param): decode_fields(param, snapshot[type(param).__name__])
+            for param in overview.parameters
+            if type(param).__name__ in snapshot
+        }
+
+
+async def async_handle_snapshot_fire(hass: HomeAssistant, snapshots: SnapshotStore, call: ServiceCall) -> None:
+    """Save the current state of a fireplace to a named slot."""
+    coordinator, fire_id = async_get_fire(hass, call.data[ATTR_DEVICE_ID])
+    overview = coordinator.data.get(fire_id)
+    if overview is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="fire_not_found",
+            translation_placeholders={"device_id": call.data[ATTR_DEVICE_ID]},
+        )
+    snapshots.save(fire_id, call.data[ATTR_NAME], overview)
+    LOGGER.debug("Saved snapshot %s for fire %s", call.data[ATTR_NAME], fire_id)
+
+
+async def async_handle_restore_fire(hass: HomeAssistant, snapshots: SnapshotStore, call: ServiceCall) -> None:
+    """Restore a fireplace from a named slot in one write."""
+    coordinator, fire_id = async_get_fire(hass, call.data[ATTR_DEVICE_ID])
+    overview = coordinator.data.get(fire_id)
+    changes = snapshots.changes_for(fire_id, call.data[ATTR_NAME], overview) if overview is not None else None
+    if changes is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="snapshot_not_found",
+            translation_placeholders={"name": call.data[ATTR_NAME]},
+        )
+    try:
+        await coordinator.async_write_batch(fire_id, changes)
+    except FlameConnectError as err:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="write_failed",
+            translation_placeholders={"error": str(err)},
+        ) from err
@@ -0,0 +1,132 @@
+"""Fireplace state fields accepted by service actions.
+
+Maps user-facing service fields (``heat_mode: eco``, ``media_light:
+true``) onto per-parameter field changes that can be sent with
+``async_write_batch``.  Power is handled separately because turning a
+fire on or off goes through the library's turn_on/turn_off.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from flameconnect import (
+    Brightness,
+    FlameColor,
+    FlameEffect,
+    FlameEffectParam,
+    HeatMode,
+    HeatParam,
+    HeatStatus,
+    LightStatus,
+    LogEffect,
+    LogEffectParam,
+    MediaTheme,
+    SoundParam,
+    TimerParam,
+    TimerStatus,
+)
+from homeassistant.helpers import config_validation as cv
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from enum import Enum
+
+    from custom_components.flameconnect.coordinator import FlameConnectDataUpdateCoordinator
+    from flameconnect import Parameter
+
+ATTR_POWER = "power"
+ATTR_HEAT = "heat"
+ATTR_HEAT_MODE = "heat_mode"
+ATTR_SETPOINT_TEMPERATURE = "setpoint_temperature"
+ATTR_FLAME_EFFECT = "flame_effect"
+ATTR_FLAME_SPEED = "flame_speed"
+ATTR_BRIGHTNESS = "brightness"
+ATTR_FLAME_COLOR = "flame_color"
+ATTR_MEDIA_THEME = "media_theme"
+ATTR_MEDIA_LIGHT = "media_light"
+ATTR_OVERHEAD_LIGHT = "overhead_light"
+ATTR_LOG_EFFECT = "log_effect"
+ATTR_SOUND_VOLUME = "sound_volume"
+ATTR_TIMER_MINUTES = "timer_minutes"
+
+
+def _options(enum_type: type[Enum]) -> vol.In:
+    return vol.In([member.name.lower() for member in enum_type])
+
+
+def _by_name[E: Enum](enum_type: type[E]) -> Callable[[str], E]:
+    return lambda option: enum_type[option.upper()]
+
+
+def _on_off[E: Enum](on: E, off: E) -> Callable[[bool], E]:
+    return lambda value: on if value else off
+
+
+STATE_FIELDS: dict[vol.Optional, Any] = {
+    vol.Optional(ATTR_POWER): cv.boolean,
+    vol.Optional(ATTR_HEAT): cv.boolean,
+    vol.Optional(ATTR_HEAT_MODE): _options(HeatMode),
+    vol.Optional(ATTR_SETPOINT_TEMPERATURE): vol.Coerce(float),
+    vol.Optional(ATTR_FLAME_EFFECT): cv.boolean,
+    vol.Optional(ATTR_FLAME_SPEED): vol.All(vol.Coerce(int), vol.Range(min=1, max=5)),
+    vol.Optional(ATTR_BRIGHTNESS): _options(Brightness),
+    vol.Optional(ATTR_FLAME_COLOR): _options(FlameColor),
+    vol.Optional(ATTR_MEDIA_THEME): _options(MediaTheme),
+    vol.Optional(ATTR_MEDIA_LIGHT): cv.boolean,
+    vol.Optional(ATTR_OVERHEAD_LIGHT): cv.boolean,
+    vol.Optional(ATTR_LOG_EFFECT): cv.boolean,
+    vol.Optional(ATTR_SOUND_VOLUME): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+    vol.Optional(ATTR_TIMER_MINUTES): vol.All(vol.Coerce(int), vol.Range(min=0, max=480)),
+}
+
+# Service field -> (parameter type, parameter field, value converter).
+_FIELD_MAP: dict[str, tuple[type[Parameter], str, Callable[[Any], Any]]] = {
+    ATTR_HEAT: (HeatParam, "heat_status", _on_off(HeatStatus.ON, HeatStatus.OFF)),
+    ATTR_HEAT_MODE: (HeatParam, "heat_mode", _by_name(HeatMode)),
+    ATTR_SETPOINT_TEMPERATURE: (HeatParam, "setpoint_temperature", float),
+    ATTR_FLAME_EFFECT: (FlameEffectParam, "flame_effect", _on_off(FlameEffect.ON, FlameEffect.OFF)),
+    ATTR_FLAME_SPEED: (FlameEffectParam, "flame_speed", int),
+    ATTR_BRIGHTNESS: (FlameEffectParam, "brightness", _by_name(Brightness)),
+    ATTR_FLAME_COLOR: (FlameEffectParam, "flame_color", _by_name(FlameColor)),
+    ATTR_MEDIA_THEME: (FlameEffectParam, "media_theme", _by_name(MediaTheme)),
+    ATTR_MEDIA_LIGHT: (FlameEffectParam, "media_light", _on_off(LightStatus.ON, LightStatus.OFF)),
+    ATTR_OVERHEAD_LIGHT: (FlameEffectParam, "light_status", _on_off(LightStatus.ON, LightStatus.OFF)),
+    ATTR_LOG_EFFECT: (LogEffectParam, "log_effect", _on_off(LogEffect.ON, LogEffect.OFF)),
+    ATTR_SOUND_VOLUME: (SoundParam, "volume", int),
+}
+
+
+def parameter_changes(data: dict[str, Any]) -> dict[type[Parameter], dict[str, Any]]:
+    """Convert service state fields in *data* into field changes per parameter."""
+    changes: dict[type[Parameter], dict[str, Any]] = {}
+    for attr, (param_type, field, convert) in _FIELD_MAP.items():
+        if attr in data:
+            changes.setdefault(param_type, {})[field] = convert(data[attr])
+    if ATTR_TIMER_MINUTES in data:
+        minutes = data[ATTR_TIMER_MINUTES]
+        # The API expects both status and duration; zero disables the timer.
+        changes[TimerParam] = {
+            "timer_status": TimerStatus.ENABLED if minutes else TimerStatus.DISABLED,
+            "duration": minutes,
+        }
+    return changes
+
+
+async def async_apply_state(
+    coordinator: FlameConnectDataUpdateCoordinator,
+    fire_id: str,
+    power: bool | None,
+    changes: dict[type[Parameter], dict[str, Any]],
+    *,
+    confirm: bool = True,
+) -> None:
+    """Switch *fire_id* on or off if requested, then write *changes* in one batch."""
+    if power is True:
+        await coordinator.async_turn_on_fire(fire_id, confirm=confirm)
+    elif power is False:
+        await coordinator.async_turn_off_fire(fire_id, confirm=confirm)
+    if changes:
+        await coordinator.async_write_batch(fire_id, changes, confirm=confirm)
@@ -0,0 +1,63 @@
+"""Resolution of service action targets to FlameConnect fires."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from custom_components.flameconnect.const import DOMAIN
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+
+if TYPE_CHECKING:
+    from custom_components.flameconnect.coordinator import FlameConnectDataUpdateCoordinator
+    from homeassistant.core import HomeAssistant
+
+
+def async_get_fire(hass: HomeAssistant, device_id: str) -> tuple[FlameConnectDataUpdateCoordinator, str]:
+    """Return the coordinator and fire ID for a FlameConnect device.
+
+    Raises:
+        ServiceValidationError: If *device_id* is not a fireplace of a
+            loaded FlameConnect config entry.
+
+    """
+    device = dr.async_get(hass).async_get(device_id)
+    if device is not None:
+        fire_id = next((identifier for domain, identifier in device.identifiers if domain == DOMAIN), None)
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+            if fire_id is not None and entry.entry_id in device.config_entries:
+                return entry.runtime_data.coordinator, fire_id
+    raise ServiceValidationError(
+        translation_domain=DOMAIN,
+        translation_key="fire_not_found",
+        translation_placeholders={"device_id": device_id},
+    )
+
+
+def async_get_fires(
+    hass: HomeAssistant,
+    device_ids: list[str],
+    fire_ids: list[str],
+) -> list[tuple[FlameConnectDataUpdateCoordinator, str]]:
+    """Return the coordinator and fire ID for each targeted fireplace.
+
+    Fireplaces may be given as device IDs, fire IDs or both; each is
+    returned once.
+
+    Raises:
+        ServiceValidationError: If a device or fire ID does not belong to
+            a loaded FlameConnect config entry.
+
+    """
+    targets = [async_get_fire(hass, device_id) for device_id in device_ids]
+    coordinators = [entry.runtime_data.coordinator for entry in hass.config_entries.async_loaded_entries(DOMAIN)]
+    for fire_id in fire_ids:
+        coordinator = next((c for c in coordinators if any(fire.fire_id == fire_id for fire in c.fires)), None)
+        if coordinator is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="fire_id_not_found",
+                translation_placeholders={"fire_id": fire_id},
+            )
+        targets.append((coordinator, fire_id))
+    return list(dict.fromkeys(targets))
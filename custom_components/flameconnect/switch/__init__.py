@@ -24,6 +24,7 @@
     TimerStatus,
 )
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
     from custom_components.flameconnect.coordinator import FlameConnectDataUpdateCoordinator
@@ -83,15 +84,21 @@ async def async_setup_entry(
     """Set up FlameConnect switch entities from a config entry."""
     data = entry.runtime_data
     coordinator = data.coordinator
-    entities: list[SwitchEntity] = []
-    for fire in coordinator.fires:
-        for description in SWITCH_DESCRIPTIONS:
-            feature_attr = _FEATURE_REQUIREMENTS.get(description.key)
-            if feature_attr is not None and not getattr(fire.features, feature_attr):
-                continue
-            cls = _SWITCH_CLASSES[description.key]
-            entities.append(cls(coordinator, description, fire))
-    async_add_entities(entities)
+
+    @callback
+    def _async_add_fires(fires: list[Fire]) -> None:
+        entities: list[SwitchEntity] = []
+        for fire in fires:
+            for description in SWITCH_DESCRIPTIONS:
+                feature_attr = _FEATURE_REQUIREMENTS.get(description.key)
+                if feature_attr is not None and not getattr(fire.features, feature_attr):
+                    continue
+                cls = _SWITCH_CLASSES[description.key]
+                entities.append(cls(coordinator, description, fire))
+        async_add_entities(entities)
+
+    _async_add_fires(coordinator.fires)
+    entry.async_on_unload(coordinator.async_add_fire_listener(_async_add_fires))
 
 
 class FlameConnectSwitchBase(SwitchEntity, FlameConnectEntity):
@@ -134,7 +134,7 @@ def config_entry() -> MockConfigEntry:
     return MockConfigEntry(
         domain=DOMAIN,
         data={"token_cache": "fake-cache-data"},
-        unique_id="user_example_com",
+        unique_id="user-example-com",
         title="user@example.com",
     )
 
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from flameconnect import FireOverview, HeatControl, HeatModeParam, HeatParam, HeatStatus, TempUnit, TempUnitParam
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
 from homeassistant.components.climate.const import HVACMode
 from homeassistant.core import HomeAssistant
+from homeassistant.util.dt import utcnow
 
 
 async def _setup_integration(
@@ -60,6 +62,10 @@ async def test_set_temperature(
         blocking=True,
     )
 
+    # Advance time past the debounce delay so the write flushes.
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
     # Read-before-write pattern
     mock_flameconnect_client.get_fire_overview.assert_called()
     mock_flameconnect_client.write_parameters.assert_called_once()
@@ -146,6 +152,10 @@ async def test_set_temperature_fahrenheit_device(
         blocking=True,
     )
 
+    # Advance time past the debounce delay so the write flushes.
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
     mock_flameconnect_client.write_parameters.assert_called_once()
     param = mock_flameconnect_client.write_parameters.call_args[0][1][0]
     assert isinstance(param, HeatParam)
@@ -172,3 +182,33 @@ async def test_climate_unavailable_when_heat_disabled(
     state = hass.states.get("climate.living_room")
     assert state is not None
     assert state.state == "unavailable"
+
+
+async def test_set_temperature_drag_coalesces_writes(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test dragging the thermostat shows each value at once but writes only the last."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    for temperature in (23.0, 24.0, 25.0, 26.0):
+        await hass.services.async_call(
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.living_room", "temperature": temperature},
+            blocking=True,
+        )
+        state = hass.states.get("climate.living_room")
+        assert state is not None
+        assert state.attributes["temperature"] == temperature
+
+    mock_flameconnect_client.write_parameters.assert_not_called()
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    mock_flameconnect_client.write_parameters.assert_called_once()
+    param = mock_flameconnect_client.write_parameters.call_args[0][1][0]
+    assert isinstance(param, HeatParam)
+    assert param.setpoint_temperature == 26.0
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+from time import monotonic
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from flameconnect import ApiError, AuthenticationError
+from flameconnect import ApiError, AuthenticationError, Fire, FireOverview
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.flameconnect.config_flow_handler.validators.fireplaces import NoWifiFireplacesError
+from custom_components.flameconnect.api import async_pop_handoff
+from custom_components.flameconnect.config_flow_handler.config_flow import FlameConnectConfigFlowHandler
+from custom_components.flameconnect.config_flow_handler.validators.credentials import (
+    ValidatedCredentials,
+    validate_credentials,
+)
+from custom_components.flameconnect.config_flow_handler.validators.fireplaces import (
+    FireplaceValidation,
+    NoWifiFireplacesError,
+)
 from homeassistant.config_entries import SOURCE_USER
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
@@ -19,6 +29,9 @@
     "password": "secret123",
 }
 
+CREDENTIALS = ValidatedCredentials(token_cache="fake-cache", access_token="fake-token", expires_at=0.0)
+
+CONFIG_FLOW_MODULE = "custom_components.flameconnect.config_flow_handler.config_flow"
 CREDENTIALS_MODULE = "custom_components.flameconnect.config_flow_handler.validators.credentials"
 
 # Patch validate_credentials where it is looked up by config_flow.py
@@ -88,6 +101,78 @@ async def test_user_step_happy_path(hass: HomeAssistant, mock_setup_entry: Magic
     assert result["data"] == {"token_cache": "fake-serialized-cache"}
 
 
+async def test_validate_credentials_returns_issued_token() -> None:
+    """Test that the access token and its expiry are returned with the cache."""
+    mock_pca, mock_b2c, mock_cache_cls = _make_credential_mocks()
+    mock_pca.return_value.acquire_token_by_auth_code_flow.return_value = {
+        "access_token": "fake-token",
+        "expires_in": 3600,
+    }
+
+    with (
+        patch(f"{CREDENTIALS_MODULE}.msal.PublicClientApplication", mock_pca),
+        patch(f"{CREDENTIALS_MODULE}.b2c_login_with_credentials", mock_b2c),
+        patch(f"{CREDENTIALS_MODULE}.msal.SerializableTokenCache", mock_cache_cls),
+        patch(
+            f"{CREDENTIALS_MODULE}.asyncio.to_thread",
+            side_effect=lambda fn, *a, **kw: fn(*a, **kw),
+        ),
+    ):
+        credentials = await validate_credentials(**VALID_USER_INPUT)
+
+    assert credentials.token_cache == "fake-serialized-cache"
+    assert credentials.access_token == "fake-token"
+    assert 3500 < credentials.expires_at - monotonic() <= 3600
+
+
+async def test_fireplace_validation_serves_issued_token_from_memory(hass: HomeAssistant) -> None:
+    """Test that validating fireplaces does not rebuild MSAL for every request."""
+    flow = FlameConnectConfigFlowHandler()
+    flow.hass = hass
+    credentials = ValidatedCredentials(
+        token_cache="fake-cache", access_token="issued-token", expires_at=monotonic() + 3600
+    )
+
+    with (
+        patch(f"{CONFIG_FLOW_MODULE}.TokenAuth") as token_auth,
+        patch(f"{CONFIG_FLOW_MODULE}.FlameConnectClient"),
+        patch(f"{CONFIG_FLOW_MODULE}.validate_fireplaces", new_callable=AsyncMock),
+        patch(f"{CONFIG_FLOW_MODULE}.build_msal_app") as build_msal_app,
+    ):
+        await flow._validate_fireplaces(credentials)  # noqa: SLF001
+        get_token = token_auth.call_args.args[0]
+        tokens = [await get_token() for _ in range(3)]
+
+    assert tokens == ["issued-token"] * 3
+    build_msal_app.assert_not_called()
+
+
+async def test_user_step_leaves_handoff_for_setup(
+    hass: HomeAssistant,
+    mock_setup_entry: MagicMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that the fetched fires and overviews are kept for the new entry's setup."""
+    validation = FireplaceValidation(fires=[mock_fire], overviews={"abc123": mock_fire_overview})
+    with (
+        patch(VALIDATE_CREDENTIALS_PATCH, return_value=CREDENTIALS),
+        patch(VALIDATE_FIREPLACES_PATCH, return_value=validation),
+    ):
+        result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input=VALID_USER_INPUT,
+        )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["result"].unique_id == "user-example-com"
+    handoff = async_pop_handoff(hass, result["result"].unique_id)
+    assert handoff is not None
+    assert handoff.fires == [mock_fire]
+    assert handoff.overviews == {"abc123": mock_fire_overview}
+
+
 async def test_user_step_invalid_auth(hass: HomeAssistant) -> None:
     with patch(
         VALIDATE_CREDENTIALS_PATCH,
@@ -200,7 +285,7 @@ async def test_reauth_step_invalid_auth(hass: HomeAssistant, config_entry: MockC
 async def test_user_step_no_wifi_fireplaces_aborts(hass: HomeAssistant) -> None:
     """Test that setup aborts when no WiFi-connected fireplaces are found."""
     with (
-        patch(VALIDATE_CREDENTIALS_PATCH, return_value="fake-cache"),
+        patch(VALIDATE_CREDENTIALS_PATCH, return_value=CREDENTIALS),
         patch(
             VALIDATE_FIREPLACES_PATCH,
             new_callable=AsyncMock,
@@ -220,7 +305,7 @@ async def test_user_step_no_wifi_fireplaces_aborts(hass: HomeAssistant) -> None:
 async def test_user_step_fireplace_check_api_error(hass: HomeAssistant) -> None:
     """Test that a connection error during fireplace check shows cannot_connect."""
     with (
-        patch(VALIDATE_CREDENTIALS_PATCH, return_value="fake-cache"),
+        patch(VALIDATE_CREDENTIALS_PATCH, return_value=CREDENTIALS),
         patch(
             VALIDATE_FIREPLACES_PATCH,
             new_callable=AsyncMock,
@@ -240,7 +325,7 @@ async def test_user_step_fireplace_check_api_error(hass: HomeAssistant) -> None:
 async def test_user_step_fireplace_check_os_error(hass: HomeAssistant) -> None:
     """Test that an OSError during fireplace check shows cannot_connect."""
     with (
-        patch(VALIDATE_CREDENTIALS_PATCH, return_value="fake-cache"),
+        patch(VALIDATE_CREDENTIALS_PATCH, return_value=CREDENTIALS),
         patch(
             VALIDATE_FIREPLACES_PATCH,
             new_callable=AsyncMock,
@@ -255,3 +340,35 @@ async def test_user_step_fireplace_check_os_error(hass: HomeAssistant) -> None:
 
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {"base": "cannot_connect"}
+
+
+# ------------------------------------------------------------------
+# Options flow
+# ------------------------------------------------------------------
+
+
+async def test_options_flow_enables_offline_queue(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_setup_entry: MagicMock,
+) -> None:
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"offline_queue": True},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert config_entry.options == {
+        "offline_queue": True,
+        "debounce_min_delay": 0.3,
+        "debounce_max_delay": 3.0,
+        "read_timeout": 30.0,
+        "write_timeout": 10.0,
+        "dedicated_session": False,
+    }
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
-from unittest.mock import AsyncMock, patch
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 from flameconnect import (
     ApiError,
     AuthenticationError,
@@ -14,15 +18,33 @@
     FlameConnectError,
     FlameEffect,
     FlameEffectParam,
+    HeatMode,
+    HeatParam,
     ModeParam,
+    SoundParam,
+    TimerParam,
+    TimerStatus,
 )
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
 from custom_components.flameconnect.coordinator import FlameConnectDataUpdateCoordinator
+from custom_components.flameconnect.coordinator.error_handling import CallTimeoutError
+from custom_components.flameconnect.coordinator.scheduler import ExpiryScheduler
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationError
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util.dt import utcnow
+
+ERROR_HANDLING_MODULE = "custom_components.flameconnect.coordinator.error_handling"
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay():
+    """Retry failed writes without waiting for the backoff delay."""
+    with patch(f"{ERROR_HANDLING_MODULE}.uniform", return_value=0):
+        yield
+
 
 # ------------------------------------------------------------------
 # _async_setup: fire filtering
@@ -284,8 +306,8 @@ async def test_write_fields_optimistic_update(
     """Test that async_write_fields updates coordinator data optimistically.
 
     After writing, the coordinator should reflect the new parameter value
-    immediately.  A confirmation refresh is also requested to re-read the
-    API and confirm (or correct) the optimistic state.
+    immediately.  A targeted confirmation read of the written fire is
+    scheduled to confirm (or correct) the optimistic state.
     """
     config_entry.add_to_hass(hass)
 
@@ -293,9 +315,9 @@ async def test_write_fields_optimistic_update(
     coordinator.fires = [mock_fire]
     coordinator.async_set_updated_data({"abc123": mock_fire_overview})
 
-    with patch.object(coordinator, "async_request_refresh", new_callable=AsyncMock) as mock_refresh:
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock) as mock_confirm:
         await coordinator.async_write_fields("abc123", FlameEffectParam, flame_effect=FlameEffect.OFF)
-        mock_refresh.assert_awaited_once()
+        mock_confirm.assert_awaited_once_with("abc123", {FlameEffectParam: {"flame_effect": FlameEffect.OFF}})
 
     # API write must have been performed
     mock_flameconnect_client.write_parameters.assert_called_once()
@@ -327,9 +349,9 @@ async def test_turn_on_fire_optimistic_update(
     coordinator.fires = [mock_fire]
     coordinator.async_set_updated_data({"abc123": standby_overview})
 
-    with patch.object(coordinator, "async_request_refresh", new_callable=AsyncMock) as mock_refresh:
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock) as mock_confirm:
         await coordinator.async_turn_on_fire("abc123")
-        mock_refresh.assert_awaited_once()
+        mock_confirm.assert_awaited_once_with("abc123", {ModeParam: {"mode": FireMode.MANUAL}})
 
     # API call must have been performed
     mock_flameconnect_client.turn_on.assert_called_once_with("abc123")
@@ -355,9 +377,9 @@ async def test_turn_off_fire_optimistic_update(
     # Start with MANUAL mode (from fixture default)
     coordinator.async_set_updated_data({"abc123": mock_fire_overview})
 
-    with patch.object(coordinator, "async_request_refresh", new_callable=AsyncMock) as mock_refresh:
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock) as mock_confirm:
         await coordinator.async_turn_off_fire("abc123")
-        mock_refresh.assert_awaited_once()
+        mock_confirm.assert_awaited_once_with("abc123", {ModeParam: {"mode": FireMode.STANDBY}})
 
     # API call must have been performed
     mock_flameconnect_client.turn_off.assert_called_once_with("abc123")
@@ -366,3 +388,1327 @@ async def test_turn_off_fire_optimistic_update(
     updated_overview = coordinator.data["abc123"]
     mode_param = next(p for p in updated_overview.parameters if isinstance(p, ModeParam))
     assert mode_param.mode == FireMode.STANDBY
+
+
+# ------------------------------------------------------------------
+# async_write_fields_debounced: max-wait ceiling
+# ------------------------------------------------------------------
+
+COORDINATOR_MODULE = "custom_components.flameconnect.coordinator.base"
+
+
+async def test_write_fields_debounced_max_wait_caps_delay(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+) -> None:
+    """Test that continuous input is flushed once the max-wait ceiling is reached.
+
+    Each call restarts the 1 s quiet period, but the timer is never set
+    beyond the ceiling measured from the first change of the burst.
+    """
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+
+    with (
+        patch(f"{COORDINATOR_MODULE}.monotonic", side_effect=[0.0, 1.5, 2.5]),
+        patch(f"{COORDINATOR_MODULE}.async_call_later") as mock_call_later,
+    ):
+        await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, max_wait=3.0, flame_speed=2)
+        await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, max_wait=3.0, flame_speed=3)
+        await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, max_wait=3.0, flame_speed=4)
+
+    delays = [call.args[1] for call in mock_call_later.call_args_list]
+    assert delays == [1.0, 1.0, 0.5]
+    assert coordinator._pending_writes[("abc123", FlameEffectParam)] == {"flame_speed": 4}  # noqa: SLF001
+
+
+async def test_write_fields_debounced_max_wait_resets_after_flush(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+) -> None:
+    """Test that a flush starts a new burst with a fresh max-wait window."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+
+    with (
+        patch(f"{COORDINATOR_MODULE}.monotonic", side_effect=[0.0, 10.0]),
+        patch(f"{COORDINATOR_MODULE}.async_call_later") as mock_call_later,
+        patch.object(coordinator, "async_write_fields", new_callable=AsyncMock) as mock_write,
+    ):
+        await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, max_wait=3.0, flame_speed=2)
+        coordinator._flush_debounced_write("abc123", FlameEffectParam, utcnow())  # noqa: SLF001
+        await hass.async_block_till_done()
+        await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, max_wait=3.0, flame_speed=5)
+
+    mock_write.assert_awaited_once_with("abc123", FlameEffectParam, flame_speed=2)
+    delays = [call.args[1] for call in mock_call_later.call_args_list]
+    assert delays == [1.0, 1.0]
+
+
+async def test_debounce_delay_adapts_to_write_round_trip_time(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that the quiet period follows the smoothed write round-trip time."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    assert coordinator.debounce_delay == 1.0
+
+    coordinator._record_write_rtt(0.4)  # noqa: SLF001
+    assert coordinator.debounce_delay == pytest.approx(0.8)
+
+    coordinator._record_write_rtt(0.8)  # noqa: SLF001
+    assert coordinator.write_rtt == pytest.approx(0.5)
+    assert coordinator.debounce_delay == pytest.approx(1.0)
+
+    with patch(f"{COORDINATOR_MODULE}.async_call_later") as mock_call_later:
+        await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, flame_speed=2)
+
+    assert mock_call_later.call_args.args[1] == pytest.approx(1.0)
+
+
+async def test_write_round_trip_time_excludes_retry_backoff(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that only time on the wire is sampled, not the wait before a retry."""
+    config_entry.add_to_hass(hass)
+    mock_flameconnect_client.write_parameters.side_effect = [ApiError(503, "service unavailable"), None]
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with (
+        patch(f"{ERROR_HANDLING_MODULE}.uniform", return_value=0.2),
+        patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock),
+    ):
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+
+    assert coordinator.write_rtt is not None
+    assert coordinator.write_rtt < 0.2
+
+
+async def test_debounce_delay_is_clamped_to_configured_bounds(
+    hass: HomeAssistant,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that very fast and very slow links stay within the option bounds."""
+    entry = MockConfigEntry(
+        domain="flameconnect",
+        data={"token_cache": "fake-cache-data"},
+        options={"debounce_min_delay": 0.5, "debounce_max_delay": 2.0},
+    )
+    entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, entry)
+
+    coordinator._record_write_rtt(0.01)  # noqa: SLF001
+    assert coordinator.debounce_delay == 0.5
+
+    coordinator.write_rtt = 10.0
+    assert coordinator.debounce_delay == 2.0
+
+
+# ------------------------------------------------------------------
+# Pending overlay
+# ------------------------------------------------------------------
+
+
+def _flame_param(coordinator: FlameConnectDataUpdateCoordinator) -> FlameEffectParam:
+    return next(p for p in coordinator.data["abc123"].parameters if isinstance(p, FlameEffectParam))
+
+
+async def test_write_fields_overlay_applied_before_network_write(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that entities see the requested value before the API write returns."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    seen: list[FlameEffect] = []
+
+    async def _record_state(*_args: object) -> None:
+        seen.append(_flame_param(coordinator).flame_effect)
+
+    mock_flameconnect_client.write_parameters.side_effect = _record_state
+
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock):
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_effect=FlameEffect.OFF)
+
+    assert seen == [FlameEffect.OFF]
+
+
+async def test_write_fields_failure_rolls_back_overlay(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that a failed write reverts the overlay and logs a warning."""
+    config_entry.add_to_hass(hass)
+    mock_flameconnect_client.write_parameters.side_effect = ApiError(500, "server error")
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire_overview.fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with (
+        patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock) as mock_confirm,
+        pytest.raises(ApiError),
+    ):
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_effect=FlameEffect.OFF)
+
+    mock_confirm.assert_not_awaited()
+    assert _flame_param(coordinator).flame_effect == FlameEffect.ON
+    assert "reverting to last known state" in caplog.text
+
+
+async def test_debounced_overlay_survives_refresh_until_confirmed(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a pending overlay is kept across refreshes until written and confirmed."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with patch(f"{COORDINATOR_MODULE}.async_call_later"):
+        await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, flame_speed=5)
+    assert _flame_param(coordinator).flame_speed == 5
+
+    # A background refresh still reporting the old value must not clobber the overlay.
+    coordinator.data = await coordinator._async_update_data()  # noqa: SLF001
+    assert _flame_param(coordinator).flame_speed == 5
+
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock):
+        await coordinator.async_flush_pending_writes("abc123")
+
+    # The API now reports the written value; the confirming refresh drops the overlay.
+    written = mock_flameconnect_client.write_parameters.call_args[0][1][0]
+    confirmed = dataclasses.replace(
+        mock_fire_overview,
+        parameters=[written if isinstance(p, FlameEffectParam) else p for p in mock_fire_overview.parameters],
+    )
+    mock_flameconnect_client.get_fire_overview.return_value = confirmed
+    coordinator.data = await coordinator._async_update_data()  # noqa: SLF001
+
+    assert coordinator._overlays == {}  # noqa: SLF001
+    assert _flame_param(coordinator).flame_speed == 5
+
+
+# ------------------------------------------------------------------
+# No-op write elimination
+# ------------------------------------------------------------------
+
+
+async def test_write_fields_skips_unchanged_parameter(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that re-asserting the current value skips the write and refresh."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock) as mock_confirm:
+        # Flame effect is already ON in the fixture.
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_effect=FlameEffect.ON)
+        mock_confirm.assert_not_awaited()
+
+    mock_flameconnect_client.get_fire_overview.assert_awaited_once_with("abc123")
+    mock_flameconnect_client.write_parameters.assert_not_called()
+    assert coordinator.skipped_writes == 1
+    assert coordinator._overlays == {}  # noqa: SLF001
+    assert coordinator.async_get_diagnostics()["skipped_writes"] == 1
+
+
+# ------------------------------------------------------------------
+# Write confirmation
+# ------------------------------------------------------------------
+
+
+def _with_flame_effect(overview: FireOverview, flame_effect: FlameEffect) -> FireOverview:
+    return dataclasses.replace(
+        overview,
+        parameters=[
+            dataclasses.replace(p, flame_effect=flame_effect) if isinstance(p, FlameEffectParam) else p
+            for p in overview.parameters
+        ],
+    )
+
+
+async def test_write_fields_confirms_with_targeted_read(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a write is confirmed by re-reading only the written fire."""
+    config_entry.add_to_hass(hass)
+    mock_flameconnect_client.get_fire_overview.side_effect = [
+        mock_fire_overview,
+        _with_flame_effect(mock_fire_overview, FlameEffect.OFF),
+    ]
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with patch.object(coordinator, "async_request_refresh", new_callable=AsyncMock) as mock_refresh:
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_effect=FlameEffect.OFF)
+        mock_refresh.assert_not_awaited()
+
+    assert mock_flameconnect_client.get_fire_overview.await_count == 2
+    assert coordinator._overlays == {}  # noqa: SLF001
+    assert _flame_param(coordinator).flame_effect == FlameEffect.OFF
+    assert coordinator.write_mismatches == 0
+
+
+async def test_failed_confirmation_read_keeps_the_written_value(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a connection error on the confirmation read does not fail the write."""
+    config_entry.add_to_hass(hass)
+    mock_flameconnect_client.get_fire_overview.side_effect = [
+        mock_fire_overview,
+        aiohttp.ClientConnectionError("connection reset"),
+    ]
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    await coordinator.async_write_fields("abc123", FlameEffectParam, flame_effect=FlameEffect.OFF)
+
+    mock_flameconnect_client.write_parameters.assert_awaited_once()
+    # The overlay is kept until a later confirmation read settles it.
+    assert _flame_param(coordinator).flame_effect == FlameEffect.OFF
+    assert coordinator.write_mismatches == 0
+    await coordinator.async_shutdown()
+
+
+async def test_refresh_fires_skips_fires_with_connection_errors(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a connection error re-reading one fire does not stop the others."""
+    config_entry.add_to_hass(hass)
+    other_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    other_overview = dataclasses.replace(mock_fire_overview, fire=other_fire)
+    updated = _with_flame_effect(other_overview, FlameEffect.OFF)
+    mock_flameconnect_client.get_fire_overview.side_effect = [TimeoutError(), updated]
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire, other_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview, "def456": other_overview})
+
+    await coordinator.async_refresh_fires(["abc123", "def456"])
+
+    assert coordinator.data == {"abc123": mock_fire_overview, "def456": updated}
+
+
+async def test_write_fields_confirmation_retries_then_records_mismatch(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that confirmation retries on a backoff and gives up after the budget."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with patch(f"{COORDINATOR_MODULE}.CONFIRM_RETRY_DELAYS", (1.0, 2.0)):
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_effect=FlameEffect.OFF)
+
+        # The cloud has not caught up yet: the overlay is still shown.
+        assert _flame_param(coordinator).flame_effect == FlameEffect.OFF
+
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1.5))
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=4))
+        await hass.async_block_till_done()
+
+    # Read-before-write, initial confirmation read and two retries.
+    assert mock_flameconnect_client.get_fire_overview.await_count == 4
+    assert coordinator.write_mismatches == 1
+    assert coordinator.last_write_mismatch == {
+        "parameter": "FlameEffectParam",
+        "expected": {"flame_effect": str(FlameEffect.OFF)},
+        "reported": {"flame_effect": str(FlameEffect.ON)},
+    }
+    assert _flame_param(coordinator).flame_effect == FlameEffect.ON
+
+
+# ------------------------------------------------------------------
+# Write priority over background polls
+# ------------------------------------------------------------------
+
+
+async def test_poll_yields_to_inflight_write(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a poll defers its reads while a write is in flight."""
+    config_entry.add_to_hass(hass)
+    other_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    other_overview = dataclasses.replace(mock_fire_overview, fire=other_fire)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire, other_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview, "def456": other_overview})
+
+    async with coordinator._async_priority_write():  # noqa: SLF001
+        data = await coordinator._async_update_data()  # noqa: SLF001
+        mock_flameconnect_client.get_fire_overview.assert_not_awaited()
+
+    assert data == {"abc123": mock_fire_overview, "def456": other_overview}
+    assert coordinator.preempted_polls == 1
+
+    # The deferred fires are re-read once the write has finished.
+    await hass.async_block_till_done()
+    assert [c.args[0] for c in mock_flameconnect_client.get_fire_overview.await_args_list] == ["abc123", "def456"]
+
+
+async def test_deferred_reread_yields_to_the_next_write(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that re-reading preempted fires stops again for a later write."""
+    config_entry.add_to_hass(hass)
+    other_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    other_overview = dataclasses.replace(mock_fire_overview, fire=other_fire)
+    read_started = asyncio.Event()
+    release_read = asyncio.Event()
+
+    async def _get_overview(fire_id: str) -> FireOverview:
+        read_started.set()
+        await release_read.wait()
+        return mock_fire_overview if fire_id == "abc123" else other_overview
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire, other_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview, "def456": other_overview})
+
+    async with coordinator._async_priority_write():  # noqa: SLF001
+        await coordinator._async_update_data()  # noqa: SLF001
+
+    # The deferred re-read of abc123 is on the wire when the next write starts.
+    await read_started.wait()
+    async with coordinator._async_priority_write():  # noqa: SLF001
+        release_read.set()
+        await asyncio.sleep(0.01)
+        assert [c.args[0] for c in mock_flameconnect_client.get_fire_overview.await_args_list] == ["abc123"]
+
+    await hass.async_block_till_done()
+    assert [c.args[0] for c in mock_flameconnect_client.get_fire_overview.await_args_list] == ["abc123", "def456"]
+
+
+async def test_stale_poll_does_not_overwrite_confirmed_write(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a poll read started before a write cannot revert its result."""
+    config_entry.add_to_hass(hass)
+    other_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    other_overview = dataclasses.replace(mock_fire_overview, fire=other_fire)
+    confirmed = _with_flame_effect(mock_fire_overview, FlameEffect.OFF)
+    release_poll = asyncio.Event()
+
+    async def _get_overview(fire_id: str) -> FireOverview:
+        if fire_id == "def456":
+            # The poll is still waiting on its next fire while the write runs.
+            await release_poll.wait()
+            return other_overview
+        return confirmed if mock_flameconnect_client.write_parameters.await_count else mock_fire_overview
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire, other_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview, "def456": other_overview})
+
+    # The poll reads pre-write data for abc123, then blocks on def456.
+    poll = hass.async_create_task(coordinator._async_update_data())  # noqa: SLF001
+    while mock_flameconnect_client.get_fire_overview.await_count < 2:
+        await asyncio.sleep(0)
+    await coordinator.async_write_fields("abc123", FlameEffectParam, flame_effect=FlameEffect.OFF)
+    release_poll.set()
+    data = await poll
+
+    flame = next(p for p in data["abc123"].parameters if isinstance(p, FlameEffectParam))
+    assert flame.flame_effect == FlameEffect.OFF
+
+
+async def test_concurrent_reads_of_a_fire_share_one_request(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that overlapping refreshes of the same fire send a single read."""
+    config_entry.add_to_hass(hass)
+    release = asyncio.Event()
+
+    async def _get_overview(fire_id: str) -> FireOverview:
+        await release.wait()
+        return mock_fire_overview
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    refreshes = [hass.async_create_task(coordinator.async_refresh_fires({"abc123"})) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*refreshes)
+
+    mock_flameconnect_client.get_fire_overview.assert_awaited_once_with("abc123")
+    diagnostics = coordinator.async_get_diagnostics()
+    assert diagnostics["overview_reads"] == 1
+    assert diagnostics["overview_read_dedup_hits"] == 2
+
+
+async def test_read_after_write_is_not_shared_with_earlier_read(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a write makes later readers start a fresh request."""
+    config_entry.add_to_hass(hass)
+    write_sent = asyncio.Event()
+    release_write = asyncio.Event()
+    release_read = asyncio.Event()
+
+    async def _get_overview(fire_id: str) -> FireOverview:
+        if mock_flameconnect_client.get_fire_overview.await_count == 2:
+            await release_read.wait()
+        return mock_fire_overview
+
+    async def _write(fire_id: str, params: list) -> None:
+        write_sent.set()
+        await release_write.wait()
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
+    mock_flameconnect_client.write_parameters.side_effect = _write
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock):
+        write = hass.async_create_task(coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5))
+        await write_sent.wait()
+        # A read started while the write is on the wire...
+        early_read = hass.async_create_task(coordinator.async_refresh_fires({"abc123"}))
+        await asyncio.sleep(0)
+        release_write.set()
+        await write
+
+        # ...is not shared with a read started after the write landed.
+        async with asyncio.timeout(1):
+            await coordinator.async_refresh_fires({"abc123"})
+        assert mock_flameconnect_client.get_fire_overview.await_count == 3
+
+        release_read.set()
+        await early_read
+
+
+# ------------------------------------------------------------------
+# Offline write queue
+# ------------------------------------------------------------------
+
+
+@pytest.fixture
+def queue_entry() -> MockConfigEntry:
+    return MockConfigEntry(
+        domain="flameconnect",
+        data={"token_cache": "fake-cache-data"},
+        options={"offline_queue": True},
+        unique_id="user-example-com",
+        title="user@example.com",
+    )
+
+
+async def test_unreachable_write_is_queued_and_replayed_in_one_batch(
+    hass: HomeAssistant,
+    queue_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that writes failing with a server error are queued and replayed together."""
+    queue_entry.add_to_hass(hass)
+    mock_flameconnect_client.write_parameters.side_effect = ApiError(503, "service unavailable")
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, queue_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=4)
+    await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+    await coordinator.async_write_fields("abc123", SoundParam, volume=10)
+
+    # The change is kept on screen and flagged as pending.
+    assert _flame_param(coordinator).flame_speed == 5
+    assert coordinator.write_queue.has_pending("abc123")
+    assert coordinator.async_get_diagnostics()["queued_writes"] == 2
+
+    mock_flameconnect_client.write_parameters.reset_mock(side_effect=True)
+    await coordinator.async_replay_queue()
+
+    mock_flameconnect_client.write_parameters.assert_awaited_once()
+    written = {type(p): p for p in mock_flameconnect_client.write_parameters.call_args[0][1]}
+    assert written[FlameEffectParam].flame_speed == 5
+    assert written[SoundParam].volume == 10
+    assert not coordinator.write_queue.has_pending("abc123")
+
+
+async def test_client_error_is_not_queued(
+    hass: HomeAssistant,
+    queue_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a rejected write is rolled back rather than queued."""
+    queue_entry.add_to_hass(hass)
+    mock_flameconnect_client.write_parameters.side_effect = ApiError(400, "bad request")
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, queue_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with pytest.raises(ApiError):
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+
+    assert not coordinator.write_queue.has_pending("abc123")
+    assert _flame_param(coordinator).flame_speed == 3
+
+
+async def test_expired_queued_write_is_discarded(
+    hass: HomeAssistant,
+    queue_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that queued changes older than the maximum age are not replayed."""
+    queue_entry.add_to_hass(hass)
+    mock_flameconnect_client.write_parameters.side_effect = ApiError(503, "service unavailable")
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, queue_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+
+    mock_flameconnect_client.write_parameters.reset_mock(side_effect=True)
+    with patch("custom_components.flameconnect.coordinator.write_queue.time") as mock_time:
+        mock_time.time.return_value = utcnow().timestamp() + 3600
+        await coordinator.async_replay_queue()
+
+    mock_flameconnect_client.write_parameters.assert_not_called()
+    assert _flame_param(coordinator).flame_speed == 3
+
+
+async def test_vanished_fire_leaves_no_queued_changes_or_data(
+    hass: HomeAssistant,
+    queue_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a fire removed from the account is dropped from data, locks and the queue."""
+    queue_entry.add_to_hass(hass)
+    mock_flameconnect_client.write_parameters.side_effect = ApiError(503, "service unavailable")
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, queue_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+    await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+    assert coordinator.write_queue.has_pending("abc123")
+
+    other_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    mock_flameconnect_client.get_fires.return_value = [other_fire]
+    mock_flameconnect_client.get_fire_overview.side_effect = FlameConnectError("cloud down")
+    await coordinator.async_rediscover()
+
+    assert "abc123" not in coordinator.data
+    assert not coordinator.write_queue.has_pending("abc123")
+    assert "abc123" not in coordinator._write_locks  # noqa: SLF001
+
+
+async def test_loading_the_queue_keeps_changes_queued_meanwhile(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    queue_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that stored changes are merged with changes queued before the load finished."""
+    queue_entry.add_to_hass(hass)
+    key = f"flameconnect.{queue_entry.entry_id}.write_queue"
+    queued_at = utcnow().timestamp()
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "abc123": {
+                "FlameEffectParam": {"fields": {"flame_speed": 2}, "queued_at": queued_at},
+                "SoundParam": {"fields": {"volume": 10}, "queued_at": queued_at},
+            }
+        },
+    }
+    mock_flameconnect_client.write_parameters.side_effect = ApiError(503, "service unavailable")
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, queue_entry)
+    coordinator.fires = [mock_fire_overview.fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+    await coordinator.write_queue.async_load()
+
+    mock_flameconnect_client.write_parameters.reset_mock(side_effect=True)
+    await coordinator.async_replay_queue()
+
+    written = {type(p): p for p in mock_flameconnect_client.write_parameters.call_args[0][1]}
+    assert written[FlameEffectParam].flame_speed == 5
+    assert written[SoundParam].volume == 10
+
+
+# ------------------------------------------------------------------
+# Write retries
+# ------------------------------------------------------------------
+
+
+async def test_write_fields_retries_transient_error_without_rereading(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a transient write failure is re-sent from the same read."""
+    config_entry.add_to_hass(hass)
+    mock_flameconnect_client.write_parameters.side_effect = [ApiError(503, "service unavailable"), None]
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock):
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+
+    assert mock_flameconnect_client.write_parameters.await_count == 2
+    mock_flameconnect_client.get_fire_overview.assert_awaited_once_with("abc123")
+    assert coordinator.async_get_diagnostics()["write_retries"] == 1
+
+
+async def test_write_fields_rereads_after_version_conflict(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a version conflict re-reads the overview before writing again."""
+    config_entry.add_to_hass(hass)
+    mock_flameconnect_client.write_parameters.side_effect = [ApiError(409, "conflict"), None]
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock):
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+
+    assert mock_flameconnect_client.write_parameters.await_count == 2
+    assert mock_flameconnect_client.get_fire_overview.await_count == 2
+
+
+async def test_turn_on_retries_stop_when_budget_is_spent(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that retries stop once the shared retry budget is used up."""
+    config_entry.add_to_hass(hass)
+    mock_flameconnect_client.turn_on.side_effect = ApiError(503, "service unavailable")
+
+    with patch(f"{COORDINATOR_MODULE}.WRITE_RETRY_BUDGET", 1):
+        coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with pytest.raises(ApiError):
+        await coordinator.async_turn_on_fire("abc123")
+
+    # One retry allowed by the budget, then the third attempt is refused.
+    assert mock_flameconnect_client.turn_on.await_count == 2
+    assert coordinator.retry_policy.budget_exhausted == 1
+
+
+async def test_hung_write_times_out_and_releases_lock(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a write past its budget raises and frees the fire for the next write."""
+    config_entry.add_to_hass(hass)
+    hang = asyncio.Event()
+
+    async def _write(fire_id: str, params: list) -> None:
+        if mock_flameconnect_client.write_parameters.await_count <= 3:
+            await hang.wait()
+
+    mock_flameconnect_client.write_parameters.side_effect = _write
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+    coordinator.call_timeouts["write_parameters"] = 0.01
+
+    with (
+        patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock),
+        pytest.raises(CallTimeoutError) as err,
+    ):
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+
+    assert err.value.operation == "write_parameters"
+    # Every attempt timed out, and the overlay was rolled back.
+    assert mock_flameconnect_client.write_parameters.await_count == 3
+    assert coordinator.call_timeouts_hit == 3
+    assert coordinator.data["abc123"] == mock_fire_overview
+    assert not coordinator._write_locks["abc123"].locked()  # noqa: SLF001
+
+    with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock):
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=4)
+    assert mock_flameconnect_client.write_parameters.await_count == 4
+
+
+async def test_hung_read_before_write_times_out_at_the_write_budget(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that the read under the write lock is held to the write budget."""
+    config_entry.add_to_hass(hass)
+    hang = asyncio.Event()
+
+    async def _get_overview(fire_id: str) -> FireOverview:
+        await hang.wait()
+        return mock_fire_overview
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+    coordinator.call_timeouts["write_parameters"] = 0.01
+
+    with pytest.raises(CallTimeoutError) as err:
+        await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+
+    assert err.value.operation == "get_fire_overview"
+    mock_flameconnect_client.write_parameters.assert_not_called()
+    assert not coordinator._write_locks["abc123"].locked()  # noqa: SLF001
+    # The shared read itself was left running for other callers.
+    hang.set()
+    assert await coordinator._async_read_overview("abc123")  # noqa: SLF001
+
+
+async def test_write_timeout_is_shorter_than_read_timeout(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test the default budgets and that the options override them."""
+    config_entry.add_to_hass(hass)
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    assert coordinator.call_timeouts["write_parameters"] < coordinator.call_timeouts["get_fire_overview"]
+    assert coordinator.call_timeouts["turn_on"] == coordinator.call_timeouts["write_parameters"]
+
+    hass.config_entries.async_update_entry(config_entry, options={"read_timeout": 45.0, "write_timeout": 5.0})
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    assert coordinator.call_timeouts["get_fires"] == 45.0
+    assert coordinator.call_timeouts["turn_off"] == 5.0
+
+
+async def test_hung_poll_read_fails_the_update(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+) -> None:
+    """Test that a read past its budget surfaces as UpdateFailed."""
+    config_entry.add_to_hass(hass)
+    hang = asyncio.Event()
+
+    async def _get_overview(fire_id: str) -> FireOverview:
+        await hang.wait()
+        raise AssertionError
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.call_timeouts["get_fire_overview"] = 0.01
+
+    with pytest.raises(UpdateFailed, match="get_fire_overview did not complete"):
+        await coordinator._async_update_data()  # noqa: SLF001
+
+
+# ------------------------------------------------------------------
+# Desired-state reconciliation
+# ------------------------------------------------------------------
+
+
+async def test_reconcile_already_converged_makes_no_calls(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a fire already in the desired state is left alone."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    result = await coordinator.async_reconcile(
+        "abc123", {FlameEffectParam: {"flame_effect": FlameEffect.ON, "flame_speed": 3}}, power=True
+    )
+
+    assert result.converged
+    assert result.rounds == 0
+    mock_flameconnect_client.get_fire_overview.assert_not_awaited()
+    mock_flameconnect_client.write_parameters.assert_not_called()
+    mock_flameconnect_client.turn_on.assert_not_called()
+
+
+async def test_reconcile_writes_only_differing_fields_in_one_batch(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that only the difference is written, in a single call."""
+    config_entry.add_to_hass(hass)
+    state = {"overview": mock_fire_overview}
+
+    async def _write(fire_id: str, params: list) -> None:
+        written = {type(p): p for p in params}
+        state["overview"] = dataclasses.replace(
+            state["overview"],
+            parameters=[written.get(type(p), p) for p in state["overview"].parameters],
+        )
+
+    mock_flameconnect_client.get_fire_overview.side_effect = lambda fire_id: state["overview"]
+    mock_flameconnect_client.write_parameters.side_effect = _write
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    result = await coordinator.async_reconcile(
+        "abc123",
+        {
+            FlameEffectParam: {"flame_effect": FlameEffect.ON, "flame_speed": 5},
+            SoundParam: {"volume": 10},
+        },
+    )
+
+    assert result.converged
+    assert result.rounds == 1
+    mock_flameconnect_client.write_parameters.assert_awaited_once()
+    assert {type(p) for p in mock_flameconnect_client.write_parameters.call_args[0][1]} == {
+        FlameEffectParam,
+        SoundParam,
+    }
+
+
+async def test_reconcile_gives_up_when_device_does_not_accept(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that reconciliation stops after the round limit and reports what is left."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    with patch("custom_components.flameconnect.coordinator.reconcile.RECONCILE_RETRY_DELAY", 0):
+        result = await coordinator.async_reconcile("abc123", {FlameEffectParam: {"flame_speed": 5}})
+
+    assert not result.converged
+    assert result.rounds == 3
+    assert result.unresolved == {"FlameEffectParam": ["flame_speed"]}
+    assert mock_flameconnect_client.write_parameters.await_count == 3
+
+
+async def test_reconcile_reports_failed_reread_as_unresolved(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a failed re-read is not mistaken for the pending overlay converging."""
+    config_entry.add_to_hass(hass)
+    mock_flameconnect_client.get_fire_overview.side_effect = [mock_fire_overview, FlameConnectError("cloud down")]
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    result = await coordinator.async_reconcile("abc123", {FlameEffectParam: {"flame_speed": 5}})
+
+    assert not result.converged
+    assert result.rounds == 1
+    assert result.unresolved == {"FlameEffectParam": ["flame_speed"]}
+
+
+async def test_reconcile_rejects_fire_without_overview(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+) -> None:
+    """Test that reconciling a fire that has not reported yet is a validation error."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({})
+
+    with pytest.raises(ServiceValidationError):
+        await coordinator.async_reconcile("abc123", {FlameEffectParam: {"flame_speed": 5}})
+
+    mock_flameconnect_client.write_parameters.assert_not_called()
+
+
+# ------------------------------------------------------------------
+# Predicted timer and boost expiry
+# ------------------------------------------------------------------
+
+
+def _with_param(overview: FireOverview, param_type: type, **changes: object) -> FireOverview:
+    return dataclasses.replace(
+        overview,
+        parameters=[dataclasses.replace(p, **changes) if isinstance(p, param_type) else p for p in overview.parameters],
+    )
+
+
+def _param(coordinator: FlameConnectDataUpdateCoordinator, param_type: type) -> object:
+    return next(p for p in coordinator.data["abc123"].parameters if isinstance(p, param_type))
+
+
+async def test_timer_expiry_applies_standby_then_confirms_once(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that the fire goes to standby at the timer end, then one read confirms it."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    start = utcnow()
+    coordinator.async_set_updated_data(
+        {"abc123": _with_param(mock_fire_overview, TimerParam, timer_status=TimerStatus.ENABLED, duration=30)}
+    )
+
+    timer_end = coordinator.expiries[("abc123", "timer")]
+    assert timedelta(minutes=29) < timer_end - start <= timedelta(minutes=30, seconds=1)
+
+    async_fire_time_changed(hass, timer_end + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert _param(coordinator, TimerParam).timer_status == TimerStatus.DISABLED
+    assert _param(coordinator, ModeParam).mode == FireMode.STANDBY
+    assert ("abc123", "timer") not in coordinator.expiries
+    mock_flameconnect_client.get_fire_overview.assert_not_awaited()
+
+    # The confirmation read is due on the first coalescing boundary at
+    # least 60 s after expiry.
+    async_fire_time_changed(hass, timer_end + timedelta(seconds=71))
+    await hass.async_block_till_done()
+
+    mock_flameconnect_client.get_fire_overview.assert_awaited_once_with("abc123")
+
+
+async def test_timer_expiry_survives_a_lagging_confirmation_read(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a read still reporting the expired timer does not start it again."""
+    config_entry.add_to_hass(hass)
+    running = _with_param(mock_fire_overview, TimerParam, timer_status=TimerStatus.ENABLED, duration=30)
+    mock_flameconnect_client.get_fire_overview.return_value = running
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.async_set_updated_data({"abc123": running})
+    timer_end = coordinator.expiries[("abc123", "timer")]
+
+    async_fire_time_changed(hass, timer_end + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, timer_end + timedelta(seconds=71))
+    await hass.async_block_till_done()
+
+    mock_flameconnect_client.get_fire_overview.assert_awaited_once_with("abc123")
+    assert _param(coordinator, TimerParam).timer_status == TimerStatus.DISABLED
+    assert _param(coordinator, ModeParam).mode == FireMode.STANDBY
+    assert coordinator.expiries == {}
+
+    # Once the cloud reports the timer ended, the API data is used as is.
+    mock_flameconnect_client.get_fire_overview.return_value = mock_fire_overview
+    await coordinator.async_read_fire("abc123")
+
+    assert _param(coordinator, ModeParam).mode == FireMode.MANUAL
+    assert coordinator.expiries == {}
+
+
+async def test_boost_expiry_restores_previous_heat_mode(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that boost falls back to the heat mode used before it started."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.async_set_updated_data({"abc123": _with_param(mock_fire_overview, HeatParam, heat_mode=HeatMode.ECO)})
+    coordinator.async_set_updated_data(
+        {"abc123": _with_param(mock_fire_overview, HeatParam, heat_mode=HeatMode.BOOST, boost_duration=10)}
+    )
+
+    boost_end = coordinator.expiries[("abc123", "boost")]
+    async_fire_time_changed(hass, boost_end + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert _param(coordinator, HeatParam).heat_mode == HeatMode.ECO
+    assert ("abc123", "boost") not in coordinator.expiries
+
+
+async def test_expiry_cancelled_when_countdown_stops(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that turning the timer off before it ends cancels the prediction."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.async_set_updated_data(
+        {"abc123": _with_param(mock_fire_overview, TimerParam, timer_status=TimerStatus.ENABLED, duration=30)}
+    )
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    assert coordinator.expiries == {}
+    async_fire_time_changed(hass, utcnow() + timedelta(minutes=32))
+    await hass.async_block_till_done()
+
+    assert _param(coordinator, ModeParam).mode == FireMode.MANUAL
+    mock_flameconnect_client.get_fire_overview.assert_not_awaited()
+
+
+async def test_scheduler_coalesces_confirmation_reads_across_fires(hass: HomeAssistant) -> None:
+    """Test that fires expiring together are confirmed with a single refresh."""
+    refresh = AsyncMock()
+    on_expire = MagicMock(side_effect=lambda fire_id, event: scheduler.request_refresh(fire_id, 60))
+    scheduler = ExpiryScheduler(hass, on_expire, refresh)
+    when = utcnow() + timedelta(minutes=5)
+
+    scheduler.schedule("abc123", "timer", when)
+    scheduler.schedule("abc123", "timer", when)
+    scheduler.schedule("def456", "boost", when + timedelta(milliseconds=5))
+    assert [(item["fire_id"], item["event"]) for item in scheduler.pending()] == [
+        ("abc123", "timer"),
+        ("def456", "boost"),
+    ]
+
+    async_fire_time_changed(hass, when + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert on_expire.call_count == 2
+    assert {item["event"] for item in scheduler.pending()} == {"confirm_refresh"}
+
+    async_fire_time_changed(hass, when + timedelta(seconds=75))
+    await hass.async_block_till_done()
+
+    refresh.assert_awaited_once_with({"abc123", "def456"})
+    assert scheduler.pending() == []
+
+
+async def test_diagnostics_lists_scheduled_expiries(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that pending expiry events are reported in diagnostics."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.async_set_updated_data(
+        {"abc123": _with_param(mock_fire_overview, TimerParam, timer_status=TimerStatus.ENABLED, duration=30)}
+    )
+
+    assert coordinator.async_get_diagnostics()["scheduled_events"] == [
+        {
+            "fire_id": "abc123",
+            "event": "timer",
+            "due": coordinator.expiries[("abc123", "timer")].isoformat(),
+        }
+    ]
+
+
+# ------------------------------------------------------------------
+# Draining pending writes on shutdown
+# ------------------------------------------------------------------
+
+
+async def test_shutdown_flushes_pending_writes_as_one_batch(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that debounced changes are written in a single call on shutdown."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.fires = [mock_fire]
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, flame_speed=5)
+    await coordinator.async_write_fields_debounced("abc123", SoundParam, volume=10)
+    await coordinator.async_shutdown()
+
+    mock_flameconnect_client.write_parameters.assert_awaited_once()
+    written = {type(p): p for p in mock_flameconnect_client.write_parameters.call_args[0][1]}
+    assert written[FlameEffectParam].flame_speed == 5
+    assert written[SoundParam].volume == 10
+    assert coordinator._pending_writes == {}  # noqa: SLF001
+    assert coordinator._debounce_timers == {}  # noqa: SLF001
+    assert coordinator.last_drain_duration is not None
+
+
+async def test_shutdown_drain_abandons_writes_after_deadline(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that a hung write is cancelled and logged once the deadline passes."""
+    config_entry.add_to_hass(hass)
+
+    async def _hang(fire_id: str, params: list) -> None:
+        await asyncio.Event().wait()
+
+    mock_flameconnect_client.write_parameters.side_effect = _hang
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+    await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, flame_speed=5)
+    with patch(f"{COORDINATOR_MODULE}.SHUTDOWN_DRAIN_TIMEOUT", 0.01):
+        await coordinator.async_drain_pending_writes()
+
+    assert "Abandoned pending FlameEffectParam changes to fire abc123" in caplog.text
+    assert coordinator.last_drain_duration is not None
+
+
+async def test_drain_without_pending_writes_is_a_no_op(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that nothing is written or recorded when no writes are pending."""
+    config_entry.add_to_hass(hass)
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, mock_flameconnect_client, config_entry)
+    await coordinator.async_drain_pending_writes()
+
+    mock_flameconnect_client.write_parameters.assert_not_called()
+    assert coordinator.last_drain_duration is None
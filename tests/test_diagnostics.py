@@ -0,0 +1,60 @@
+"""Tests for FlameConnect diagnostics."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.flameconnect.diagnostics import async_get_config_entry_diagnostics
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+
+
+async def _setup_integration(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_client: AsyncMock,
+) -> None:
+    """Set up the integration with mocked client."""
+    config_entry.add_to_hass(hass)
+    with (
+        patch(
+            "custom_components.flameconnect.FlameConnectClient",
+            return_value=mock_client,
+        ),
+        patch("custom_components.flameconnect.TokenAuth"),
+        patch("custom_components.flameconnect.create_token_provider"),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_diagnostics_redacts_token_cache(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test the token cache is redacted from the entry data."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    result = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert result["entry_data"] == {"token_cache": REDACTED}
+
+
+async def test_diagnostics_includes_coordinator_stats(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test coordinator write statistics are reported."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    result = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert result["coordinator"]["skipped_writes"] == 0
+    assert result["coordinator"]["preempted_polls"] == 0
+    assert result["coordinator"]["queued_writes"] == 0
+    assert result["coordinator"]["write_retries"] == 0
+    assert result["coordinator"]["last_drain_duration"] is None
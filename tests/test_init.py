@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+from datetime import timedelta
+from time import monotonic
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from flameconnect import Fire, FireOverview, FlameConnectError, FlameEffectParam
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
+from custom_components.flameconnect.api import SetupHandoff, async_store_handoff
+from custom_components.flameconnect.const import SNAPSHOT_STALE_WINDOW
+from custom_components.flameconnect.coordinator.data_processing import encode_overview, encode_value
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.dt import utcnow
 
 DOMAIN = "flameconnect"
 
@@ -62,3 +75,334 @@ async def test_async_unload_entry(
     await hass.async_block_till_done()
 
     assert config_entry.state.name == "NOT_LOADED"
+
+
+async def test_pending_writes_are_flushed_when_home_assistant_stops(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that debounced writes still pending at stop are sent."""
+    config_entry.add_to_hass(hass)
+    with (
+        patch("custom_components.flameconnect.create_token_provider"),
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = config_entry.runtime_data.coordinator
+    await coordinator.async_write_fields_debounced("abc123", FlameEffectParam, delay=60, flame_speed=5)
+    mock_flameconnect_client.write_parameters.assert_not_called()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    mock_flameconnect_client.write_parameters.assert_awaited_once()
+    assert config_entry.state.name == "LOADED"
+
+
+def _store_snapshot(
+    hass_storage: dict[str, Any], config_entry: MockConfigEntry, mock_fire_overview: FireOverview
+) -> None:
+    """Save a startup snapshot of the mock fire for *config_entry*."""
+    key = f"{DOMAIN}.{config_entry.entry_id}.startup"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "fires": [encode_value(mock_fire_overview.fire)],
+            "overviews": {"abc123": encode_overview(mock_fire_overview)},
+        },
+    }
+
+
+async def test_setup_from_snapshot_while_cloud_is_down(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a saved snapshot brings entities up stale when the cloud is unreachable."""
+    config_entry.add_to_hass(hass)
+    _store_snapshot(hass_storage, config_entry, mock_fire_overview)
+    overview = mock_flameconnect_client.get_fire_overview.return_value
+    mock_flameconnect_client.get_fires.side_effect = FlameConnectError("cloud down")
+    mock_flameconnect_client.get_fire_overview.side_effect = FlameConnectError("cloud down")
+
+    with (
+        patch("custom_components.flameconnect.create_token_provider"),
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert config_entry.state.name == "LOADED"
+    coordinator = config_entry.runtime_data.coordinator
+    assert coordinator.data["abc123"] == mock_fire_overview
+    state = hass.states.get("number.living_room_flame_speed")
+    assert state is not None
+    assert float(state.state) == 3.0
+    assert state.attributes["stale"] is True
+
+    mock_flameconnect_client.get_fires.side_effect = None
+    mock_flameconnect_client.get_fire_overview.side_effect = None
+    mock_flameconnect_client.get_fire_overview.return_value = overview
+    await coordinator.async_revalidate()
+    await hass.async_block_till_done()
+
+    assert not coordinator.stale
+    assert "stale" not in hass.states.get("number.living_room_flame_speed").attributes
+
+
+async def test_snapshot_is_unavailable_after_the_revalidation_window(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that snapshot data is not shown as available for a whole outage."""
+    config_entry.add_to_hass(hass)
+    _store_snapshot(hass_storage, config_entry, mock_fire_overview)
+    mock_flameconnect_client.get_fires.side_effect = FlameConnectError("cloud down")
+    mock_flameconnect_client.get_fire_overview.side_effect = FlameConnectError("cloud down")
+
+    with (
+        patch("custom_components.flameconnect.create_token_provider"),
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert hass.states.get("number.living_room_flame_speed").state == "3.0"
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=SNAPSHOT_STALE_WINDOW + 1))
+    await hass.async_block_till_done()
+
+    assert hass.states.get("number.living_room_flame_speed").state == STATE_UNAVAILABLE
+
+
+async def test_removing_entry_deletes_its_stores(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that the startup snapshot and queued changes are deleted with the entry."""
+    config_entry.add_to_hass(hass)
+    _store_snapshot(hass_storage, config_entry, mock_fire_overview)
+    queue_key = f"{DOMAIN}.{config_entry.entry_id}.write_queue"
+    hass_storage[queue_key] = {"version": 1, "minor_version": 1, "key": queue_key, "data": {}}
+
+    with (
+        patch("custom_components.flameconnect.create_token_provider"),
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    await hass.config_entries.async_remove(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert f"{DOMAIN}.{config_entry.entry_id}.startup" not in hass_storage
+    assert queue_key not in hass_storage
+
+
+async def test_first_setup_uses_config_flow_handoff(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that setup right after the config flow repeats none of its cloud calls."""
+    config_entry.add_to_hass(hass)
+    async_store_handoff(
+        hass,
+        config_entry.unique_id,
+        SetupHandoff(
+            fires=[mock_fire, dataclasses.replace(mock_fire, fire_id="bt_only")],
+            overviews={"abc123": mock_fire_overview},
+            no_wifi={"bt_only"},
+            fetched_at=monotonic(),
+            access_token="handed-over-token",
+            token_expires_at=monotonic() + 3600,
+        ),
+    )
+
+    with (
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+        patch("custom_components.flameconnect.TokenAuth") as token_auth,
+        patch("custom_components.flameconnect.api.token.build_msal_app") as build_msal_app,
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        get_token = token_auth.call_args.args[0]
+        assert await get_token() == "handed-over-token"
+
+    assert config_entry.state.name == "LOADED"
+    mock_flameconnect_client.get_fires.assert_not_awaited()
+    mock_flameconnect_client.get_fire_overview.assert_not_awaited()
+    build_msal_app.assert_not_called()
+    assert config_entry.runtime_data.coordinator.data["abc123"] == mock_fire_overview
+    assert hass.states.get("switch.living_room_power") is not None
+
+
+async def test_setup_registers_entities_before_overviews_arrive(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that entities exist, unavailable, while the first overview fetch is running."""
+    config_entry.add_to_hass(hass)
+    overview = mock_flameconnect_client.get_fire_overview.return_value
+    release = asyncio.Event()
+
+    async def _slow_overview(fire_id: str) -> FireOverview:
+        await release.wait()
+        return overview
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _slow_overview
+
+    with (
+        patch("custom_components.flameconnect.create_token_provider"),
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+    ):
+        setup = hass.async_create_task(hass.config_entries.async_setup(config_entry.entry_id))
+        await asyncio.sleep(0.01)
+
+        state = hass.states.get("number.living_room_flame_speed")
+        assert state is not None
+        assert state.state == "unavailable"
+
+        release.set()
+        assert await setup
+
+    assert float(hass.states.get("number.living_room_flame_speed").state) == 3.0
+
+
+async def test_setup_unloads_platforms_when_first_refresh_fails(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that a failed overview fetch retries setup without leaving entities behind."""
+    config_entry.add_to_hass(hass)
+    mock_flameconnect_client.get_fire_overview.side_effect = FlameConnectError("cloud down")
+
+    with (
+        patch("custom_components.flameconnect.create_token_provider"),
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert config_entry.state.name == "SETUP_RETRY"
+    state = hass.states.get("number.living_room_flame_speed")
+    assert state is None or state.state == "unavailable"
+    assert not hass.data["entity_components"]["number"].get_entity("number.living_room_flame_speed")
+
+
+async def test_rediscovery_adds_new_fires_and_removes_vanished_ones(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that re-discovery creates entities for new fires and removes gone ones."""
+    config_entry.add_to_hass(hass)
+    with (
+        patch("custom_components.flameconnect.create_token_provider"),
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data.coordinator
+    assert hass.states.get("number.bedroom_flame_speed") is None
+
+    other_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    overviews = {"abc123": mock_fire_overview, "def456": dataclasses.replace(mock_fire_overview, fire=other_fire)}
+    mock_flameconnect_client.get_fires.return_value = [mock_fire, other_fire]
+    mock_flameconnect_client.get_fire_overview.side_effect = lambda fire_id: overviews[fire_id]
+    mock_flameconnect_client.get_fire_overview.reset_mock()
+
+    await coordinator.async_rediscover()
+    await hass.async_block_till_done()
+
+    assert float(hass.states.get("number.bedroom_flame_speed").state) == 3.0
+    mock_flameconnect_client.get_fire_overview.assert_awaited_once_with("def456")
+
+    mock_flameconnect_client.get_fires.return_value = [other_fire]
+    await coordinator.async_rediscover()
+    await hass.async_block_till_done()
+
+    device_registry = dr.async_get(hass)
+    assert device_registry.async_get_device(identifiers={(DOMAIN, "abc123")}) is None
+    assert er.async_get(hass).async_get("number.living_room_flame_speed") is None
+    assert "abc123" not in coordinator.data
+    assert float(hass.states.get("number.bedroom_flame_speed").state) == 3.0
+
+
+async def test_rediscovery_keeps_fires_when_discovery_fails(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that a failed or empty re-discovery never removes known fires."""
+    config_entry.add_to_hass(hass)
+    with (
+        patch("custom_components.flameconnect.create_token_provider"),
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data.coordinator
+
+    mock_flameconnect_client.get_fires.side_effect = FlameConnectError("cloud down")
+    await coordinator.async_rediscover()
+    mock_flameconnect_client.get_fires.side_effect = None
+    mock_flameconnect_client.get_fires.return_value = []
+    await coordinator.async_rediscover()
+
+    assert [fire.fire_id for fire in coordinator.fires] == ["abc123"]
+    assert dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "abc123")}) is not None
+
+
+async def test_dedicated_session_is_shared_and_closed_on_last_unload(
+    hass: HomeAssistant,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that opted-in entries share one session, closed when the last unloads."""
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={"token_cache": "fake-cache-data"},
+            options={"dedicated_session": True},
+            unique_id=f"user{i}_example_com",
+        )
+        for i in range(2)
+    ]
+    with (
+        patch("custom_components.flameconnect.create_token_provider"),
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client) as client,
+    ):
+        for entry in entries:
+            entry.add_to_hass(hass)
+            await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+
+    first, second = (call.kwargs["session"] for call in client.call_args_list)
+    assert first is second
+    assert first is not async_get_clientsession(hass)
+
+    await hass.config_entries.async_unload(entries[0].entry_id)
+    await hass.async_block_till_done()
+    assert not first.closed
+
+    await hass.config_entries.async_unload(entries[1].entry_id)
+    await hass.async_block_till_done()
+    assert first.closed
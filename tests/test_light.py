@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from flameconnect import FlameEffectParam, LightStatus, LogEffect, LogEffectParam, RGBWColor
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
 from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
+from homeassistant.util.dt import utcnow
 
 
 async def _setup_integration(
@@ -113,6 +115,10 @@ async def test_media_light_turn_on_with_colour(
         blocking=True,
     )
 
+    # Colour changes are debounced; advance time so the write flushes.
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
     mock_flameconnect_client.write_parameters.assert_called_once()
     param = mock_flameconnect_client.write_parameters.call_args[0][1][0]
     assert isinstance(param, FlameEffectParam)
@@ -153,3 +159,63 @@ async def test_log_effect_light_turn_on_writes(
     param = mock_flameconnect_client.write_parameters.call_args[0][1][0]
     assert isinstance(param, LogEffectParam)
     assert param.log_effect == LogEffect.ON
+
+
+async def test_colour_wheel_drag_coalesces_writes(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test dragging a colour wheel shows each colour at once but writes only the last."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    for rgbw in ([10, 0, 0, 0], [20, 0, 0, 0], [30, 0, 0, 0]):
+        await hass.services.async_call(
+            "light",
+            "turn_on",
+            {"entity_id": "light.living_room_log_effect", "rgbw_color": rgbw},
+            blocking=True,
+        )
+        state = hass.states.get("light.living_room_log_effect")
+        assert state is not None
+        assert state.state == STATE_ON
+        assert state.attributes["rgbw_color"] == tuple(rgbw)
+
+    mock_flameconnect_client.write_parameters.assert_not_called()
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    mock_flameconnect_client.write_parameters.assert_called_once()
+    param = mock_flameconnect_client.write_parameters.call_args[0][1][0]
+    assert isinstance(param, LogEffectParam)
+    assert param.log_effect == LogEffect.ON
+    assert param.color == RGBWColor(30, 0, 0, 0)
+
+
+async def test_turn_off_after_colour_change_wins(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test an immediate turn-off absorbs a pending colour change and stays off."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    await hass.services.async_call(
+        "light",
+        "turn_on",
+        {"entity_id": "light.living_room_log_effect", "rgbw_color": [30, 0, 0, 0]},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        "light",
+        "turn_off",
+        {"entity_id": "light.living_room_log_effect"},
+        blocking=True,
+    )
+
+    mock_flameconnect_client.write_parameters.assert_called_once()
+    param = mock_flameconnect_client.write_parameters.call_args[0][1][0]
+    assert isinstance(param, LogEffectParam)
+    assert param.log_effect == LogEffect.OFF
+    assert param.color == RGBWColor(30, 0, 0, 0)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
@@ -81,3 +82,25 @@ async def test_set_flame_speed_writes(
     param = mock_flameconnect_client.write_parameters.call_args[0][1][0]
     assert isinstance(param, FlameEffectParam)
     assert param.flame_speed == 5
+
+
+async def test_description_debounce_delay_overrides_adaptive_delay(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test an entity description can pin its own debounce delay."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+    coordinator = config_entry.runtime_data.coordinator
+    entity = hass.data["entity_components"]["number"].get_entity("number.living_room_flame_speed")
+    entity.entity_description = dataclasses.replace(entity.entity_description, debounce_delay=0.2)
+
+    with patch.object(coordinator, "async_write_fields_debounced", new_callable=AsyncMock) as mock_debounced:
+        await hass.services.async_call(
+            "number",
+            "set_value",
+            {"entity_id": "number.living_room_flame_speed", "value": 4},
+            blocking=True,
+        )
+
+    mock_debounced.assert_awaited_once_with("abc123", FlameEffectParam, 0.2, flame_speed=4)
@@ -0,0 +1,131 @@
+"""Tests for the shared FlameConnect rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from flameconnect import Fire, FireOverview, FlameEffectParam
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.flameconnect.api import RateLimiter
+from custom_components.flameconnect.coordinator import FlameConnectDataUpdateCoordinator
+from custom_components.flameconnect.diagnostics import async_get_config_entry_diagnostics
+from homeassistant.core import HomeAssistant
+
+
+def _limiter(*, burst: int = 1, rate: float = 50.0) -> RateLimiter:
+    return RateLimiter(read_rate=rate, read_burst=burst, write_rate=rate, write_burst=burst)
+
+
+async def test_burst_is_served_without_waiting() -> None:
+    """Test that requests within the burst size are not delayed."""
+    limiter = _limiter(burst=3)
+
+    for _ in range(3):
+        await limiter.async_acquire("read")
+
+    assert limiter.diagnostics()["read"]["waits"] == 0
+
+
+async def test_requests_beyond_the_burst_wait_for_a_token() -> None:
+    """Test that an empty bucket makes the next request wait."""
+    limiter = _limiter()
+
+    await limiter.async_acquire("read")
+    await limiter.async_acquire("read")
+
+    stats = limiter.diagnostics()["read"]
+    assert stats["waits"] == 1
+    assert stats["max_wait"] > 0
+
+
+async def test_reads_and_writes_have_separate_budgets() -> None:
+    """Test that exhausting the read bucket does not delay writes."""
+    limiter = _limiter()
+
+    await limiter.async_acquire("read")
+    await limiter.async_acquire("write")
+
+    assert limiter.diagnostics()["write"]["waits"] == 0
+
+
+async def test_priority_requests_are_served_first() -> None:
+    """Test that a priority write overtakes background writes already waiting."""
+    limiter = _limiter(rate=20.0)
+    await limiter.async_acquire("write")
+    served: list[str] = []
+
+    async def _acquire(name: str, *, priority: bool) -> None:
+        await limiter.async_acquire("write", priority=priority)
+        served.append(name)
+
+    background = asyncio.create_task(_acquire("background", priority=False))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(_acquire("interactive", priority=True))
+    await asyncio.gather(background, interactive)
+
+    assert served == ["interactive", "background"]
+
+
+async def test_cancelled_waiter_does_not_take_a_token() -> None:
+    """Test that a request cancelled while waiting leaves the token to the next caller."""
+    limiter = _limiter(rate=20.0)
+    await limiter.async_acquire("read")
+
+    cancelled = asyncio.create_task(limiter.async_acquire("read"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await limiter.async_acquire("read")
+
+    assert cancelled.cancelled()
+    assert limiter.diagnostics()["read"]["waiting"] == 0
+
+
+async def test_coordinator_writes_take_write_tokens(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that coordinator calls draw from the shared limiter."""
+    config_entry.add_to_hass(hass)
+    # Freeze the limiter's clock so the buckets cannot refill during the test.
+    with patch("custom_components.flameconnect.api.rate_limit.monotonic", return_value=0.0):
+        limiter = _limiter()
+        coordinator = FlameConnectDataUpdateCoordinator(
+            hass, mock_flameconnect_client, config_entry, rate_limiter=limiter
+        )
+        coordinator.fires = [mock_fire]
+        coordinator.async_set_updated_data({"abc123": mock_fire_overview})
+
+        with patch.object(coordinator, "_async_confirm_writes", new_callable=AsyncMock):
+            await coordinator.async_write_fields("abc123", FlameEffectParam, flame_speed=5)
+
+    # The read before the write and the write each took their bucket's only token.
+    buckets = limiter._buckets  # noqa: SLF001
+    assert buckets["read"]._tokens == 0  # noqa: SLF001
+    assert buckets["write"]._tokens == 0  # noqa: SLF001
+    assert limiter.diagnostics()["write"]["waits"] == 0
+
+
+async def test_rate_limiter_is_shared_and_reported(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that setup hands the integration-wide limiter to the coordinator."""
+    config_entry.add_to_hass(hass)
+    with (
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=mock_flameconnect_client),
+        patch("custom_components.flameconnect.TokenAuth"),
+        patch("custom_components.flameconnect.create_token_provider"),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = config_entry.runtime_data.coordinator
+    assert coordinator.rate_limiter is hass.data["flameconnect"].rate_limiter
+    result = await async_get_config_entry_diagnostics(hass, config_entry)
+    assert set(result["rate_limiter"]) == {"read", "write"}
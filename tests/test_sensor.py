@@ -119,6 +119,29 @@ async def test_timer_end_sensor_setup_with_timer_enabled(
     assert state.state != "unavailable"
 
 
+async def test_timer_end_sensor_reports_coordinator_expiry(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test timer end sensor shows the end time predicted by the coordinator."""
+    new_params = [
+        TimerParam(timer_status=TimerStatus.ENABLED, duration=30) if isinstance(p, TimerParam) else p
+        for p in mock_fire_overview.parameters
+    ]
+    mock_flameconnect_client.get_fire_overview.return_value = FireOverview(
+        fire=mock_fire_overview.fire, parameters=new_params
+    )
+
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    timer_end = config_entry.runtime_data.coordinator.expiries[("abc123", "timer")]
+    state = hass.states.get("sensor.living_room_timer_end")
+    assert state is not None
+    assert state.state == timer_end.isoformat(timespec="seconds")
+
+
 async def test_timer_end_sensor_unavailable_when_disabled(
     hass: HomeAssistant,
     config_entry: MockConfigEntry,
@@ -0,0 +1,318 @@
+"""Tests for FlameConnect service actions."""
+
+from __future__ import annotations
+
+import dataclasses
+from unittest.mock import AsyncMock, patch
+
+from flameconnect import ApiError, Fire, FireOverview, FlameEffectParam, HeatMode, HeatParam, SoundParam
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+
+DOMAIN = "flameconnect"
+
+
+async def _setup_integration(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_client: AsyncMock,
+) -> None:
+    """Set up the integration with mocked client."""
+    config_entry.add_to_hass(hass)
+    with (
+        patch(
+            "custom_components.flameconnect.FlameConnectClient",
+            return_value=mock_client,
+        ),
+        patch("custom_components.flameconnect.TokenAuth"),
+        patch("custom_components.flameconnect.create_token_provider"),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+
+def _device_id(hass: HomeAssistant) -> str:
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "abc123")})
+    assert device is not None
+    return device.id
+
+
+def _changed(overview: FireOverview) -> FireOverview:
+    """Return *overview* with a different flame speed and volume."""
+    parameters = []
+    for param in overview.parameters:
+        if isinstance(param, FlameEffectParam):
+            param = dataclasses.replace(param, flame_speed=5)
+        elif isinstance(param, SoundParam):
+            param = dataclasses.replace(param, volume=10)
+        parameters.append(param)
+    return dataclasses.replace(overview, parameters=parameters)
+
+
+async def test_restore_fire_writes_snapshot_in_one_call(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that restoring a snapshot sends all changed parameters at once."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+    device_id = _device_id(hass)
+
+    await hass.services.async_call(
+        DOMAIN, "snapshot_fire", {"device_id": device_id, "name": "movie night"}, blocking=True
+    )
+
+    # The fireplace is changed elsewhere after the snapshot was taken.
+    mock_flameconnect_client.get_fire_overview.return_value = _changed(mock_fire_overview)
+    mock_flameconnect_client.get_fire_overview.reset_mock()
+
+    await hass.services.async_call(
+        DOMAIN, "restore_fire", {"device_id": device_id, "name": "movie night"}, blocking=True
+    )
+
+    mock_flameconnect_client.write_parameters.assert_awaited_once()
+    written = {type(p): p for p in mock_flameconnect_client.write_parameters.call_args[0][1]}
+    assert set(written) == {FlameEffectParam, SoundParam}
+    assert written[FlameEffectParam].flame_speed == 3
+    assert written[SoundParam].volume == 50
+    # One read to build the write and one confirmation read.
+    assert mock_flameconnect_client.get_fire_overview.await_count == 2
+
+
+async def test_restore_fire_unknown_snapshot(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that restoring a slot that was never saved is rejected."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, "restore_fire", {"device_id": _device_id(hass), "name": "missing"}, blocking=True
+        )
+
+    mock_flameconnect_client.write_parameters.assert_not_called()
+
+
+async def test_snapshot_fire_unknown_device(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that a device outside the integration is rejected."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, "snapshot_fire", {"device_id": "not-a-device", "name": "movie night"}, blocking=True
+        )
+
+
+def _add_second_fire(mock_client: AsyncMock, mock_fire: Fire, mock_fire_overview: FireOverview) -> None:
+    """Make the account report a second fireplace, "def456"."""
+    other_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    overviews = {
+        "abc123": mock_fire_overview,
+        "def456": dataclasses.replace(mock_fire_overview, fire=other_fire),
+    }
+    mock_client.get_fires.return_value = [mock_fire, other_fire]
+    mock_client.get_fire_overview.side_effect = lambda fire_id: overviews[fire_id]
+
+
+async def test_bulk_set_writes_every_fire(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that bulk_set applies power and parameter changes to each fire."""
+    _add_second_fire(mock_flameconnect_client, mock_fire, mock_fire_overview)
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+    mock_flameconnect_client.get_fire_overview.reset_mock()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "bulk_set",
+        {"fire_id": ["abc123", "def456"], "power": False, "heat_mode": "eco"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {"fires": {"abc123": {"success": True}, "def456": {"success": True}}}
+    assert mock_flameconnect_client.turn_off.await_count == 2
+    written = [call.args for call in mock_flameconnect_client.write_parameters.await_args_list]
+    assert sorted(fire_id for fire_id, _ in written) == ["abc123", "def456"]
+    for _, params in written:
+        assert [type(p) for p in params] == [HeatParam]
+        assert params[0].heat_mode == HeatMode.ECO
+    # One read per fire to build its write, then one shared refresh.
+    assert mock_flameconnect_client.get_fire_overview.await_count == 4
+
+
+async def test_bulk_set_reports_per_fire_failures(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that one failing fire does not fail the whole bulk call."""
+    _add_second_fire(mock_flameconnect_client, mock_fire, mock_fire_overview)
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    async def _turn_off(fire_id: str) -> None:
+        if fire_id == "def456":
+            raise ApiError(400, "rejected")
+
+    mock_flameconnect_client.turn_off.side_effect = _turn_off
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "bulk_set",
+        {"fire_id": ["abc123", "def456"], "power": False},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["fires"]["abc123"] == {"success": True}
+    assert response["fires"]["def456"]["success"] is False
+
+
+async def test_bulk_set_rereads_fires_that_failed(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a fire failing with a non-library error is reported and still re-read."""
+    _add_second_fire(mock_flameconnect_client, mock_fire, mock_fire_overview)
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+    mock_flameconnect_client.get_fire_overview.reset_mock()
+
+    async def _turn_off(fire_id: str) -> None:
+        if fire_id == "def456":
+            raise HomeAssistantError("unavailable")
+
+    mock_flameconnect_client.turn_off.side_effect = _turn_off
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "bulk_set",
+        {"fire_id": ["abc123", "def456"], "power": False},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["fires"] == {
+        "abc123": {"success": True},
+        "def456": {"success": False, "error": "unavailable"},
+    }
+    refreshed = [call.args[0] for call in mock_flameconnect_client.get_fire_overview.await_args_list]
+    assert sorted(refreshed) == ["abc123", "def456"]
+
+
+async def test_bulk_set_reports_fire_without_the_parameter(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that a fire not reporting the changed parameter fails on its own."""
+    _add_second_fire(mock_flameconnect_client, mock_fire, mock_fire_overview)
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+    other_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    without_heat = dataclasses.replace(
+        mock_fire_overview,
+        fire=other_fire,
+        parameters=[p for p in mock_fire_overview.parameters if not isinstance(p, HeatParam)],
+    )
+    overviews = {"abc123": mock_fire_overview, "def456": without_heat}
+    mock_flameconnect_client.get_fire_overview.side_effect = lambda fire_id: overviews[fire_id]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "bulk_set",
+        {"fire_id": ["abc123", "def456"], "heat_mode": "eco"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["fires"]["abc123"] == {"success": True}
+    assert response["fires"]["def456"]["success"] is False
+    written = [call.args[0] for call in mock_flameconnect_client.write_parameters.await_args_list]
+    assert written == ["abc123"]
+
+
+async def test_bulk_set_reports_unexpected_errors_per_fire(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that an unexpected error on one fire still reports and re-reads the others."""
+    _add_second_fire(mock_flameconnect_client, mock_fire, mock_fire_overview)
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+    mock_flameconnect_client.get_fire_overview.reset_mock()
+
+    async def _turn_off(fire_id: str) -> None:
+        if fire_id == "def456":
+            raise RuntimeError("unexpected")
+
+    mock_flameconnect_client.turn_off.side_effect = _turn_off
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "bulk_set",
+        {"fire_id": ["abc123", "def456"], "power": False},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["fires"] == {
+        "abc123": {"success": True},
+        "def456": {"success": False, "error": "unexpected"},
+    }
+    refreshed = [call.args[0] for call in mock_flameconnect_client.get_fire_overview.await_args_list]
+    assert sorted(refreshed) == ["abc123", "def456"]
+
+
+async def test_bulk_set_requires_changes(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that a bulk call without any changes is rejected."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, "bulk_set", {"fire_id": "abc123"}, blocking=True)
+
+
+async def test_reconcile_fire_returns_result(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that reconcile_fire reports convergence without writing when nothing differs."""
+    await _setup_integration(hass, config_entry, mock_flameconnect_client)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "reconcile_fire",
+        {"device_id": _device_id(hass), "power": True, "heat_mode": "normal", "flame_speed": 3},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {"converged": True, "rounds": 0, "unresolved": {}}
+    mock_flameconnect_client.write_parameters.assert_not_called()
@@ -0,0 +1,48 @@
+"""Tests for the dedicated FlameConnect HTTP session."""
+
+from __future__ import annotations
+
+from custom_components.flameconnect.api import SharedSession, create_session
+from custom_components.flameconnect.const import SESSION_LIMIT_PER_HOST
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+
+
+async def test_session_uses_its_own_tuned_connector() -> None:
+    """Test the dedicated session's connector settings."""
+    session = create_session()
+    try:
+        assert session.connector is not None
+        assert session.connector.limit_per_host == SESSION_LIMIT_PER_HOST
+        assert session.connector.use_dns_cache
+    finally:
+        await session.close()
+
+
+async def test_shared_session_closes_after_the_last_entry(hass: HomeAssistant) -> None:
+    """Test that opted-in entries share one session, closed once none use it."""
+    shared = SharedSession(hass)
+
+    session = shared.async_acquire("entry_1")
+    assert shared.async_acquire("entry_2") is session
+
+    await shared.async_release("entry_1")
+    assert not session.closed
+    await shared.async_release("entry_2")
+    assert session.closed
+
+    # A later entry gets a new session.
+    replacement = shared.async_acquire("entry_3")
+    assert replacement is not session
+    await shared.async_release("entry_3")
+
+
+async def test_shared_session_closes_with_home_assistant(hass: HomeAssistant) -> None:
+    """Test that the session is closed when Home Assistant closes."""
+    shared = SharedSession(hass)
+    session = shared.async_acquire("entry_1")
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    assert session.closed
@@ -0,0 +1,81 @@
+"""Benchmark request latency over a busy shared pool and the dedicated session."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import perf_counter
+
+import aiohttp
+from aiohttp import test_utils, web
+import pytest
+
+from custom_components.flameconnect.api import create_session
+
+_LOGGER = logging.getLogger(__name__)
+
+# Stand-in for Home Assistant's shared pool under load: a few connections
+# per host, all busy with slow requests from other integrations.
+SHARED_POOL_LIMIT = 4
+UNRELATED_REQUESTS = 8
+UNRELATED_LATENCY = 0.2
+
+
+async def _slow(request: web.Request) -> web.Response:
+    await asyncio.sleep(UNRELATED_LATENCY)
+    return web.Response(text="unrelated")
+
+
+async def _timed_get(session: aiohttp.ClientSession, url: str) -> float:
+    started = perf_counter()
+    async with session.get(url) as response:
+        await response.read()
+    return perf_counter() - started
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("socket_enabled")
+async def test_dedicated_session_does_not_queue_behind_unrelated_traffic() -> None:
+    """Measure a fireplace read while the shared pool is saturated.
+
+    The stand-in server listens on loopback, the only host the test
+    setup lets sockets connect to.
+    """
+
+    async def _overview(request: web.Request) -> web.Response:
+        return web.json_response({"WifiFireOverview": {}})
+
+    app = web.Application()
+    app.router.add_get("/slow", _slow)
+    app.router.add_get("/overview", _overview)
+    server = test_utils.TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    shared = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=SHARED_POOL_LIMIT))
+    dedicated = create_session()
+    try:
+        slow_url = str(server.make_url("/slow"))
+        overview_url = str(server.make_url("/overview"))
+
+        async def _latency_under_load(session: aiohttp.ClientSession) -> float:
+            unrelated = [asyncio.create_task(_timed_get(shared, slow_url)) for _ in range(UNRELATED_REQUESTS)]
+            await asyncio.sleep(UNRELATED_LATENCY / 10)
+            latency = await _timed_get(session, overview_url)
+            await asyncio.gather(*unrelated)
+            return latency
+
+        shared_latency = await _latency_under_load(shared)
+        dedicated_latency = await _latency_under_load(dedicated)
+    finally:
+        await shared.close()
+        await dedicated.close()
+        await server.close()
+
+    _LOGGER.info(
+        "Overview read with %d unrelated requests in flight: shared pool %.1fms, dedicated session %.1fms",
+        UNRELATED_REQUESTS,
+        shared_latency * 1000,
+        dedicated_latency * 1000,
+    )
+    # The shared pool makes the read wait for an unrelated request to finish.
+    assert shared_latency >= UNRELATED_LATENCY / 2
+    assert dedicated_latency < shared_latency
@@ -0,0 +1,93 @@
+"""Benchmark time until entities are registered during integration setup."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from time import perf_counter
+from unittest.mock import patch
+
+from flameconnect import Fire, FireOverview
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+_LOGGER = logging.getLogger(__name__)
+
+FIRE_COUNT = 3
+DISCOVERY_LATENCY = 0.01
+OVERVIEW_LATENCY = 0.05
+
+
+class _FakeClient:
+    """Client whose reads take a configurable latency."""
+
+    def __init__(
+        self,
+        overviews: dict[str, FireOverview],
+        *,
+        discovery_latency: float = DISCOVERY_LATENCY,
+        overview_latency: float = OVERVIEW_LATENCY,
+    ) -> None:
+        self._overviews = overviews
+        self._discovery_latency = discovery_latency
+        self._overview_latency = overview_latency
+        self.overviews_done: float | None = None
+
+    async def get_fires(self) -> list[Fire]:
+        await asyncio.sleep(self._discovery_latency)
+        return [overview.fire for overview in self._overviews.values()]
+
+    async def get_fire_overview(self, fire_id: str) -> FireOverview:
+        await asyncio.sleep(self._overview_latency)
+        self.overviews_done = perf_counter()
+        return self._overviews[fire_id]
+
+
+@pytest.mark.benchmark
+async def test_entities_registered_before_overviews_fetched(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Measure time-to-entities-registered against time-to-data at setup."""
+    config_entry.add_to_hass(hass)
+    overviews = {
+        f"fire{i}": dataclasses.replace(
+            mock_fire_overview,
+            fire=dataclasses.replace(mock_fire_overview.fire, fire_id=f"fire{i}", friendly_name=f"Fire {i}"),
+        )
+        for i in range(FIRE_COUNT)
+    }
+    client = _FakeClient(overviews)
+    registered: list[float] = []
+
+    def _on_registry_updated(event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        if event.data["action"] == "create" and not registered:
+            registered.append(perf_counter())
+
+    unsub = hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _on_registry_updated)
+    started = perf_counter()
+    with (
+        patch("custom_components.flameconnect.FlameConnectClient", return_value=client),
+        patch("custom_components.flameconnect.TokenAuth"),
+        patch("custom_components.flameconnect.create_token_provider"),
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    unsub()
+
+    assert config_entry.state.name == "LOADED"
+    assert registered
+    assert client.overviews_done is not None
+    _LOGGER.info(
+        "Setup with %d fires: entities registered after %.1fms, overviews fetched after %.1fms",
+        FIRE_COUNT,
+        (registered[0] - started) * 1000,
+        (client.overviews_done - started) * 1000,
+    )
+    # Entities appear once discovery returns, not after every overview read.
+    assert registered[0] < client.overviews_done
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 from unittest.mock import AsyncMock
 
-from flameconnect import Fire, FireOverview
+from flameconnect import ApiError, Fire, FireOverview
 import pytest
 
 from custom_components.flameconnect.config_flow_handler.validators.fireplaces import (
     NoWifiFireplacesError,
     validate_fireplaces,
 )
+from custom_components.flameconnect.const import FIREPLACE_PROBE_PARALLEL
 
 
 async def test_validate_fireplaces_success(
@@ -20,10 +22,12 @@ async def test_validate_fireplaces_success(
     mock_fire_overview: FireOverview,
 ) -> None:
     """Test that validation passes when at least one fire has a WiFi overview."""
-    await validate_fireplaces(mock_flameconnect_client)
+    result = await validate_fireplaces(mock_flameconnect_client)
 
     mock_flameconnect_client.get_fires.assert_awaited_once()
     mock_flameconnect_client.get_fire_overview.assert_awaited_once_with("abc123")
+    assert result.fires == [mock_fire]
+    assert result.overviews == {"abc123": mock_fire_overview}
 
 
 async def test_validate_fireplaces_no_fires(
@@ -67,28 +71,110 @@ async def test_validate_fireplaces_mixed_wifi_and_bluetooth(
     mock_fire_overview: FireOverview,
 ) -> None:
     """Test that validation passes when some fires are WiFi and some are Bluetooth."""
-    second_fire = dataclasses.replace(mock_fire, fire_id="bt_only", friendly_name="Bluetooth Fire")
-    mock_flameconnect_client.get_fires.return_value = [mock_fire, second_fire]
-    # First fire raises TypeError (Bluetooth), second returns valid overview
-    mock_flameconnect_client.get_fire_overview.side_effect = [
-        TypeError("'NoneType' object is not subscriptable"),
-        mock_fire_overview,
-    ]
+    bluetooth_fire = dataclasses.replace(mock_fire, fire_id="bt_only", friendly_name="Bluetooth Fire")
+    mock_flameconnect_client.get_fires.return_value = [bluetooth_fire, mock_fire]
+    release_wifi = asyncio.Event()
+
+    async def _get_overview(fire_id: str) -> FireOverview:
+        if fire_id == "bt_only":
+            release_wifi.set()
+            raise TypeError("'NoneType' object is not subscriptable")
+        await release_wifi.wait()
+        return mock_fire_overview
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
 
     # Should not raise — one fire has a valid overview
-    await validate_fireplaces(mock_flameconnect_client)
+    result = await validate_fireplaces(mock_flameconnect_client)
 
+    assert result.overviews == {"abc123": mock_fire_overview}
+    assert result.no_wifi == {"bt_only"}
 
-async def test_validate_fireplaces_first_wifi_short_circuits(
+
+async def test_validate_fireplaces_failed_probe_does_not_hide_wifi_fire(
     mock_flameconnect_client: AsyncMock,
     mock_fire: Fire,
     mock_fire_overview: FireOverview,
 ) -> None:
-    """Test that validation returns as soon as the first valid overview is found."""
-    second_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
-    mock_flameconnect_client.get_fires.return_value = [mock_fire, second_fire]
+    """Test that a fire whose probe fails first does not fail the validation."""
+    broken_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    mock_flameconnect_client.get_fires.return_value = [broken_fire, mock_fire]
+    release_wifi = asyncio.Event()
 
-    await validate_fireplaces(mock_flameconnect_client)
+    async def _get_overview(fire_id: str) -> FireOverview:
+        if fire_id == "def456":
+            release_wifi.set()
+            raise ApiError(500, "server error")
+        await release_wifi.wait()
+        return mock_fire_overview
 
-    # Only the first fire should be checked since it succeeded
-    mock_flameconnect_client.get_fire_overview.assert_awaited_once_with("abc123")
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
+
+    result = await validate_fireplaces(mock_flameconnect_client)
+
+    assert result.overviews == {"abc123": mock_fire_overview}
+    assert result.no_wifi == set()
+
+
+async def test_validate_fireplaces_all_probes_failing_raises_the_error(
+    mock_flameconnect_client: AsyncMock,
+) -> None:
+    """Test that probe errors surface when no fire could be validated."""
+    mock_flameconnect_client.get_fire_overview.side_effect = ApiError(500, "server error")
+
+    with pytest.raises(ApiError):
+        await validate_fireplaces(mock_flameconnect_client)
+
+
+async def test_validate_fireplaces_first_wifi_cancels_other_probes(
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Test that validation returns as soon as one probe finds a WiFi overview."""
+    slow_fire = dataclasses.replace(mock_fire, fire_id="def456", friendly_name="Bedroom")
+    mock_flameconnect_client.get_fires.return_value = [slow_fire, mock_fire]
+    cancelled = asyncio.Event()
+
+    async def _get_overview(fire_id: str) -> FireOverview:
+        if fire_id == "def456":
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return mock_fire_overview
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
+
+    result = await validate_fireplaces(mock_flameconnect_client)
+
+    assert result.overviews == {"abc123": mock_fire_overview}
+    assert cancelled.is_set()
+
+
+async def test_validate_fireplaces_limits_concurrent_probes(
+    mock_flameconnect_client: AsyncMock,
+    mock_fire: Fire,
+) -> None:
+    """Test that no more than FIREPLACE_PROBE_PARALLEL fires are probed at once."""
+    mock_flameconnect_client.get_fires.return_value = [
+        dataclasses.replace(mock_fire, fire_id=f"bt{i}") for i in range(FIREPLACE_PROBE_PARALLEL * 2)
+    ]
+    running = peak = 0
+
+    async def _get_overview(fire_id: str) -> FireOverview:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        raise KeyError("WifiFireOverview")
+
+    mock_flameconnect_client.get_fire_overview.side_effect = _get_overview
+
+    with pytest.raises(NoWifiFireplacesError):
+        await validate_fireplaces(mock_flameconnect_client)
+
+    assert peak == FIREPLACE_PROBE_PARALLEL
+    assert mock_flameconnect_client.get_fire_overview.await_count == FIREPLACE_PROBE_PARALLEL * 2
@@ -0,0 +1,112 @@
+"""Benchmark write latency with and without a concurrent background poll."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from statistics import quantiles
+from time import perf_counter
+from unittest.mock import MagicMock
+
+from flameconnect import FireOverview, FlameEffect, FlameEffectParam, Parameter
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.flameconnect.coordinator import FlameConnectDataUpdateCoordinator
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+CALL_LATENCY = 0.005
+FIRE_COUNT = 5
+WRITES = 20
+
+
+class _FakeClient:
+    """Client whose calls share one connection and take a fixed latency."""
+
+    def __init__(self, overviews: dict[str, FireOverview]) -> None:
+        self._overviews = overviews
+        self._connection = asyncio.Lock()
+
+    async def _call(self) -> None:
+        async with self._connection:
+            await asyncio.sleep(CALL_LATENCY)
+
+    async def get_fire_overview(self, fire_id: str) -> FireOverview:
+        await self._call()
+        return self._overviews[fire_id]
+
+    async def write_parameters(self, fire_id: str, params: list[Parameter]) -> None:
+        await self._call()
+        overview = self._overviews[fire_id]
+        written = {type(p) for p in params}
+        self._overviews[fire_id] = dataclasses.replace(
+            overview,
+            parameters=[p for p in overview.parameters if type(p) not in written] + list(params),
+        )
+
+
+async def _measure_writes(coordinator: FlameConnectDataUpdateCoordinator) -> list[float]:
+    latencies = []
+    for index in range(WRITES):
+        effect = FlameEffect.OFF if index % 2 == 0 else FlameEffect.ON
+        started = perf_counter()
+        await coordinator.async_write_fields("fire0", FlameEffectParam, flame_effect=effect)
+        latencies.append(perf_counter() - started)
+    return latencies
+
+
+def _percentiles(latencies: list[float]) -> tuple[float, float]:
+    cuts = quantiles(latencies, n=100)
+    return cuts[49], cuts[94]
+
+
+@pytest.mark.benchmark
+async def test_write_latency_with_concurrent_poll(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_fire_overview: FireOverview,
+) -> None:
+    """Measure p50/p95 write latency while a multi-fire poll runs continuously."""
+    config_entry.add_to_hass(hass)
+    fires = [dataclasses.replace(mock_fire_overview.fire, fire_id=f"fire{i}") for i in range(FIRE_COUNT)]
+    overviews = {fire.fire_id: dataclasses.replace(mock_fire_overview, fire=fire) for fire in fires}
+
+    coordinator = FlameConnectDataUpdateCoordinator(hass, MagicMock(), config_entry)
+    coordinator.client = _FakeClient(overviews)
+    coordinator.fires = fires
+    coordinator.async_set_updated_data(dict(overviews))
+
+    idle = _percentiles(await _measure_writes(coordinator))
+
+    stop = asyncio.Event()
+    polls: list[dict[str, FireOverview]] = []
+
+    async def _poll_forever() -> None:
+        while not stop.is_set():
+            polls.append(await coordinator._async_update_data())  # noqa: SLF001
+            # A poll cut short by a write returns without suspending; let
+            # the write run before the next one.
+            await asyncio.sleep(0)
+
+    poller = hass.async_create_task(_poll_forever())
+    await asyncio.sleep(CALL_LATENCY * 2)
+    busy = _percentiles(await _measure_writes(coordinator))
+    stop.set()
+    await poller
+    await hass.async_block_till_done()
+
+    _LOGGER.info(
+        "Write latency idle p50=%.1fms p95=%.1fms; with poll p50=%.1fms p95=%.1fms",
+        idle[0] * 1000,
+        idle[1] * 1000,
+        busy[0] * 1000,
+        busy[1] * 1000,
+    )
+    assert polls
+    assert all(set(poll) == set(overviews) for poll in polls)
+    # A write waits behind at most the poll read already on the wire, never
+    # behind the rest of the poll cycle.
+    assert busy[1] < idle[1] + FIRE_COUNT * CALL_LATENCY